@@ -0,0 +1,269 @@
+"""
+ATTRIBUTE-ACCESS DICTIONARIES
+=============================
+
+A low-overhead replacement for the MyCustomDict class from the
+Access_Dictionary_DotNotation notebook, which routes every attribute read
+through a try/except and every assignment through __setattr__, and for
+SimpleNamespace(**person), which copies the whole dictionary.
+
+AttrDict wraps an existing dictionary instead of copying it:
+
+- the wrapped dict is the wrapper's __dict__, so keys are read, written and
+  deleted as attributes by Python's own attribute lookup, at C speed and
+  with no __getattr__ fallback or exception handling
+- construction does not copy and __slots__ holds nothing else; the dict
+  (or dict subclass) is shared, so writes through the AttrDict are visible
+  in the original and vice versa. Other mappings, iterables of pairs and
+  keyword arguments are copied into a new dict first
+- get(), keys(), items(), values(), pop(), popitem() and clear() are the
+  wrapped dict's own methods and return values as stored
+- nested dictionaries are wrapped lazily, only when they are read as an
+  attribute or with square brackets
+
+A key read as an attribute is wrapped only if its name has been seen
+holding a dictionary: in a dictionary passed to AttrDict, one reached
+through it, or one stored with square brackets or update(). Those names
+get a small descriptor on the class that does the wrapping; every other
+key is read straight from the dict. A dictionary assigned as an attribute
+under a name not seen before is returned as a plain dict.
+
+Method and dunder names always win over keys; keys that are not valid
+identifiers, or that share a name with a method such as "items" or "get",
+are still available with square brackets.
+
+Run this file directly for a demonstration, or with --benchmark to compare
+it with MyCustomDict, SimpleNamespace and namedtuple.
+"""
+
+import sys
+from collections import namedtuple
+from collections.abc import MutableMapping
+from functools import partial
+from operator import attrgetter
+from types import MethodType, SimpleNamespace
+
+from bench_utils import best_time, format_seconds, print_table
+
+_MISSING = object()
+
+# Key names already checked for nested dictionaries.
+_SEEN_NAMES = set()
+_all_seen = _SEEN_NAMES.issuperset
+
+
+def _dict_method(name):
+    """The wrapped dict's own method, as a data descriptor so keys cannot hide it."""
+    return property(attrgetter(f"__dict__.{name}"), doc=getattr(dict, name).__doc__)
+
+
+def _method(func):
+    """A method exposed as a data descriptor so keys cannot hide it."""
+    return property(partial(MethodType, func), doc=func.__doc__)
+
+
+class AttrDict(MutableMapping):
+    """Dictionary wrapper with dot-notation access and lazy nested wrapping."""
+
+    __slots__ = ("__dict__",)
+
+    def __init__(self, data=None, **kwargs):
+        if kwargs or not isinstance(data, dict):
+            data = dict(() if data is None else data, **kwargs)
+        self.__dict__ = data
+        if not _all_seen(data):
+            _learn_names(data)
+
+    def __getitem__(self, key):
+        value = _get_data(self)[key]
+        if type(value) is dict:
+            return _wrap(value, type(self))
+        return value
+
+    def __setitem__(self, key, value):
+        _get_data(self)[key] = value
+        if type(value) is dict:
+            _register_nested(key)
+
+    def __delitem__(self, key):
+        del _get_data(self)[key]
+
+    def __contains__(self, key):
+        return key in _get_data(self)
+
+    def __iter__(self):
+        return iter(_get_data(self))
+
+    def __len__(self):
+        return len(_get_data(self))
+
+    def __eq__(self, other):
+        if isinstance(other, AttrDict):
+            other = _get_data(other)
+        return _get_data(self) == other
+
+    __hash__ = None
+
+    def __dir__(self):
+        keys = (key for key in _get_data(self) if isinstance(key, str) and key.isidentifier())
+        return sorted({*dir(type(self)), *keys})
+
+    def __reduce__(self):
+        return (type(self), (_get_data(self),))
+
+    def copy(self):
+        """Return an AttrDict wrapping a shallow copy of the dictionary."""
+        return _wrap(_get_data(self).copy(), type(self))
+
+    __copy__ = copy
+
+    def to_dict(self):
+        """Return the wrapped dictionary itself (not a copy)."""
+        return _get_data(self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({_get_data(self)!r})"
+
+    get = _dict_method("get")
+    keys = _dict_method("keys")
+    items = _dict_method("items")
+    values = _dict_method("values")
+    pop = _dict_method("pop")
+    popitem = _dict_method("popitem")
+    clear = _dict_method("clear")
+    update = _method(MutableMapping.update)
+    setdefault = _method(MutableMapping.setdefault)
+    copy = _method(copy)
+    to_dict = _method(to_dict)
+
+
+_get_data = AttrDict.__dict__["__dict__"].__get__
+_set_data = AttrDict.__dict__["__dict__"].__set__
+
+
+class _NestedKey:
+    """Class attribute for a key name that has held a dictionary: wraps it on read."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = _get_data(instance).get(self.name, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(f"'{type(instance).__name__}' object has no attribute '{self.name}'")
+        if type(value) is dict:
+            return _wrap(value, type(instance))
+        return value
+
+    def __set__(self, instance, value):
+        _get_data(instance)[self.name] = value
+
+    def __delete__(self, instance):
+        try:
+            del _get_data(instance)[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+
+def _register_nested(name):
+    """Make attribute reads of name wrap dictionaries, unless a method owns the name."""
+    if isinstance(name, str) and not hasattr(AttrDict, name):
+        setattr(AttrDict, name, _NestedKey(name))
+
+
+def _learn_names(data):
+    """Register the keys of data that hold dictionaries and remember the rest."""
+    for name, value in data.items():
+        if type(value) is dict:
+            _register_nested(name)
+        elif value is None:
+            # An optional field may hold a dictionary in the next record.
+            continue
+        _SEEN_NAMES.add(name)
+
+
+def _wrap(data, cls):
+    """Wrap a nested dict in cls without going through __init__."""
+    wrapper = object.__new__(cls)
+    _set_data(wrapper, data)
+    if not _all_seen(data):
+        _learn_names(data)
+    return wrapper
+
+
+# =============================================================================
+# DEMONSTRATION AND BENCHMARKS
+# =============================================================================
+
+class MyCustomDict(dict):
+    """The notebook's dot-notation dict (reference implementation)."""
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{key}'")
+
+    def __setattr__(self, key, value):
+        self[key] = value
+
+
+def benchmark(repeat=5, number=200000):
+    """Compare read, write and construction cost of dot-access approaches."""
+    person = {"name": "Shannon", "age": 33, "city": "Boston", "email": "s@example.com",
+              "address": {"street": "1 Main St", "zip": "02101"}}
+    Person = namedtuple("Person", person)
+
+    attr = AttrDict(person.copy())
+    custom = MyCustomDict(person)
+    namespace = SimpleNamespace(**person)
+    record = Person(**person)
+
+    def cost(func):
+        return format_seconds(best_time(func, repeat=repeat, number=number))
+
+    rows = [
+        ["plain dict", cost(lambda: person["name"]), cost(lambda: person.__setitem__("age", 34)),
+         cost(lambda: person.get("name")), cost(lambda: dict(person))],
+        ["AttrDict", cost(lambda: attr.name), cost(lambda: setattr(attr, "age", 34)),
+         cost(lambda: attr.get("name")), cost(lambda: AttrDict(person))],
+        ["MyCustomDict", cost(lambda: custom.name), cost(lambda: setattr(custom, "age", 34)),
+         cost(lambda: custom.get("name")), cost(lambda: MyCustomDict(person))],
+        ["SimpleNamespace", cost(lambda: namespace.name), cost(lambda: setattr(namespace, "age", 34)),
+         "n/a", cost(lambda: SimpleNamespace(**person))],
+        ["namedtuple", cost(lambda: record.name), cost(lambda: record._replace(age=34)),
+         "n/a", cost(lambda: Person(**person))],
+    ]
+    print(f"Dot-notation access (best of {repeat} x {number:,} calls)")
+    print_table(["approach", "read", "write", "get() call", "construct"], rows)
+
+    nested = [
+        ["AttrDict", cost(lambda: attr.address.zip)],
+        ["MyCustomDict (no nesting)", cost(lambda: custom.address["zip"])],
+    ]
+    print("\nNested read of address.zip")
+    print_table(["approach", "read"], nested)
+
+
+def demo():
+    """Show AttrDict on the notebook's examples."""
+    person = {"name": "Shannon", "age": 33, "address": {"city": "Boston"}}
+    person_obj = AttrDict(person)
+    print("Name:", person_obj.name)
+    print("City:", person_obj.address.city)
+
+    person_obj.age = 34
+    person_obj.address.city = "Denver"
+    print("Original dict after writes:", person)
+    print("Missing attribute default:", getattr(person_obj, "email", "not set"))
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        demo()
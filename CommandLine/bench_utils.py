@@ -0,0 +1,54 @@
+"""
+BENCHMARK UTILITIES
+===================
+
+Small timing and reporting helpers shared by the dictionary guide's
+performance modules.
+"""
+
+import time
+import timeit
+
+
+def best_time(func, repeat=5, number=1):
+    """Return the best per-call time in seconds for func over several runs."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def time_once(func):
+    """Call func once and return (result, elapsed_seconds)."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def format_seconds(seconds):
+    """Format a duration using the most readable unit."""
+    if seconds is None:
+        return "n/a"
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.1f} ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.2f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
+
+
+def format_bytes(size):
+    """Format a byte count using binary units."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(size) < 1024 or unit == "GiB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+
+
+def print_table(headers, rows):
+    """Print rows as a left-aligned plain-text table."""
+    table = [[str(cell) for cell in headers]] + [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(row[i]) for row in table) for i in range(len(headers))]
+    for index, row in enumerate(table):
+        print("  " + "  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+        if index == 0:
+            print("  " + "  ".join("-" * width for width in widths))
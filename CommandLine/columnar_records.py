@@ -0,0 +1,421 @@
+"""
+COLUMNAR RECORD STORE
+=====================
+
+A column-oriented replacement for the guide's Data Processing Pipeline,
+which keeps one small dictionary per student:
+
+    students[name] = {"age": 20, "major": "...", "gpa": 3.85, "honors": True}
+
+ColumnarStore keeps each field in a single typed array.array column and
+maps names to row numbers with one dictionary, so a million records cost a
+few bytes per field instead of a dictionary (and boxed values) per record.
+
+- store[name] returns a dict-like RowView, so code written against the
+  dict-of-dicts keeps working.
+- mean(), count_where() and group_by() aggregate whole columns at once,
+  using NumPy on the same buffers (zero-copy) when it is installed.
+
+Column types use array module type codes ("i", "q", "d", ...) plus "bool"
+for flags (stored as bytes) and "category" for repeated strings such as
+majors, which are stored as small integer codes into a list of distinct
+values.
+
+Run this file directly for a demonstration, or with --benchmark to compare
+memory and aggregation speed against the dict-of-dicts pipeline.
+"""
+
+import operator
+import sys
+import tracemalloc
+from array import array
+from collections.abc import Mapping, MutableMapping
+
+from bench_utils import best_time, format_bytes, format_seconds, print_table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CATEGORY = "category"
+BOOL = "bool"
+
+STUDENT_SCHEMA = {"age": "i", "major": CATEGORY, "gpa": "d", "honors": BOOL}
+
+_COMPARISONS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    ">": operator.gt,
+}
+
+
+class RowView(MutableMapping):
+    """Dict-like view of one row of a ColumnarStore."""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, field):
+        return self._store._read(field, self._row)
+
+    def __setitem__(self, field, value):
+        self._store._write(field, self._row, value)
+
+    def __delitem__(self, field):
+        raise TypeError("fields cannot be deleted from a columnar row")
+
+    def __iter__(self):
+        return iter(self._store.schema)
+
+    def __len__(self):
+        return len(self._store.schema)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class ColumnarStore(Mapping):
+    """Records stored as typed columns, keyed by name.
+
+    schema maps each field name to an array type code, "bool" or "category".
+    """
+
+    def __init__(self, schema=STUDENT_SCHEMA):
+        self.schema = dict(schema)
+        self._index = {}
+        self._columns = {}
+        self._categories = {}
+        for field, typecode in self.schema.items():
+            if typecode == CATEGORY:
+                self._columns[field] = array("I")
+                self._categories[field] = ([], {})
+            elif typecode == BOOL:
+                self._columns[field] = array("b")
+            else:
+                self._columns[field] = array(typecode)
+
+    # -------------------------------------------------------------------------
+    # Mapping interface
+    # -------------------------------------------------------------------------
+
+    def __getitem__(self, name):
+        return RowView(self, self._index[name])
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __setitem__(self, name, record):
+        if name not in self._index:
+            self.append(name, record)
+            return
+        row = self._index[name]
+        values = [record[field] for field in self.schema]
+        old = [self._columns[field][row] for field in self.schema]
+        category_sizes = self._category_sizes()
+        written = 0
+        try:
+            for field, value in zip(self.schema, values):
+                self._write(field, row, value)
+                written += 1
+        except BaseException:
+            for field, value in zip(list(self.schema)[:written], old):
+                self._columns[field][row] = value
+            self._drop_new_categories(category_sizes)
+            raise
+
+    def append(self, name, record):
+        """Add a new record given as a mapping of field values.
+
+        Either every column grows by one value or, if a value is missing or
+        has the wrong type, none does.
+        """
+        if name in self._index:
+            raise KeyError(f"duplicate record name: {name!r}")
+        values = [record[field] for field in self.schema]
+        category_sizes = self._category_sizes()
+        appended = []
+        try:
+            for (field, typecode), value in zip(self.schema.items(), values):
+                if typecode == CATEGORY:
+                    value = self._encode(field, value)
+                self._columns[field].append(value)
+                appended.append(field)
+        except BaseException:
+            for field in appended:
+                self._columns[field].pop()
+            self._drop_new_categories(category_sizes)
+            raise
+        self._index[name] = len(self._index)
+
+    def extend(self, records):
+        """Add (name, record) pairs in bulk."""
+        for name, record in records:
+            self.append(name, record)
+
+    def _category_sizes(self):
+        return {field: len(values) for field, (values, _codes) in self._categories.items()}
+
+    def _drop_new_categories(self, sizes):
+        """Forget categories added since sizes was taken (by a failed write)."""
+        for field, size in sizes.items():
+            values, codes = self._categories[field]
+            for value in values[size:]:
+                del codes[value]
+            del values[size:]
+
+    def _encode(self, field, value):
+        values, codes = self._categories[field]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def _read(self, field, row):
+        value = self._columns[field][row]
+        typecode = self.schema[field]
+        if typecode == CATEGORY:
+            return self._categories[field][0][value]
+        if typecode == BOOL:
+            return bool(value)
+        return value
+
+    def _write(self, field, row, value):
+        if self.schema[field] == CATEGORY:
+            value = self._encode(field, value)
+        self._columns[field][row] = value
+
+    # -------------------------------------------------------------------------
+    # Column access and aggregates
+    # -------------------------------------------------------------------------
+
+    def column(self, field):
+        """Return the raw column for field (category codes for category fields)."""
+        return self._columns[field]
+
+    def categories(self, field):
+        """Return the distinct values of a category field, in code order."""
+        return list(self._categories[field][0])
+
+    def _as_numpy(self, field):
+        column = self._columns[field]
+        if not column:
+            return np.empty(0, dtype=column.typecode)
+        return np.frombuffer(column, dtype=column.typecode)
+
+    def _mask(self, field, op, value):
+        """Return a row mask (NumPy) or a list of booleans for a condition."""
+        if self.schema[field] == CATEGORY and op is not None:
+            value = self._categories[field][1][value]
+        if np is not None:
+            data = self._as_numpy(field)
+            return data != 0 if op is None else _COMPARISONS[op](data, value)
+        data = self._columns[field]
+        if op is None:
+            return list(map(bool, data))
+        compare = _COMPARISONS[op]
+        return [compare(item, value) for item in data]
+
+    def count_where(self, field, op=None, value=None):
+        """Count rows where field is truthy, or where `field op value` holds."""
+        if self.schema[field] == CATEGORY and op not in (None, "==", "!="):
+            raise ValueError("category fields only support == and != comparisons")
+        if self.schema[field] == CATEGORY and op is None:
+            # Codes are positions, so code 0 is a value like any other.
+            return sum(count for label, count in self.group_by(field).items() if label)
+        if self.schema[field] == CATEGORY and value not in self._categories[field][1]:
+            return 0 if op == "==" else len(self)
+        if np is not None:
+            return int(np.count_nonzero(self._mask(field, op, value)))
+        if op is None:
+            return len(self) - self._columns[field].count(0)
+        if op == "==" and self.schema[field] != CATEGORY:
+            return self._columns[field].count(value)
+        return sum(self._mask(field, op, value))
+
+    def sum(self, field):
+        """Sum a numeric column."""
+        if np is not None:
+            return self._as_numpy(field).sum().item()
+        return sum(self._columns[field])
+
+    def mean(self, field):
+        """Average of a numeric column (None when the store is empty)."""
+        if not self._index:
+            return None
+        if np is not None:
+            return float(self._as_numpy(field).mean())
+        return sum(self._columns[field]) / len(self._index)
+
+    def group_by(self, key_field, value_field=None, aggregate="count"):
+        """Group rows by a category field and aggregate another column.
+
+        aggregate is "count", "sum" or "mean". Returns {category: result}.
+        """
+        if self.schema[key_field] != CATEGORY:
+            raise ValueError(f"group_by needs a category field, got {key_field!r}")
+        if aggregate not in ("count", "sum", "mean"):
+            raise ValueError(f"unknown aggregate: {aggregate!r}")
+        labels = self._categories[key_field][0]
+        codes = self._columns[key_field]
+
+        if np is not None:
+            code_array = self._as_numpy(key_field)
+            counts = np.bincount(code_array, minlength=len(labels))
+            if aggregate == "count":
+                results = counts
+            else:
+                values = self._as_numpy(value_field)
+                if values.dtype.kind == "f":
+                    sums = np.bincount(code_array, weights=values, minlength=len(labels))
+                else:
+                    # bincount weights are float64; keep integer sums exact, as
+                    # the pure-Python path does.
+                    sums = np.zeros(len(labels), dtype=np.int64)
+                    np.add.at(sums, code_array, values)
+                results = sums if aggregate == "sum" else sums / np.maximum(counts, 1)
+            return {
+                label: result.item()
+                for label, result, count in zip(labels, results, counts)
+                if count
+            }
+
+        counts = [0] * len(labels)
+        sums = [0] * len(labels)
+        if aggregate == "count":
+            for code in codes:
+                counts[code] += 1
+        else:
+            for code, value in zip(codes, self._columns[value_field]):
+                counts[code] += 1
+                sums[code] += value
+        results = {}
+        for code, label in enumerate(labels):
+            if not counts[code]:
+                continue
+            if aggregate == "count":
+                results[label] = counts[code]
+            elif aggregate == "sum":
+                results[label] = sums[code]
+            else:
+                results[label] = sums[code] / counts[code]
+        return results
+
+    def to_dict(self):
+        """Return the records as the guide's dict of dicts."""
+        return {name: dict(RowView(self, row)) for name, row in self._index.items()}
+
+
+def parse_student_records(raw_records, store=None):
+    """Parse "name,age,major,gpa" lines into a columnar store."""
+    store = ColumnarStore(STUDENT_SCHEMA) if store is None else store
+    for record in raw_records:
+        name, age, major, gpa = record.split(",")
+        gpa = float(gpa)
+        store.append(name, {"age": int(age), "major": major, "gpa": gpa, "honors": gpa >= 3.8})
+    return store
+
+
+# =============================================================================
+# DEMONSTRATION AND BENCHMARKS
+# =============================================================================
+
+MAJORS = ["Computer Science", "Mathematics", "Physics", "Biology", "History", "Economics"]
+
+
+def make_raw_records(count):
+    """Generate CSV lines shaped like the guide's raw_records."""
+    return [
+        f"student_{i},{18 + i % 10},{MAJORS[i % len(MAJORS)]},{2.0 + (i * 37 % 200) / 100:.2f}"
+        for i in range(count)
+    ]
+
+
+def parse_to_dicts(raw_records):
+    """The guide's dict-of-dicts pipeline (reference implementation)."""
+    students = {}
+    for record in raw_records:
+        name, age, major, gpa = record.split(",")
+        students[name] = {
+            "age": int(age),
+            "major": major,
+            "gpa": float(gpa),
+            "honors": float(gpa) >= 3.8,
+        }
+    return students
+
+
+def _measure(build):
+    tracemalloc.start()
+    try:
+        result = build()
+        current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+def benchmark(count=200000, repeat=3):
+    """Compare memory and aggregation speed with the dict-of-dicts pipeline."""
+    raw_records = make_raw_records(count)
+    students, dict_bytes = _measure(lambda: parse_to_dicts(raw_records))
+    store, store_bytes = _measure(lambda: parse_student_records(raw_records))
+
+    def dict_aggregates():
+        avg = sum(student["gpa"] for student in students.values()) / len(students)
+        honors = sum(1 for student in students.values() if student["honors"])
+        by_major = {}
+        for student in students.values():
+            by_major.setdefault(student["major"], []).append(student["gpa"])
+        return avg, honors, {major: sum(gpas) / len(gpas) for major, gpas in by_major.items()}
+
+    def store_aggregates():
+        return store.mean("gpa"), store.count_where("honors"), store.group_by("major", "gpa", "mean")
+
+    backend = "NumPy" if np is not None else "array (NumPy not installed)"
+    print(f"{count:,} student records, columnar backend: {backend}")
+    print_table(["layout", "memory", "per record", "mean + count + group_by"], [
+        ["dict of dicts", format_bytes(dict_bytes), f"{dict_bytes / count:.0f} B",
+         format_seconds(best_time(dict_aggregates, repeat))],
+        ["ColumnarStore", format_bytes(store_bytes), f"{store_bytes / count:.0f} B",
+         format_seconds(best_time(store_aggregates, repeat))],
+    ])
+
+
+def demo():
+    """Run the guide's Data Processing Pipeline on a columnar store."""
+    store = parse_student_records([
+        "Alice,20,Computer Science,3.85",
+        "Bob,22,Mathematics,3.70",
+        "Charlie,19,Physics,3.92",
+    ])
+    print("Processed student records:")
+    for name, info in store.items():
+        honors_status = "Yes" if info["honors"] else "No"
+        print(f"  {name}: {info['major']}, GPA: {info['gpa']}, Honors: {honors_status}")
+
+    print("\nStatistics:")
+    print(f"  Average GPA: {store.mean('gpa'):.2f}")
+    print(f"  Honors students: {store.count_where('honors')}/{len(store)}")
+    print(f"  GPA >= 3.75: {store.count_where('gpa', '>=', 3.75)}")
+    print(f"  Students per major: {store.group_by('major')}")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        demo()
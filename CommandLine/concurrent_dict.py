@@ -0,0 +1,325 @@
+"""
+THREAD-SAFE CONCURRENT DICTIONARY
+=================================
+
+The guide's Inventory Management System mutates its nested dictionaries
+with no synchronization. A dict survives concurrent single operations, but
+read-modify-write sequences such as
+
+    details["stock"] = max(details["stock"] - quantity, 0)
+
+can lose updates when threads interleave, and iterating while another
+thread inserts raises "dictionary changed size during iteration".
+
+ConcurrentDict splits its keys over `stripes` plain dicts, each guarded by
+its own lock (lock striping), so writers to different stripes do not wait
+for each other:
+
+- reads of a single key take no lock
+- writes, and the atomic increment(), compute(), compute_if_absent(),
+  setdefault() and pop(), lock only the key's stripe
+- snapshot() locks every stripe (always in the same order) and copies them
+  into one plain dict, a consistent point-in-time view; iteration, keys(),
+  values() and items() all go through a snapshot, so they never see a
+  dictionary change size
+
+Functions passed to compute() run while the key's stripe is locked and
+must not use the same ConcurrentDict.
+
+Run this file directly for a demonstration, or with --benchmark to compare
+it with a single global lock (stripes=1) at 1 to 16 threads.
+"""
+
+import sys
+import threading
+import time
+from collections.abc import MutableMapping
+
+from bench_utils import format_seconds, print_table
+
+DEFAULT_STRIPES = 16
+
+_MISSING = object()
+
+
+class ConcurrentDict(MutableMapping):
+    """A mapping split over lock-striped dicts, with atomic read-modify-write operations."""
+
+    def __init__(self, data=None, stripes=DEFAULT_STRIPES):
+        if stripes < 1 or stripes & (stripes - 1):
+            raise ValueError(f"stripes must be a power of two, got {stripes!r}")
+        self._mask = stripes - 1
+        self._shards = [{} for _ in range(stripes)]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        if data:
+            # Not shared with other threads yet, so no locking.
+            shards = self._shards
+            mask = self._mask
+            for key, value in (data.items() if hasattr(data, "items") else data):
+                shards[hash(key) & mask][key] = value
+
+    @property
+    def stripes(self):
+        return len(self._shards)
+
+    def _all_locked(self):
+        """Acquire every stripe lock, in index order so two callers cannot deadlock."""
+        for lock in self._locks:
+            lock.acquire()
+
+    def _all_unlocked(self):
+        for lock in reversed(self._locks):
+            lock.release()
+
+    # -------------------------------------------------------------------------
+    # Single-key operations
+    # -------------------------------------------------------------------------
+
+    def __getitem__(self, key):
+        return self._shards[hash(key) & self._mask][key]
+
+    def get(self, key, default=None):
+        return self._shards[hash(key) & self._mask].get(key, default)
+
+    def __contains__(self, key):
+        return key in self._shards[hash(key) & self._mask]
+
+    def __setitem__(self, key, value):
+        index = hash(key) & self._mask
+        with self._locks[index]:
+            self._shards[index][key] = value
+
+    def __delitem__(self, key):
+        index = hash(key) & self._mask
+        with self._locks[index]:
+            del self._shards[index][key]
+
+    def pop(self, key, default=_MISSING):
+        """Remove key and return its value, or default if it is missing."""
+        index = hash(key) & self._mask
+        with self._locks[index]:
+            if default is _MISSING:
+                return self._shards[index].pop(key)
+            return self._shards[index].pop(key, default)
+
+    def setdefault(self, key, default=None):
+        """Return the value for key, atomically inserting default if it is missing."""
+        index = hash(key) & self._mask
+        with self._locks[index]:
+            return self._shards[index].setdefault(key, default)
+
+    def increment(self, key, delta=1, initial=0):
+        """Atomically add delta to the value for key (initial if missing) and return the result."""
+        index = hash(key) & self._mask
+        with self._locks[index]:
+            shard = self._shards[index]
+            value = shard[key] = shard.get(key, initial) + delta
+        return value
+
+    def compute(self, key, func, default=None):
+        """Atomically replace the value for key with func(value) and return it.
+
+        func receives default when key is missing.
+        """
+        index = hash(key) & self._mask
+        with self._locks[index]:
+            shard = self._shards[index]
+            value = shard[key] = func(shard.get(key, default))
+        return value
+
+    def compute_if_absent(self, key, factory):
+        """Return the value for key, storing factory() first if it is missing.
+
+        factory is called at most once per missing key, even when several
+        threads ask for it at the same time.
+        """
+        index = hash(key) & self._mask
+        shard = self._shards[index]
+        value = shard.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._locks[index]:
+            value = shard.get(key, _MISSING)
+            if value is _MISSING:
+                value = shard[key] = factory()
+        return value
+
+    # -------------------------------------------------------------------------
+    # Whole-map operations
+    # -------------------------------------------------------------------------
+
+    def snapshot(self):
+        """Return a plain dict copy of every entry at a single point in time."""
+        self._all_locked()
+        try:
+            result = {}
+            for shard in self._shards:
+                result.update(shard)
+        finally:
+            self._all_unlocked()
+        return result
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def keys(self):
+        return self.snapshot().keys()
+
+    def values(self):
+        return self.snapshot().values()
+
+    def items(self):
+        return self.snapshot().items()
+
+    def __len__(self):
+        # Each len() is atomic; the sum may mix moments under concurrent writes.
+        return sum(len(shard) for shard in self._shards)
+
+    def clear(self):
+        self._all_locked()
+        try:
+            for shard in self._shards:
+                shard.clear()
+        finally:
+            self._all_unlocked()
+
+    def copy(self):
+        return ConcurrentDict(self.snapshot(), self.stripes)
+
+    def __repr__(self):
+        return f"ConcurrentDict({self.snapshot()!r}, stripes={self.stripes})"
+
+
+# =============================================================================
+# DEMONSTRATION AND BENCHMARKS
+# =============================================================================
+
+def get_low_stock_items(stock, threshold=10):
+    """The guide's low-stock query, run on a consistent snapshot of {sku: stock}."""
+    return {sku: level for sku, level in stock.items() if level < threshold}
+
+
+def run_contention(stock, threads, sales_per_thread, skus):
+    """Sell from `threads` writer threads while one reader runs low-stock queries.
+
+    Returns (elapsed, queries); every writer sells one unit of each sku in turn.
+    """
+    start_gate = threading.Barrier(threads + 1)
+    done = threading.Event()
+    queries = [0]
+
+    def sell():
+        start_gate.wait()
+        increment = stock.increment
+        for i in range(sales_per_thread):
+            increment(skus[i % len(skus)], -1)
+
+    def report():
+        start_gate.wait()
+        while not done.is_set():
+            get_low_stock_items(stock)
+            queries[0] += 1
+
+    writers = [threading.Thread(target=sell) for _ in range(threads)]
+    reader = threading.Thread(target=report)
+    for thread in writers + [reader]:
+        thread.start()
+    start = time.perf_counter()
+    for thread in writers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    reader.join()
+    return elapsed, queries[0]
+
+
+def _floor_at_zero(level):
+    return max(level, 0)
+
+
+def lost_updates_without_locks(threads=8, sales_per_thread=100_000):
+    """Count the sales lost by an unsynchronized read-modify-write on a plain dict."""
+    stock = {"electronics/laptop": threads * sales_per_thread}
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often, as a loaded server would
+
+    def sell():
+        for _ in range(sales_per_thread):
+            # Another thread can run between the read and the write.
+            stock["electronics/laptop"] = _floor_at_zero(stock["electronics/laptop"] - 1)
+
+    try:
+        workers = [threading.Thread(target=sell) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    return stock["electronics/laptop"]
+
+
+def benchmark(thread_counts=(1, 2, 4, 8, 16), sales=400_000, sku_count=10_000):
+    """Compare a global lock with lock striping as writer threads are added."""
+    skus = [f"category_{i % 100}/sku_{i}" for i in range(sku_count)]
+    rows = []
+    for threads in thread_counts:
+        per_thread = sales // threads
+        row = [threads]
+        for stripes in (1, DEFAULT_STRIPES):
+            stock = ConcurrentDict(dict.fromkeys(skus, 1_000), stripes)
+            elapsed, queries = run_contention(stock, threads, per_thread, skus)
+            assert sum(stock.values()) == 1_000 * sku_count - per_thread * threads, "lost update"
+            row += [f"{per_thread * threads / elapsed:,.0f}/s", f"{queries:,}"]
+        rows.append(row)
+    print(f"{sales:,} atomic stock decrements over {sku_count:,} skus, "
+          f"plus one thread running get_low_stock_items() on snapshots")
+    print_table(["threads", "global lock", "queries", f"{DEFAULT_STRIPES} stripes", "queries"], rows)
+    start = time.perf_counter()
+    lost = lost_updates_without_locks()
+    print(f"\nPlain dict, unlocked read-modify-write from 8 threads: {lost:,} of 800,000 sales lost "
+          f"({format_seconds(time.perf_counter() - start)})")
+    print("With the GIL only one thread runs Python code at a time, so striping mainly "
+          "shortens lock waits; on a free-threaded build writers also run in parallel.")
+
+
+def demo():
+    """Sell stock from several threads and query it while they run."""
+    from guide_data import make_inventory
+
+    inventory = make_inventory(1_000)
+    stock = ConcurrentDict({
+        f"{category}/{item}": details["stock"]
+        for category, items in inventory.items()
+        for item, details in items.items()
+    })
+    generated = [sku for sku in stock if sku.startswith("category_")]
+    before = sum(stock.values())
+
+    def sell(offset):
+        for i in range(2_000):
+            sku = "electronics/mouse" if i % 2 else "books/python_guide"
+            stock.compute(sku, lambda level: max(level - 1, 0))
+            stock.increment(generated[(i * 7 + offset) % len(generated)], 1)
+
+    workers = [threading.Thread(target=sell, args=(n,)) for n in range(4)]
+    for thread in workers:
+        thread.start()
+    # Safe while the workers insert and update: iteration uses a snapshot.
+    low = get_low_stock_items(stock, threshold=5)
+    for thread in workers:
+        thread.join()
+
+    print(f"{len(stock):,} skus in {stock.stripes} stripes")
+    print(f"Low stock while 4 threads were selling: {len(low)} skus")
+    print("Mouse and Python guide stock after 4,000 sales each, floored at 0:",
+          stock["electronics/mouse"], stock["books/python_guide"])
+    print("No restock lost:", sum(stock.values()) == before - 25 - 15 + 4 * 2_000)
+    print("Reorder list created once:", stock.compute_if_absent("reorder/list", list) is stock["reorder/list"])
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        demo()
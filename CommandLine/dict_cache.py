@@ -0,0 +1,515 @@
+"""
+DICT-BACKED MEMOIZATION CACHES
+==============================
+
+The guide's default config sets "cache": {"type": "redis", "ttl": 3600},
+but nothing in the guide caches in-process. This module provides caches
+built on plain dicts, using insertion order as the eviction order:
+
+- LRUCache: least recently used first; a hit pops the key and re-inserts it
+  at the end.
+- LFUCache: least frequently used first, least recent among equals; keys
+  sit in per-frequency dicts, so hits and evictions are O(1).
+- TTLCache: oldest write first; with a single ttl the oldest write is also
+  the next to expire.
+
+Every cache takes a bound in entries (maxsize), in bytes (maxbytes, as
+measured by sizeof, shallow sys.getsizeof by default) or both, and an
+optional ttl in seconds (required by TTLCache). Expired entries are dropped
+when read and purged on the first write after the earliest deadline. Hits,
+misses, evictions and expirations are counted; info() reports them.
+
+A full cache evicts its oldest entries (by policy) in a batch of about
+1/EVICTION_FRACTION of its entries rather than one at a time. Deleting from
+the front of a dict leaves empty slots that next(iter(d)) scans on every
+call until the dict is next resized; evicting one key per write made
+churn-heavy workloads about 20x slower.
+
+cached(...) is the decorator form, in the spirit of functools.lru_cache:
+
+    @cached(maxsize=1024, policy="lfu")
+    def lookup(sku): ...
+
+Arguments must be hashable unless key= turns them into a hashable key.
+
+Run this file directly for a demonstration, or with --benchmark to compare
+against functools.lru_cache and an OrderedDict LRU under read-heavy and
+churn-heavy workloads.
+"""
+
+import functools
+import random
+import sys
+import time
+from collections import OrderedDict
+from itertools import islice
+
+from bench_utils import format_bytes, format_seconds, print_table
+
+EVICTION_FRACTION = 64
+
+_MISSING = object()
+_KWARGS_MARK = object()
+_FAST_KEY_TYPES = frozenset({int, str})
+
+
+class DictCache:
+    """Base class: bounds, expiry and counters. Subclasses pick the victim."""
+
+    policy = None
+
+    def __init__(self, maxsize=128, maxbytes=None, ttl=None, sizeof=sys.getsizeof, clock=time.monotonic):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must be None or >= 0, got {maxsize!r}")
+        if maxbytes is not None and maxbytes < 0:
+            raise ValueError(f"maxbytes must be None or >= 0, got {maxbytes!r}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be None or > 0, got {ttl!r}")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        self._data = {}
+        self._expires = {} if ttl is not None else None
+        self._next_expiry = float("inf")
+        self._sizes = {} if maxbytes is not None else None
+        self.currbytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    # -------------------------------------------------------------------------
+    # Policy hooks
+    # -------------------------------------------------------------------------
+
+    def _touch(self, key):
+        """Record a hit on key and return its value."""
+        return self._data[key]
+
+    def _insert(self, key, value):
+        self._data[key] = value
+
+    def _remove(self, key):
+        del self._data[key]
+
+    def _victims(self, count):
+        """Return up to count keys to evict, first victim first."""
+        return list(islice(self._data, count))
+
+    # -------------------------------------------------------------------------
+    # Bookkeeping
+    # -------------------------------------------------------------------------
+
+    def _drop(self, key):
+        """Remove key and everything recorded about it."""
+        self._remove(key)
+        if self._sizes is not None:
+            self.currbytes -= self._sizes.pop(key)
+        if self._expires is not None:
+            del self._expires[key]
+
+    def _expired(self, key):
+        return self._expires[key] <= self._clock()
+
+    def _purge_expired(self, now):
+        """Drop every entry whose ttl has passed; writes are ordered by expiry."""
+        expired = []
+        self._next_expiry = float("inf")
+        for key, deadline in self._expires.items():
+            if deadline > now:
+                self._next_expiry = deadline
+                break
+            expired.append(key)
+        for key in expired:
+            self._drop(key)
+        self.expirations += len(expired)
+
+    def _make_room(self, size):
+        """Evict until one more entry of size bytes fits within the bounds."""
+        while ((self.maxsize is not None and len(self._data) >= self.maxsize)
+               or (self._sizes is not None and self.currbytes + size > self.maxbytes)):
+            for key in self._victims(max(1, len(self._data) // EVICTION_FRACTION)):
+                self._drop(key)
+                self.evictions += 1
+
+    # -------------------------------------------------------------------------
+    # Cache interface
+    # -------------------------------------------------------------------------
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default, counting a hit or miss."""
+        if key in self._data:
+            if self._expires is None or not self._expired(key):
+                self.hits += 1
+                return self._touch(key)
+            self._drop(key)
+            self.expirations += 1
+        self.misses += 1
+        return default
+
+    def set(self, key, value):
+        """Cache value under key, evicting entries as needed to stay within the bounds."""
+        if key in self._data:
+            self._drop(key)
+        size = 0
+        if self._sizes is not None:
+            size = self._sizeof(value)
+            if size > self.maxbytes:
+                return  # would evict everything and still not fit
+        if self.maxsize == 0:
+            return
+        if self._expires is not None:
+            now = self._clock()
+            if now >= self._next_expiry:
+                self._purge_expired(now)
+        self._make_room(size)
+        if self._expires is not None:
+            deadline = self._expires[key] = now + self.ttl
+            if deadline < self._next_expiry:
+                self._next_expiry = deadline
+        if self._sizes is not None:
+            self._sizes[key] = size
+            self.currbytes += size
+        self._insert(key, value)
+
+    def pop(self, key, default=_MISSING):
+        """Remove key and return its value (without counting a hit)."""
+        if key in self._data and (self._expires is None or not self._expired(key)):
+            value = self._data[key]
+            self._drop(key)
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        for key in list(self._data):
+            self._drop(key)
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def info(self):
+        """Return the counters and current size as a dict."""
+        return {
+            "policy": self.policy,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self._data),
+            "maxsize": self.maxsize,
+            "bytes": self.currbytes if self._sizes is not None else None,
+            "maxbytes": self.maxbytes,
+        }
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def __contains__(self, key):
+        return key in self._data and (self._expires is None or not self._expired(key))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(entries={len(self._data):,}, maxsize={self.maxsize}, "
+                f"hits={self.hits:,}, misses={self.misses:,}, evictions={self.evictions:,})")
+
+
+class LRUCache(DictCache):
+    """Evicts the least recently used entry; the dict is kept in recency order."""
+
+    policy = "lru"
+
+    def _touch(self, key):
+        data = self._data
+        value = data[key] = data.pop(key)
+        return value
+
+    def get(self, key, default=None):
+        # The hot path, inlined: one pop and one insert per hit.
+        data = self._data
+        try:
+            value = data.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        data[key] = value
+        if self._expires is not None and self._expired(key):
+            self._drop(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+
+class TTLCache(DictCache):
+    """Expires entries ttl seconds after they were written and evicts the oldest write first."""
+
+    policy = "ttl"
+
+    def __init__(self, maxsize=128, maxbytes=None, ttl=3600, sizeof=sys.getsizeof, clock=time.monotonic):
+        if ttl is None:
+            raise ValueError("TTLCache needs a ttl")
+        super().__init__(maxsize, maxbytes, ttl, sizeof, clock)
+
+
+class LFUCache(DictCache):
+    """Evicts the least frequently used entry, the least recently used among equals."""
+
+    policy = "lfu"
+
+    def __init__(self, maxsize=128, maxbytes=None, ttl=None, sizeof=sys.getsizeof, clock=time.monotonic):
+        super().__init__(maxsize, maxbytes, ttl, sizeof, clock)
+        self._counts = {}
+        self._buckets = {}  # {count: {key: None}} in recency order
+        self._min_count = 0
+
+    def _touch(self, key):
+        counts = self._counts
+        buckets = self._buckets
+        count = counts[key]
+        bucket = buckets[count]
+        del bucket[key]
+        if not bucket:
+            del buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        count += 1
+        counts[key] = count
+        try:
+            buckets[count][key] = None
+        except KeyError:
+            buckets[count] = {key: None}
+        return self._data[key]
+
+    def _insert(self, key, value):
+        self._data[key] = value
+        self._counts[key] = 1
+        self._buckets.setdefault(1, {})[key] = None
+        self._min_count = 1
+
+    def _remove(self, key):
+        del self._data[key]
+        count = self._counts.pop(key)
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+    def _victims(self, count):
+        if self._min_count not in self._buckets:
+            # Only after pop() or expiry emptied the lowest bucket.
+            self._min_count = min(self._buckets)
+        return list(islice(self._buckets[self._min_count], count))
+
+
+POLICIES = {
+    "lru": LRUCache,
+    "lfu": LFUCache,
+    "ttl": TTLCache,
+}
+
+
+def make_key(*args, **kwargs):
+    """Build a cache key from call arguments, as functools.lru_cache does."""
+    if kwargs:
+        return args + (_KWARGS_MARK,) + tuple(kwargs.items())
+    if len(args) == 1 and type(args[0]) in _FAST_KEY_TYPES:
+        return args[0]
+    return args
+
+
+def cached(maxsize=128, policy="lru", ttl=None, maxbytes=None, sizeof=sys.getsizeof, key=make_key):
+    """Decorator memoizing a function in a cache of the given policy.
+
+    key(*args, **kwargs) builds the cache key; pass one when arguments are
+    unhashable. The wrapper exposes the cache as .cache, plus cache_info()
+    and cache_clear().
+    """
+    try:
+        cache_class = POLICIES[policy]
+    except KeyError:
+        raise ValueError(f"unknown cache policy {policy!r}; expected one of {', '.join(POLICIES)}") from None
+
+    def decorator(func):
+        cache = cache_class(maxsize=maxsize, maxbytes=maxbytes, ttl=ttl, sizeof=sizeof)
+        get = cache.get
+        store = cache.set
+        default_key = key is make_key
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if default_key and not kwargs and len(args) == 1 and type(args[0]) in _FAST_KEY_TYPES:
+                cache_key = args[0]
+            else:
+                cache_key = key(*args, **kwargs)
+            value = get(cache_key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                store(cache_key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+# =============================================================================
+# DEMONSTRATION AND BENCHMARKS
+# =============================================================================
+
+class OrderedDictLRU:
+    """The textbook LRU on collections.OrderedDict, for comparison."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, key, default=None):
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+def memoize_with(cache, func):
+    """Wrap func in get-or-compute on any cache with get() and set()."""
+    get = cache.get
+    store = cache.set
+
+    def wrapper(key):
+        value = get(key, _MISSING)
+        if value is _MISSING:
+            value = func(key)
+            store(key, value)
+        return value
+
+    wrapper.cache = cache
+    return wrapper
+
+
+def make_workload(kind, requests=300_000, maxsize=10_000, seed=7):
+    """Request keys for a workload.
+
+    read-heavy: 90% of requests go to a hot set half the cache size.
+    churn-heavy: uniform over ten times the cache size, so most requests miss.
+    """
+    rng = random.Random(seed)
+    if kind == "read-heavy":
+        hot = maxsize // 2
+        return [rng.randrange(hot) if rng.random() < 0.9 else rng.randrange(maxsize * 100)
+                for _ in range(requests)]
+    return [rng.randrange(maxsize * 10) for _ in range(requests)]
+
+
+def _run(wrapper, keys):
+    start = time.perf_counter()
+    for key in keys:
+        wrapper(key)
+    return time.perf_counter() - start
+
+
+def benchmark(requests=300_000, maxsize=10_000, repeat=3):
+    """Compare the caches with functools.lru_cache and an OrderedDict LRU."""
+
+    def compute(key):
+        return key * 2
+
+    candidates = [
+        ("functools.lru_cache", lambda: functools.lru_cache(maxsize)(compute)),
+        ("OrderedDict LRU", lambda: memoize_with(OrderedDictLRU(maxsize), compute)),
+        ("LRUCache", lambda: memoize_with(LRUCache(maxsize), compute)),
+        ("LFUCache", lambda: memoize_with(LFUCache(maxsize), compute)),
+        ("TTLCache (ttl=3600)", lambda: memoize_with(TTLCache(maxsize, ttl=3600), compute)),
+        ("LRUCache, maxbytes", lambda: memoize_with(LRUCache(None, maxbytes=maxsize * 28), compute)),
+        ("@cached(maxsize)", lambda: cached(maxsize)(compute)),
+    ]
+    for kind in ("read-heavy", "churn-heavy"):
+        keys = make_workload(kind, requests, maxsize)
+        rows = []
+        baseline = None
+        for label, build in candidates:
+            best = None
+            for _ in range(repeat):
+                wrapper = build()
+                elapsed = _run(wrapper, keys)
+                best = elapsed if best is None else min(best, elapsed)
+            hits = wrapper.cache.hits if hasattr(wrapper, "cache") else wrapper.cache_info().hits
+            baseline = baseline or best
+            rows.append([label, format_seconds(best / len(keys)), f"{hits / len(keys):.1%}",
+                         f"{best / baseline:.2f}x"])
+        print(f"\n{kind}: {len(keys):,} requests, cache of {maxsize:,} entries (best of {repeat})")
+        print_table(["cache", "time per request", "hit rate", "vs lru_cache"], rows)
+
+
+def demo():
+    """Cache the guide's inventory value and show each policy's counters."""
+    from guide_data import make_default_config, make_inventory
+    from indexed_inventory import calculate_inventory_value
+
+    ttl = make_default_config()["cache"]["ttl"]
+    inventory = make_inventory(1_000)
+
+    # The inventory dict is unhashable, so key on the object itself; drop
+    # the cached value with .cache.pop() after changing it.
+    @cached(maxsize=8, ttl=ttl, key=id)
+    def inventory_value(catalog):
+        return calculate_inventory_value(catalog)
+
+    for _ in range(3):
+        value = inventory_value(inventory)
+    print(f"Inventory value ${value:,.2f}, cached for {ttl} s:", inventory_value.cache_info())
+    inventory["electronics"]["laptop"]["stock"] += 1
+    inventory_value.cache.pop(id(inventory))
+    print(f"After a restock: ${inventory_value(inventory):,.2f}")
+
+    print("\nSame requests, three policies (maxsize=3):")
+    requests = ["laptop", "mouse", "laptop", "book", "laptop", "cable", "mouse", "book", "laptop"]
+    for cache in (LRUCache(3), LFUCache(3), TTLCache(3, ttl=60)):
+        for sku in requests:
+            if cache.get(sku) is None:
+                cache.set(sku, sku.upper())
+        print(f"  {cache.policy}: kept {sorted(cache._data)}, {cache.hits} hits, {cache.evictions} evictions")
+
+    now = [0.0]
+    sessions = TTLCache(maxsize=None, ttl=ttl, clock=lambda: now[0])
+    sessions["alice"] = {"role": "admin"}
+    now[0] = ttl + 1
+    print("\nSession after the ttl passed:", sessions.get("alice"), sessions.info()["expirations"], "expired")
+
+    sized = LRUCache(maxsize=None, maxbytes=1024)
+    for i in range(20):
+        sized[i] = "x" * 100
+    print(f"Byte-bounded cache: {len(sized)} entries, {format_bytes(sized.currbytes)} "
+          f"of {format_bytes(sized.maxbytes)}, {sized.evictions} evictions")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        demo()
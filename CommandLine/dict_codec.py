@@ -0,0 +1,586 @@
+"""
+COMPACT BINARY CODEC FOR NESTED DICTIONARIES
+============================================
+
+A binary format for the nested dict/list/scalar trees the guide builds
+(company, default_config, vegan_recipes), smaller than JSON and readable
+one path at a time:
+
+    magic | key count | key end offsets (4 bytes each) | UTF-8 keys | root value
+
+- every distinct dict key is stored once in the key table and referenced
+  by a varint id, so "position", "salary", "price" and "stock" cost one
+  byte each per use instead of their full text
+- integers are zigzag varints; 0..127 fit in the type byte itself
+- floats are 8-byte IEEE doubles; str and bytes are length-prefixed
+- a string value seen before (such as a repeated "Senior Developer" or
+  supplier name) is a back-reference to its first copy
+- dicts and lists start with their body size in bytes (4 bytes), so a
+  reader can step over a whole subtree without decoding it
+
+Dict keys that are not strings are stored inline as values. Tuples encode
+as lists, so tuple dict keys are rejected. Subclasses of str, int, float,
+dict and list (enums, OrderedDict, defaultdict) encode as plain values of
+their base type.
+
+dumps() and loads() convert whole documents. Document(data) decodes
+nothing up front (the key offsets make any key readable on its own);
+document.get("employees/engineering/alice/salary") walks to that one value,
+comparing key bytes and stepping over sibling subtrees by their size, and
+document.root gives lazy Mapping/Sequence views over the buffer, which is
+never copied (pass a memoryview of an mmap to read from a file).
+
+Use it for documents that are read a path at a time. The codec is pure
+Python: dumps() and loads() of a whole document are several times slower
+than the C-implemented json, pickle and marshal (2.5-5x slower than json
+in the benchmark), so when every read needs the whole tree, json is the
+faster choice. Reading one path out of a large document is where this
+codec wins, by orders of magnitude.
+
+Run this file directly for a demonstration, or with --benchmark to compare
+size and speed with json, pickle and marshal.
+"""
+
+import struct
+import sys
+from collections.abc import Mapping, Sequence
+
+from bench_utils import best_time, format_bytes, format_seconds, print_table
+from dict_paths import split_path
+
+MAGIC = b"DCD1"
+
+# Type bytes; 0x80 | n is the small integer n (0..127).
+NONE = 0
+FALSE = 1
+TRUE = 2
+INT = 3
+NEG_INT = 4
+FLOAT = 5
+STR = 6
+BYTES = 7
+LIST = 8
+DICT = 9
+STR_REF = 10
+SMALL_INT = 0x80
+
+# Shorter strings are cheaper to repeat than to reference.
+MIN_SHARED_STR = 4
+
+# Dict entries start with varint (key_id << 1), or INLINE_KEY followed by a
+# value for keys that are not strings.
+INLINE_KEY = 1
+
+_DOUBLE = struct.Struct("<d")
+_SIZE = struct.Struct("<I")
+
+
+def _write_varint(out, number):
+    while number >= 0x80:
+        out.append((number & 0x7F) | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _read_varint(buf, pos):
+    byte = buf[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result = byte & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        byte = buf[pos]
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos + 1
+        shift += 7
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+def _encode(value, out, key_ids, strings):
+    kind = type(value)
+    if kind is str:
+        first = strings.get(value)
+        if first is not None:
+            # Distance back from this type byte to the first copy's.
+            distance = len(out) - first
+            out.append(STR_REF)
+            _write_varint(out, distance)
+            return
+        if len(value) >= MIN_SHARED_STR:
+            strings[value] = len(out)
+        data = value.encode("utf-8")
+        out.append(STR)
+        _write_varint(out, len(data))
+        out += data
+    elif kind is int:
+        if 0 <= value < 0x80:
+            out.append(SMALL_INT | value)
+        elif value >= 0:
+            out.append(INT)
+            _write_varint(out, value)
+        else:
+            out.append(NEG_INT)
+            _write_varint(out, -1 - value)
+    elif kind is dict:
+        out.append(DICT)
+        start = len(out)
+        out += b"\0\0\0\0"
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            if type(key) is str:
+                key_id = key_ids.get(key)
+                if key_id is None:
+                    key_id = key_ids[key] = len(key_ids)
+                _write_varint(out, key_id << 1)
+            elif isinstance(key, tuple):
+                # It would decode as a list, which cannot be a dict key.
+                raise TypeError(f"cannot encode tuple dict key {key!r}")
+            else:
+                out.append(INLINE_KEY)
+                _encode(key, out, key_ids, strings)
+            _encode(item, out, key_ids, strings)
+        _SIZE.pack_into(out, start, len(out) - start - 4)
+    elif kind is float:
+        out.append(FLOAT)
+        out += _DOUBLE.pack(value)
+    elif kind is list or kind is tuple:
+        out.append(LIST)
+        start = len(out)
+        out += b"\0\0\0\0"
+        _write_varint(out, len(value))
+        for item in value:
+            _encode(item, out, key_ids, strings)
+        _SIZE.pack_into(out, start, len(out) - start - 4)
+    elif value is None:
+        out.append(NONE)
+    elif value is True:
+        out.append(TRUE)
+    elif value is False:
+        out.append(FALSE)
+    elif kind is bytes or kind is bytearray:
+        out.append(BYTES)
+        _write_varint(out, len(value))
+        out += value
+    elif isinstance(value, (str, int, float, dict, list, tuple)):
+        # Subclasses (str/int Enums, OrderedDict, defaultdict...) encode as
+        # their base type's value; base(value) would call an overridden
+        # __str__ and turn a (str, Enum) member into "Color.RED".
+        for base, convert in _BASE_VALUES:
+            if isinstance(value, base):
+                return _encode(convert(value), out, key_ids, strings)
+    else:
+        raise TypeError(f"cannot encode {kind.__name__} values")
+
+
+_BASE_VALUES = [
+    (str, str.__str__),
+    (int, int.__index__),
+    (float, float.__float__),
+    (dict, lambda value: dict(dict.items(value))),
+    (list, lambda value: list(list.__iter__(value))),
+    (tuple, lambda value: list(tuple.__iter__(value))),
+]
+
+
+def dumps(value):
+    """Encode a nested dict/list/scalar tree."""
+    key_ids = {}
+    body = bytearray()
+    _encode(value, body, key_ids, {})
+    encoded = [key.encode("utf-8") for key in key_ids]
+    ends = []
+    end = 0
+    for data in encoded:
+        end += len(data)
+        ends.append(end)
+    out = bytearray(MAGIC)
+    _write_varint(out, len(encoded))
+    out += struct.pack(f"<{len(ends)}I", *ends)
+    out += b"".join(encoded)
+    out += body
+    return bytes(out)
+
+
+# =============================================================================
+# DECODING
+# =============================================================================
+
+def _read_header(buf):
+    """Return (key count, key offsets position, key text position, root position)."""
+    if bytes(buf[:len(MAGIC)]) != MAGIC:
+        raise ValueError("not a dict_codec document")
+    count, offsets = _read_varint(buf, len(MAGIC))
+    text = offsets + 4 * count
+    end = _SIZE.unpack_from(buf, text - 4)[0] if count else 0
+    return count, offsets, text, text + end
+
+
+def _read_keys(buf):
+    """Decode the whole key table; return (keys, root position)."""
+    count, offsets, text, root = _read_header(buf)
+    ends = struct.unpack_from(f"<{count}I", buf, offsets)
+    keys = []
+    start = text
+    for end in ends:
+        keys.append(str(buf[start:text + end], "utf-8"))
+        start = text + end
+    return keys, root
+
+
+def _decode(buf, pos, keys, strings=None):
+    """Decode the value at pos; return (value, position after it).
+
+    strings, when given, caches referenced strings by position so repeats
+    decode to one shared str object.
+    """
+    tag = buf[pos]
+    pos += 1
+    if tag >= SMALL_INT:
+        return tag - SMALL_INT, pos
+    if tag == STR:
+        length, pos = _read_varint(buf, pos)
+        return str(buf[pos:pos + length], "utf-8"), pos + length
+    if tag == DICT:
+        count, pos = _read_varint(buf, pos + 4)
+        result = {}
+        for _ in range(count):
+            code = buf[pos]
+            if code < 0x80 and code != INLINE_KEY:
+                key = keys[code >> 1]
+                pos += 1
+            elif code == INLINE_KEY:
+                key, pos = _decode(buf, pos + 1, keys, strings)
+            else:
+                code, pos = _read_varint(buf, pos)
+                key = keys[code >> 1]
+            result[key], pos = _decode(buf, pos, keys, strings)
+        return result, pos
+    if tag == FLOAT:
+        return _DOUBLE.unpack_from(buf, pos)[0], pos + 8
+    if tag == LIST:
+        count, pos = _read_varint(buf, pos + 4)
+        result = []
+        append = result.append
+        for _ in range(count):
+            item, pos = _decode(buf, pos, keys, strings)
+            append(item)
+        return result, pos
+    if tag == STR_REF:
+        distance, end = _read_varint(buf, pos)
+        first = pos - 1 - distance
+        if strings is None:
+            return _decode(buf, first, keys)[0], end
+        value = strings.get(first)
+        if value is None:
+            value = strings[first] = _decode(buf, first, keys)[0]
+        return value, end
+    if tag == INT:
+        return _read_varint(buf, pos)
+    if tag == NEG_INT:
+        magnitude, pos = _read_varint(buf, pos)
+        return -1 - magnitude, pos
+    if tag == NONE:
+        return None, pos
+    if tag == TRUE:
+        return True, pos
+    if tag == FALSE:
+        return False, pos
+    if tag == BYTES:
+        length, pos = _read_varint(buf, pos)
+        return bytes(buf[pos:pos + length]), pos + length
+    raise ValueError(f"unknown type byte {tag:#x} at offset {pos - 1}")
+
+
+def _skip(buf, pos):
+    """Return the position just after the value at pos, without decoding it."""
+    tag = buf[pos]
+    if tag >= SMALL_INT or tag <= TRUE:
+        return pos + 1
+    if tag == DICT or tag == LIST:
+        return pos + 5 + _SIZE.unpack_from(buf, pos + 1)[0]
+    if tag == FLOAT:
+        return pos + 9
+    if tag == STR or tag == BYTES:
+        length, pos = _read_varint(buf, pos + 1)
+        return pos + length
+    return _read_varint(buf, pos + 1)[1]
+
+
+def loads(data):
+    """Decode a whole document."""
+    buf = data if isinstance(data, (bytes, bytearray)) else memoryview(data).cast("B")
+    keys, pos = _read_keys(buf)
+    return _decode(buf, pos, keys, {})[0]
+
+
+class LazyDict(Mapping):
+    """Read-only view of an encoded dict; values are decoded when read."""
+
+    __slots__ = ("_document", "_pos", "_offsets")
+
+    def __init__(self, document, pos):
+        self._document = document
+        self._pos = pos
+        self._offsets = None
+
+    def _index(self):
+        """Map each key to its value's offset, stepping over the values."""
+        if self._offsets is None:
+            document = self._document
+            buf = document.buf
+            key_at = document.key
+            count, pos = _read_varint(buf, self._pos + 5)
+            offsets = {}
+            for _ in range(count):
+                code, pos = _read_varint(buf, pos)
+                if code == INLINE_KEY:
+                    key, pos = _decode(buf, pos, document.key_table)
+                else:
+                    key = key_at(code >> 1)
+                offsets[key] = pos
+                pos = _skip(buf, pos)
+            self._offsets = offsets
+        return self._offsets
+
+    def __getitem__(self, key):
+        return self._document._value_at(self._index()[key])
+
+    def __iter__(self):
+        return iter(self._index())
+
+    def __len__(self):
+        return _read_varint(self._document.buf, self._pos + 5)[0]
+
+    def decode(self):
+        """Decode this subtree into plain dicts and lists."""
+        return _decode(self._document.buf, self._pos, self._document.key_table)[0]
+
+    def __repr__(self):
+        return f"LazyDict({len(self)} keys)"
+
+
+class LazyList(Sequence):
+    """Read-only view of an encoded list; items are decoded when read."""
+
+    __slots__ = ("_document", "_pos", "_offsets")
+
+    def __init__(self, document, pos):
+        self._document = document
+        self._pos = pos
+        self._offsets = None
+
+    def _index(self):
+        if self._offsets is None:
+            buf = self._document.buf
+            count, pos = _read_varint(buf, self._pos + 5)
+            offsets = []
+            for _ in range(count):
+                offsets.append(pos)
+                pos = _skip(buf, pos)
+            self._offsets = offsets
+        return self._offsets
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._document._value_at(pos) for pos in self._index()[index]]
+        return self._document._value_at(self._index()[index])
+
+    def __len__(self):
+        return _read_varint(self._document.buf, self._pos + 5)[0]
+
+    def decode(self):
+        """Decode this subtree into plain lists and dicts."""
+        return _decode(self._document.buf, self._pos, self._document.key_table)[0]
+
+    def __repr__(self):
+        return f"LazyList({len(self)} items)"
+
+
+class _KeyTable:
+    """A Document's keys, indexable by id and decoded one at a time."""
+
+    __slots__ = ("_document",)
+
+    def __init__(self, document):
+        self._document = document
+
+    def __getitem__(self, key_id):
+        return self._document.key(key_id)
+
+
+class Document:
+    """An encoded document read in place; keys and values are decoded on demand."""
+
+    def __init__(self, data):
+        self.buf = data if isinstance(data, (bytes, bytearray)) else memoryview(data).cast("B")
+        self._key_count, self._key_offsets, self._key_text, self._root = _read_header(self.buf)
+        self._keys = {}
+        self.key_table = _KeyTable(self)
+
+    def _key_bytes(self, key_id):
+        """The encoded key with this id, as a slice of the buffer."""
+        start = _SIZE.unpack_from(self.buf, self._key_offsets + 4 * (key_id - 1))[0] if key_id else 0
+        end = _SIZE.unpack_from(self.buf, self._key_offsets + 4 * key_id)[0]
+        return self.buf[self._key_text + start:self._key_text + end]
+
+    def key(self, key_id):
+        """Decode one key of the key table."""
+        key = self._keys.get(key_id)
+        if key is None:
+            key = self._keys[key_id] = str(self._key_bytes(key_id), "utf-8")
+        return key
+
+    @property
+    def keys(self):
+        """Every key in the key table, decoded."""
+        return _read_keys(self.buf)[0]
+
+    def _value_at(self, pos):
+        """Scalars are decoded; dicts and lists come back as lazy views."""
+        tag = self.buf[pos]
+        if tag == DICT:
+            return LazyDict(self, pos)
+        if tag == LIST:
+            return LazyList(self, pos)
+        return _decode(self.buf, pos, self.key_table)[0]
+
+    @property
+    def root(self):
+        return self._value_at(self._root)
+
+    def get(self, path, default=None):
+        """Decode only the value at path ("a/b/0/c", "a.b" or a tuple of keys), or return default.
+
+        Each level is scanned once, stepping over the siblings of the next
+        key by their encoded size.
+        """
+        buf = self.buf
+        pos = self._root
+        for segment in split_path(path):
+            tag = buf[pos]
+            if tag == DICT:
+                wanted = segment.encode("utf-8") if isinstance(segment, str) else None
+                count, pos = _read_varint(buf, pos + 5)
+                for _ in range(count):
+                    code, pos = _read_varint(buf, pos)
+                    if code == INLINE_KEY:
+                        key, pos = _decode(buf, pos, self.key_table)
+                        found = key == segment
+                    else:
+                        found = wanted is not None and self._key_bytes(code >> 1) == wanted
+                    if found:
+                        break
+                    pos = _skip(buf, pos)
+                else:
+                    return default
+            elif tag == LIST:
+                count, pos = _read_varint(buf, pos + 5)
+                try:
+                    index = int(segment)
+                except ValueError:
+                    return default
+                if index < 0:
+                    index += count
+                if not 0 <= index < count:
+                    return default
+                for _ in range(index):
+                    pos = _skip(buf, pos)
+            else:
+                return default
+        return _decode(buf, pos, self.key_table)[0]
+
+
+def get_path(data, path, default=None):
+    """Decode just the value at path in an encoded document."""
+    return Document(data).get(path, default)
+
+
+# =============================================================================
+# DEMONSTRATION AND BENCHMARKS
+# =============================================================================
+
+def benchmark(scale=100_000, repeat=3):
+    """Compare size and speed with json, pickle and marshal."""
+    import json
+    import marshal
+    import pickle
+
+    from guide_data import make_company, make_inventory
+
+    path = "employees/department_7/employee_7/salary"
+    for name, value, read_path in [
+        ("company", make_company(scale), path),
+        ("inventory", make_inventory(scale), "category_7/sku_7/stock"),
+    ]:
+        keys = split_path(read_path)
+
+        def walk(tree):
+            for key in keys:
+                tree = tree[key]
+            return tree
+
+        codecs = [
+            ("json", lambda v: json.dumps(v, separators=(",", ":")).encode(), json.loads),
+            ("pickle", lambda v: pickle.dumps(v, pickle.HIGHEST_PROTOCOL), pickle.loads),
+            ("marshal", marshal.dumps, marshal.loads),
+            ("dict_codec", dumps, loads),
+        ]
+        rows = []
+        for label, encode, decode in codecs:
+            data = encode(value)
+            assert decode(data) == value
+            if label == "dict_codec":
+                assert get_path(data, read_path) == walk(value)
+                one_path = best_time(lambda: get_path(data, read_path), repeat)
+            else:
+                one_path = best_time(lambda: walk(decode(data)), repeat)
+            rows.append([label, format_bytes(len(data)), format_seconds(best_time(lambda: encode(value), repeat)),
+                         format_seconds(best_time(lambda: decode(data), repeat)), format_seconds(one_path)])
+        print(f"\n{name} at scale {scale:,}; one path = {read_path}")
+        print_table(["codec", "size", "encode", "decode", "read one path"], rows)
+
+
+def demo():
+    """Encode the guide's company and read single values back."""
+    company = {
+        "name": "TechCorp",
+        "founded": 2010,
+        "employees": {
+            "engineering": {
+                "alice": {"position": "Senior Developer", "salary": 95000},
+                "bob": {"position": "DevOps Engineer", "salary": 85000},
+            },
+            "marketing": {
+                "charlie": {"position": "Marketing Manager", "salary": 75000},
+                "diana": {"position": "Content Creator", "salary": 55000},
+            },
+        },
+    }
+    import json
+
+    data = dumps(company)
+    print(f"Encoded company: {len(data)} bytes (compact JSON: {len(json.dumps(company, separators=(',', ':')))})")
+    print("Key table:", Document(data).keys)
+    print("Round trip matches:", loads(data) == company)
+    print("Alice's salary, read alone:", get_path(data, "employees/engineering/alice/salary"))
+
+    document = Document(data)
+    marketing = document.root["employees"]["marketing"]
+    print("Lazy view:", marketing, "->", sorted(marketing))
+    print("Diana:", marketing["diana"].decode())
+
+    recipes = dumps([{"recipe_type": "salad", "names": ["Quinoa Salad", "Chickpea Salad"]},
+                     {"recipe_type": "soup", "names": ["Tomato Basil Soup", "Lentil Soup"]}])
+    print("Second recipe's first name:", get_path(recipes, "1/names/0"))
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        demo()
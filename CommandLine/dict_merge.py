@@ -0,0 +1,267 @@
+"""
+LAYERED DICTIONARY MERGING
+==========================
+
+A merge engine for layered configuration dictionaries (defaults, region,
+tenant, host overrides, ...), replacing the recursive merge_config helper
+from the guide's Configuration Management example.
+
+- merge_layers() merges any number of layers in a single pass, without
+  recursion, and shares untouched subtrees instead of copying them.
+- ChainedView resolves keys lazily on lookup, so the merged dictionary
+  never has to be materialized.
+
+Layers are given lowest priority first, exactly like folding merge_config
+over them: merge_config(merge_config(defaults, region), host).
+
+Run this file directly for a demonstration, or with --benchmark to compare
+against merge_config on wide and deep synthetic configs.
+"""
+
+import sys
+from collections.abc import Mapping
+
+from bench_utils import best_time, format_seconds, print_table
+
+
+def merge_config(default, user):
+    """Recursively merge configuration dictionaries (reference implementation)."""
+    result = default.copy()
+    for key, value in user.items():
+        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            result[key] = merge_config(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+def _merge_level(target, sources, stack):
+    """Merge one nesting level of sources into target, queueing child merges."""
+    # The lowest layer is taken over wholesale; runs[key] then collects the
+    # dict values seen since the last non-dict override of that key.
+    target.update(sources[0])
+    runs = {}
+    for source in sources[1:]:
+        for key, value in source.items():
+            if isinstance(value, dict):
+                run = runs.get(key)
+                if run is not None:
+                    run.append(value)
+                else:
+                    previous = target.get(key)
+                    runs[key] = [previous, value] if isinstance(previous, dict) else [value]
+            elif key in runs:
+                del runs[key]
+            target[key] = value
+
+    for key, run in runs.items():
+        if len(run) > 1:
+            child = {}
+            target[key] = child
+            stack.append((child, run))
+
+
+def merge_layers(*layers):
+    """Merge configuration layers (lowest priority first) into a new dict.
+
+    Only the nesting levels that two or more layers define as dicts are
+    rebuilt; every other subtree is shared with the layer it came from, so
+    mutate the result only through copies of the parts you change.
+    """
+    result = {}
+    sources = [layer for layer in layers if layer]
+    if not sources:
+        return result
+    stack = [(result, sources)]
+    while stack:
+        target, sources = stack.pop()
+        _merge_level(target, sources, stack)
+    return result
+
+
+class ChainedView(Mapping):
+    """Read-only merged view over configuration layers, resolved on lookup.
+
+    Nested dictionaries defined by several layers come back as ChainedView
+    objects of their own; values defined by a single layer are returned as is.
+    """
+
+    __slots__ = ("_layers",)
+
+    def __init__(self, *layers):
+        self._layers = [layer for layer in layers if layer]
+
+    @property
+    def layers(self):
+        """The layers of this view, lowest priority first."""
+        return tuple(self._layers)
+
+    def __getitem__(self, key):
+        run = []
+        for layer in reversed(self._layers):
+            if key not in layer:
+                continue
+            value = layer[key]
+            if not isinstance(value, dict):
+                if run:
+                    break
+                return value
+            run.append(value)
+        if not run:
+            raise KeyError(key)
+        if len(run) == 1:
+            return run[0]
+        run.reverse()
+        return ChainedView(*run)
+
+    def __contains__(self, key):
+        return any(key in layer for layer in self._layers)
+
+    def __iter__(self):
+        seen = {}
+        for layer in self._layers:
+            seen.update(dict.fromkeys(layer))
+        return iter(seen)
+
+    def __len__(self):
+        if len(self._layers) == 1:
+            return len(self._layers[0])
+        keys = set()
+        for layer in self._layers:
+            keys.update(layer)
+        return len(keys)
+
+    def get_path(self, *keys, default=None):
+        """Resolve a nested key path without building intermediate views."""
+        runs = self._layers
+        for depth, key in enumerate(keys):
+            last = depth == len(keys) - 1
+            next_run = []
+            for layer in reversed(runs):
+                if key not in layer:
+                    continue
+                value = layer[key]
+                if not isinstance(value, dict):
+                    if next_run:
+                        break
+                    return value if last else default
+                next_run.append(value)
+            if not next_run:
+                return default
+            next_run.reverse()
+            runs = next_run
+        if len(runs) == 1:
+            return runs[0]
+        return ChainedView(*runs)
+
+    def materialize(self):
+        """Build the merged dictionary this view represents."""
+        return merge_layers(*self._layers)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(repr(layer) for layer in self._layers)})"
+
+
+# =============================================================================
+# SYNTHETIC CONFIGS AND BENCHMARKS
+# =============================================================================
+
+def make_wide_layers(sections=200, keys_per_section=100, layers=4, override_ratio=0.02):
+    """Build wide layered configs: a full default layer plus sparse overrides."""
+    default = {
+        f"section_{s}": {f"key_{k}": k for k in range(keys_per_section)}
+        for s in range(sections)
+    }
+    result = [default]
+    step = max(1, int(1 / override_ratio))
+    for layer in range(1, layers):
+        override = {}
+        for s in range(0, sections, step):
+            override[f"section_{s}"] = {
+                f"key_{k}": f"layer{layer}" for k in range(layer, keys_per_section, step)
+            }
+        result.append(override)
+    return result
+
+
+def make_deep_layers(depth=5000, layers=4):
+    """Build layered configs that are each a single chain `depth` levels deep."""
+    result = []
+    for layer in range(layers):
+        root = node = {}
+        for level in range(depth):
+            node[f"layer{layer}_value"] = level
+            child = {}
+            node["child"] = child
+            node = child
+        result.append(root)
+    return result
+
+
+def _fold_merge_config(layers):
+    merged = layers[0]
+    for layer in layers[1:]:
+        merged = merge_config(merged, layer)
+    return merged
+
+
+def _time_or_fail(func, repeat):
+    try:
+        return best_time(func, repeat=repeat)
+    except RecursionError:
+        return None
+
+
+def benchmark(repeat=5):
+    """Compare merge_config, merge_layers and ChainedView on synthetic configs."""
+    print("Layered merge benchmark (best of", repeat, "runs)")
+    deep_path = ("child",) * 4999 + ("layer3_value",)
+    cases = [
+        ("wide 200x100, 4 layers", make_wide_layers(), ("section_0", "key_1")),
+        ("wide 1000x100, 4 layers", make_wide_layers(sections=1000), ("section_0", "key_1")),
+        ("deep 5000 levels, 4 layers", make_deep_layers(), deep_path),
+    ]
+    rows = []
+    for name, layers, probe in cases:
+        fold_time = _time_or_fail(lambda: _fold_merge_config(layers), repeat)
+        merge_time = _time_or_fail(lambda: merge_layers(*layers), repeat)
+        view = ChainedView(*layers)
+        lookup_time = _time_or_fail(lambda: view.get_path(*probe), repeat)
+        rows.append([
+            name,
+            format_seconds(fold_time) if fold_time is not None else "RecursionError",
+            format_seconds(merge_time),
+            format_seconds(lookup_time),
+        ])
+    print_table(["case", "merge_config (folded)", "merge_layers", "ChainedView path lookup"], rows)
+
+
+def demo():
+    """Show merge_layers and ChainedView on the guide's configuration example."""
+    default_config = {
+        "database": {"host": "localhost", "port": 5432, "name": "myapp"},
+        "cache": {"type": "redis", "ttl": 3600},
+        "logging": {"level": "INFO", "file": "app.log"},
+    }
+    region_config = {"database": {"host": "eu-db.internal"}}
+    host_config = {"database": {"port": 5433}, "logging": {"level": "DEBUG"}}
+
+    merged = merge_layers(default_config, region_config, host_config)
+    print("Merged config:")
+    for section, settings in merged.items():
+        print(f"  {section}: {settings}")
+    print("Cache section shared with defaults:", merged["cache"] is default_config["cache"])
+
+    view = ChainedView(default_config, region_config, host_config)
+    print("\nChained view lookups:")
+    print("  database.host:", view["database"]["host"])
+    print("  database.port:", view.get_path("database", "port"))
+    print("  logging.file:", view.get_path("logging", "file"))
+    print("  matches merge_layers:", view.materialize() == merged)
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        demo()
@@ -0,0 +1,11 @@
+"""
+COMPLETE GUIDE TO PYTHON DICTIONARIES
+=====================================
+
+The command-line guide as a package. Each menu section lives in its own
+module under dictionary_guide.sections and is imported only when it is
+run, so starting the guide loads just the menu, the runner and the output
+layer (see registry.py and startup.py).
+
+Run it with python_dictionary_complete_guide.py or python -m dictionary_guide.
+"""
@@ -0,0 +1,131 @@
+"""
+COMMAND-LINE INTERFACE
+======================
+
+The interactive menu and the command-line options. Only what the menu
+needs is imported here; sections load when they are chosen.
+"""
+
+import os
+import sys
+
+from . import settings
+from .profiling import parse_profile_metrics
+from .registry import get_menu_items
+from .runner import run_example, run_headless
+
+def show_menu():
+    """Display the main menu."""
+    menu_items = get_menu_items()
+    
+    print("\n" + "=" * 60)
+    print(" PYTHON DICTIONARIES GUIDE - MAIN MENU ".center(60, "="))
+    print("=" * 60)
+    
+    for key, title, _ in menu_items:
+        print(f"  {key}. {title}")
+    
+    print("=" * 60)
+    return menu_items
+
+def parse_args(argv=None):
+    """Parse the command-line options."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Complete guide to Python dictionaries.")
+    parser.add_argument("--sections", metavar="LIST",
+                        help="run these menu sections without prompts, e.g. 1,4,9 or all")
+    parser.add_argument("--no-pause", action="store_true",
+                        help="never wait for Enter between sections")
+    parser.add_argument("--format", choices=["text", "json"], default="text",
+                        help="report format for --sections runs (default: text)")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="run --sections in N worker processes (0 = one per CPU)")
+    parser.add_argument("--scale", metavar="N",
+                        help="grow the sections' example datasets to about N records, e.g. 1e6")
+    parser.add_argument("--quiet", action="store_true",
+                        help="discard section output without formatting it (for benchmarking)")
+    parser.add_argument("--profile", metavar="METRICS",
+                        help="measure each section: comma-separated "
+                             f"{', '.join(settings.PROFILE_METRICS)}, or all (memory and cprofile slow sections down)")
+    parser.add_argument("--profile-json", metavar="PATH",
+                        help="write the section profiles to PATH as JSON")
+    parser.add_argument("--profile-dir", metavar="DIR",
+                        help="write one cProfile .pstats file per section into DIR")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main function to run the guide."""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # argparse (and the re module it imports) is only loaded when there are
+    # options to parse, so a plain interactive start skips it.
+    if argv:
+        args = parse_args(argv)
+        if args.no_pause:
+            settings.PAUSE_BETWEEN_SECTIONS = False
+        settings.QUIET_OUTPUT = args.quiet
+        try:
+            if args.profile:
+                settings.PROFILING = parse_profile_metrics(args.profile)
+            elif args.profile_json or args.profile_dir:
+                metrics = {"wall", "cpu", "memory"} | ({"cprofile"} if args.profile_dir else set())
+                settings.PROFILING = frozenset(metrics)
+            if args.scale is not None:
+                from guide_data import parse_scale
+                settings.DATASET_SCALE = parse_scale(args.scale)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        settings.PROFILE_JSON_PATH = args.profile_json
+        settings.PROFILE_PSTATS_DIR = args.profile_dir
+        
+        if args.sections:
+            try:
+                jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+                return run_headless(args.sections, args.format, jobs)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 2
+    
+    print("Welcome to the Complete Python Dictionaries Guide!")
+    print("This interactive guide will teach you everything about Python dictionaries.")
+    
+    # Show table of contents first
+    from .sections.contents import show_table_of_contents
+    show_table_of_contents()
+    
+    while True:
+        menu_items = show_menu()
+        choice = input("\nEnter your choice: ").strip().upper()
+        
+        # Find the selected menu item
+        selected_item = None
+        for key, title, func in menu_items:
+            if key.upper() == choice:
+                selected_item = (key, title, func)
+                break
+        
+        if not selected_item:
+            print("Invalid choice. Please try again.")
+            continue
+        
+        key, title, func = selected_item
+        
+        if key.upper() == "Q":
+            print("\nThank you for using the Python Dictionaries Guide!")
+            print("Happy coding with Python dictionaries!")
+            break
+        
+        if func:
+            print(f"\nRunning: {title}")
+            run_example(func)
+            
+            # Ask if user wants to continue
+            continue_choice = input("\nPress Enter to return to menu (or 'q' to quit): ").strip().lower()
+            if continue_choice == 'q':
+                print("\nThank you for using the Python Dictionaries Guide!")
+                break
+    
+    return 0
@@ -0,0 +1,103 @@
+"""
+OUTPUT LAYER
+============
+
+Headers and previews used by every section, and the buffering that
+run_example() wraps around each section: output goes through a large
+buffer written straight to stdout's file descriptor, or is discarded
+unformatted with --quiet.
+"""
+
+import io
+import sys
+from contextlib import contextmanager, redirect_stdout, nullcontext
+from itertools import islice
+
+from . import settings
+
+class NullOutput(io.TextIOBase):
+    """Text stream that discards everything written to it (--quiet)."""
+    
+    def writable(self):
+        return True
+    
+    def write(self, text):
+        return len(text)
+
+NULL_OUTPUT = NullOutput()
+
+def section_output():
+    """Return a context manager that routes a section's printing through the output layer."""
+    if settings.QUIET_OUTPUT:
+        return redirect_stdout(NULL_OUTPUT)
+    if sys.stdout is NULL_OUTPUT:
+        return nullcontext()
+    return _buffered_stdout()
+
+@contextmanager
+def _buffered_stdout():
+    """Send stdout through a large buffer written straight to its file descriptor.
+    
+    Output to a pipe or file is only written when the buffer fills up; on a
+    terminal the buffer is also flushed after every header, so long sections
+    still show their progress.
+    """
+    target = sys.stdout
+    try:
+        fd = target.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Not backed by a file (e.g. an io.StringIO capture buffer): already in memory.
+        yield target
+        return
+    target.flush()
+    raw = io.FileIO(fd, "w", closefd=False)
+    output = io.TextIOWrapper(io.BufferedWriter(raw, settings.OUTPUT_BUFFER_BYTES),
+                              encoding=target.encoding, errors=target.errors)
+    output.interactive = raw.isatty()
+    try:
+        with redirect_stdout(output):
+            yield output
+    finally:
+        output.close()
+
+def _flush_if_interactive():
+    if getattr(sys.stdout, "interactive", False):
+        sys.stdout.flush()
+
+def print_section_header(title, char="=", width=80):
+    """Print a formatted section header."""
+    if sys.stdout is NULL_OUTPUT:
+        return
+    line = char * width
+    print(f"\n{line}\n{f' {title} '.center(width, char)}\n{line}")
+    _flush_if_interactive()
+
+def print_subsection_header(title, char="-", width=60):
+    """Print a formatted subsection header."""
+    if sys.stdout is NULL_OUTPUT:
+        return
+    line = char * width
+    print(f"\n{line}\n {title} \n{line}")
+    _flush_if_interactive()
+
+def preview(value, limit=settings.PREVIEW_ITEMS):
+    """Return the repr of value, showing at most `limit` items of each dict or list."""
+    if sys.stdout is NULL_OUTPUT:
+        return ""
+    if isinstance(value, dict):
+        parts = [f"{preview(key, limit)}: {preview(item, limit)}" for key, item in islice(value.items(), limit)]
+        if len(value) > limit:
+            parts.append(f"... ({len(value) - limit:,} more)")
+        return "{" + ", ".join(parts) + "}"
+    if isinstance(value, list):
+        parts = [preview(item, limit) for item in islice(value, limit)]
+        if len(value) > limit:
+            parts.append(f"... ({len(value) - limit:,} more)")
+        return "[" + ", ".join(parts) + "]"
+    return repr(value)
+
+def preview_items(iterable, total, indent="  ", limit=settings.PREVIEW_ITEMS):
+    """Yield the first `limit` items of iterable, then print how many were left out."""
+    yield from islice(iterable, limit)
+    if total > limit:
+        print(f"{indent}... and {total - limit:,} more")
@@ -0,0 +1,98 @@
+"""
+SECTION PROFILING
+=================
+
+Turns the measurements run_example() collects (--profile) into a summary
+table, a JSON report and cProfile .pstats files.
+"""
+
+import os
+
+from . import settings
+from .output import print_section_header
+
+def parse_profile_metrics(spec):
+    """Turn a --profile value like "wall,memory" or "all" into metric names."""
+    metrics = set()
+    for part in spec.split(","):
+        part = part.strip().lower()
+        if part == "all":
+            metrics.update(settings.PROFILE_METRICS)
+        elif part in settings.PROFILE_METRICS:
+            metrics.add(part)
+        elif part:
+            raise ValueError(f"unknown profile metric {part!r} (choose from {', '.join(settings.PROFILE_METRICS)} or all)")
+    return frozenset(metrics)
+
+def top_functions(stats, limit=5, sort="cumulative_time"):
+    """Return the most expensive functions in raw cProfile stats.
+    
+    sort is "cumulative_time" (including callees) or "total_time" (own time).
+    """
+    import pstats
+    
+    column = 3 if sort == "cumulative_time" else 2
+    ranked = sorted(stats.items(), key=lambda item: item[1][column], reverse=True)
+    return [
+        {
+            "function": pstats.func_std_string((os.path.basename(filename), line, name)),
+            "calls": calls,
+            "total_time": total_time,
+            "cumulative_time": cumulative_time,
+        }
+        for (filename, line, name), (_primitive, calls, total_time, cumulative_time, _callers) in ranked[:limit]
+    ]
+
+def profile_report(profiles):
+    """Return the section profiles in a JSON-ready form."""
+    report = []
+    for profile in profiles:
+        entry = {key: value for key, value in profile.items() if key != "stats"}
+        if "stats" in profile:
+            entry["top_functions"] = top_functions(profile["stats"])
+        report.append(entry)
+    return report
+
+def print_profile_summary(profiles):
+    """Print one row of measurements per profiled section, most expensive first."""
+    def cost(profile):
+        return profile.get("wall_time", profile.get("cpu_time", profile.get("peak_memory", 0)))
+    
+    def kib(size):
+        return f"{size / 1024:,.1f} KiB" if size is not None else "-"
+    
+    def seconds(value):
+        return f"{value:.3f}s" if value is not None else "-"
+    
+    print_section_header("PROFILE SUMMARY")
+    print(f"  {'section':<40} {'wall':>9} {'cpu':>9} {'peak memory':>14}  hottest function")
+    for profile in sorted(profiles, key=cost, reverse=True):
+        hottest = ""
+        if profile.get("stats"):
+            hottest = top_functions(profile["stats"], limit=1, sort="total_time")[0]["function"]
+        label = f"{profile['section']:>3}. {profile['title']}"
+        print(f"  {label:<40} {seconds(profile.get('wall_time')):>9} {seconds(profile.get('cpu_time')):>9} "
+              f"{kib(profile.get('peak_memory')):>14}  {hottest}")
+
+def export_profiles(profiles, json_path=None, pstats_dir=None):
+    """Write the section profiles as a JSON report and/or one .pstats file per section.
+    
+    The .pstats files load with pstats.Stats(path) or tools like snakeviz.
+    """
+    import json
+    import marshal
+    
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump(profile_report(profiles), file, indent=2)
+        print(f"\nProfile report written to {json_path}")
+    if pstats_dir:
+        os.makedirs(pstats_dir, exist_ok=True)
+        written = 0
+        for profile in profiles:
+            if "stats" in profile:
+                path = os.path.join(pstats_dir, f"section_{profile['section']}.pstats")
+                with open(path, "wb") as file:
+                    marshal.dump(profile["stats"], file)
+                written += 1
+        print(f"{written} cProfile stats file(s) written to {pstats_dir}")
@@ -0,0 +1,62 @@
+"""
+SECTION REGISTRY
+================
+
+The main menu as data: each entry names the module and function that
+implement it, and the module is imported the first time the entry runs.
+Adding a section means adding a module under sections/ and a line here;
+nothing is imported at startup.
+"""
+
+import importlib
+
+# (key, title, module relative to this package, function name)
+SECTIONS = [
+    ("1", "Dictionary Basics", ".sections.basics", "dictionary_basics"),
+    ("2", "Creation Methods", ".sections.basics", "dictionary_creation_methods"),
+    ("3", "Basic Operations", ".sections.operations", "basic_operations"),
+    ("4", "Dictionary Methods", ".sections.methods", "dictionary_methods"),
+    ("5", "Dictionary Comprehensions", ".sections.comprehensions", "dictionary_comprehensions"),
+    ("6", "Iteration Techniques", ".sections.iteration", "iteration_techniques"),
+    ("7", "Advanced Techniques", ".sections.advanced", "advanced_techniques"),
+    ("8", "Nested Dictionaries", ".sections.advanced", "nested_dictionaries"),
+    ("9", "Performance Tips", ".sections.performance", "performance_tips"),
+    ("10", "Real-World Examples", ".sections.real_world", "real_world_examples"),
+    ("11", "Quick Reference", ".sections.reference", "quick_reference"),
+    ("12", "Common Pitfalls", ".sections.reference", "common_pitfalls"),
+    ("B", "Benchmark Quick Reference Idioms", ".sections.performance", "benchmark_idioms"),
+    ("A", "All Sections", ".runner", "run_all_sections"),
+    ("T", "Table of Contents", ".sections.contents", "show_table_of_contents"),
+    ("Q", "Quit", None, None),
+]
+
+class LazySection:
+    """A menu entry's function, imported when it is first called."""
+    
+    __slots__ = ("module", "name", "_func")
+    
+    def __init__(self, module, name):
+        self.module = module
+        self.name = name
+        self._func = None
+    
+    def load(self):
+        """Import the section's module and return its function."""
+        if self._func is None:
+            self._func = getattr(importlib.import_module(self.module, __package__), self.name)
+        return self._func
+    
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+    
+    def __repr__(self):
+        return f"LazySection({self.module!r}, {self.name!r})"
+
+_MENU_ITEMS = [
+    (key, title, LazySection(module, name) if module else None)
+    for key, title, module, name in SECTIONS
+]
+
+def get_menu_items():
+    """Return the main menu as (key, title, function) tuples."""
+    return list(_MENU_ITEMS)
@@ -0,0 +1,229 @@
+"""
+SECTION RUNNER
+==============
+
+Runs menu sections: one at a time from the menu, all in sequence, or
+headless (optionally in a process pool) with a summary at the end.
+"""
+
+import io
+import sys
+import time
+from contextlib import redirect_stdout, nullcontext
+
+from . import settings
+from .output import print_section_header, section_output
+from .profiling import export_profiles, print_profile_summary, profile_report
+from .registry import get_menu_items
+
+def run_example(example_func, profile=None):
+    """Run an example function and handle any errors.
+    
+    Returns True if the example ran cleanly, False if it raised. If profile
+    is a dict, the measurements selected by settings.PROFILING are stored in
+    it: wall_time and cpu_time (seconds), peak_memory (bytes allocated above
+    the starting point, via tracemalloc) and stats (raw cProfile statistics).
+    """
+    if profile is None or not settings.PROFILING:
+        try:
+            with section_output():
+                example_func()
+        except Exception as e:
+            print(f"Error running example: {e}")
+            return False
+        return True
+    
+    import cProfile
+    import tracemalloc
+    
+    ok = True
+    profiler = cProfile.Profile() if "cprofile" in settings.PROFILING else None
+    started_tracing = False
+    if "memory" in settings.PROFILING:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        memory_base = tracemalloc.get_traced_memory()[0]
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        if profiler:
+            profiler.enable()
+        try:
+            with section_output():
+                example_func()
+        finally:
+            if profiler:
+                profiler.disable()
+    except Exception as e:
+        print(f"Error running example: {e}")
+        ok = False
+    finally:
+        cpu_time = time.process_time() - cpu_start
+        wall_time = time.perf_counter() - wall_start
+        if "memory" in settings.PROFILING:
+            profile["peak_memory"] = max(0, tracemalloc.get_traced_memory()[1] - memory_base)
+            if started_tracing:
+                tracemalloc.stop()
+    if "wall" in settings.PROFILING:
+        profile["wall_time"] = wall_time
+    if "cpu" in settings.PROFILING:
+        profile["cpu_time"] = cpu_time
+    if profiler:
+        profiler.create_stats()
+        profile["stats"] = profiler.stats
+    return ok
+
+def pause_for_user():
+    """Pause execution for user to review output."""
+    # With --quiet there is no output to review (and the prompt would be hidden).
+    if settings.PAUSE_BETWEEN_SECTIONS and not settings.QUIET_OUTPUT:
+        input("\nPress Enter to continue to the next section...")
+
+def run_all_sections():
+    """Run all sections in sequence."""
+    sections = [(title, func) for key, title, func in get_menu_items() if key.isdigit()]
+    
+    print_section_header("RUNNING ALL SECTIONS")
+    print("This will run through all sections of the dictionary guide.")
+    print("Each section includes examples and demonstrations.")
+    
+    profiles = []
+    for i, (title, func) in enumerate(sections, 1):
+        print(f"\nRunning Section {i}/{len(sections)}: {title}")
+        profile = {"section": str(i), "title": title}
+        run_example(func, profile)
+        profiles.append(profile)
+        
+        if i < len(sections):
+            pause_for_user()
+    
+    if settings.PROFILING:
+        print_profile_summary(profiles)
+        export_profiles(profiles, settings.PROFILE_JSON_PATH, settings.PROFILE_PSTATS_DIR)
+
+# =============================================================================
+# HEADLESS (BATCH) MODE
+# =============================================================================
+
+def parse_section_keys(spec):
+    """Turn a --sections value like "1,4,9" or "all" into menu keys."""
+    menu_keys = [key for key, _, func in get_menu_items() if func and key != "A"]
+    numbered = [key for key in menu_keys if key.isdigit()]
+    keys = []
+    for part in spec.split(","):
+        part = part.strip().upper()
+        if not part:
+            continue
+        if part in ("A", "ALL"):
+            keys.extend(numbered)
+        elif part in menu_keys:
+            keys.append(part)
+        else:
+            raise ValueError(f"unknown section {part!r} (choose from {', '.join(menu_keys)} or all)")
+    return keys
+
+def run_section(key, capture=False):
+    """Run one menu section and return its result record.
+    
+    With capture=True the section's output is collected into the record
+    instead of being printed.
+    """
+    title, func = {key: (title, func) for key, title, func in get_menu_items()}[key]
+    buffer = io.StringIO() if capture else None
+    profile = {"section": key, "title": title} if settings.PROFILING else None
+    start = time.perf_counter()
+    with redirect_stdout(buffer) if capture else nullcontext():
+        ok = run_example(func, profile)
+    result = {
+        "section": key,
+        "title": title,
+        "ok": ok,
+        "wall_time": time.perf_counter() - start,
+    }
+    if capture:
+        result["output"] = buffer.getvalue()
+    if profile is not None:
+        result["profile"] = profile
+    return result
+
+def _run_section_captured(key):
+    """Worker-process entry point: run a section into its own output buffer."""
+    return run_section(key, capture=True)
+
+def _configure_worker(metrics, scale, quiet):
+    """Worker-process initializer: use the parent's profiling, scale and output settings."""
+    settings.PROFILING = metrics
+    settings.DATASET_SCALE = scale
+    settings.QUIET_OUTPUT = quiet
+
+def run_sections(keys, capture=False, jobs=1):
+    """Run the given menu sections and return one result per section.
+    
+    With jobs > 1 the sections run concurrently in a process pool, each
+    printing into its own buffer; the buffers are then written out in menu
+    order, so the output matches a serial run byte for byte.
+    """
+    keys = list(keys)
+    if jobs <= 1 or len(keys) <= 1:
+        return [run_section(key, capture) for key in keys]
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    try:
+        executor = ProcessPoolExecutor(
+            max_workers=min(jobs, len(keys)),
+            initializer=_configure_worker,
+            initargs=(settings.PROFILING, settings.DATASET_SCALE, settings.QUIET_OUTPUT),
+        )
+    except (NotImplementedError, OSError):
+        return [run_section(key, capture) for key in keys]
+    
+    sys.stdout.flush()
+    results = []
+    with executor:
+        for result in executor.map(_run_section_captured, keys):
+            if not capture:
+                sys.stdout.write(result.pop("output"))
+            results.append(result)
+    return results
+
+def print_run_summary(results):
+    """Print the wall time and status of each section run."""
+    print_section_header("RUN SUMMARY")
+    for result in results:
+        status = "ok" if result["ok"] else "FAILED"
+        print(f"  {result['section']:>3}. {result['title']:<35} {result['wall_time']:8.3f}s  {status}")
+    total = sum(result["wall_time"] for result in results)
+    print(f"\n  Total: {total:.3f}s")
+
+def run_headless(spec, output_format="text", jobs=1):
+    """Run sections without any prompts and return the process exit status."""
+    import json
+    
+    results = run_sections(parse_section_keys(spec), capture=output_format == "json", jobs=jobs)
+    all_ok = all(result["ok"] for result in results)
+    profiles = [result.pop("profile") for result in results if "profile" in result]
+    
+    if output_format == "json":
+        if profiles:
+            for result, entry in zip(results, profile_report(profiles)):
+                result["profile"] = entry
+        report = {
+            "ok": all_ok,
+            "total_wall_time": sum(result["wall_time"] for result in results),
+            "sections": results,
+        }
+        print(json.dumps(report, indent=2))
+        if profiles:
+            # Keep stdout pure JSON; the export messages go to stderr.
+            with redirect_stdout(sys.stderr):
+                export_profiles(profiles, settings.PROFILE_JSON_PATH, settings.PROFILE_PSTATS_DIR)
+    else:
+        print_run_summary(results)
+        if profiles:
+            print_profile_summary(profiles)
+            export_profiles(profiles, settings.PROFILE_JSON_PATH, settings.PROFILE_PSTATS_DIR)
+    
+    return 0 if all_ok else 1
@@ -0,0 +1,8 @@
+"""
+GUIDE SECTIONS
+==============
+
+One module per group of menu sections. Nothing here is imported when the
+guide starts; registry.py loads a module the first time one of its
+sections runs.
+"""
@@ -0,0 +1,114 @@
+"""
+6. ADVANCED TECHNIQUES
+======================
+
+Merging, unpacking, defaultdict and nested dictionaries.
+"""
+
+from ..output import print_section_header, print_subsection_header, preview, preview_items
+from ..settings import get_dataset
+
+def advanced_techniques(data=None):
+    """Demonstrate advanced dictionary techniques."""
+    print_section_header("6. ADVANCED TECHNIQUES")
+    
+    if data is None:
+        data = get_dataset()
+    
+    print_subsection_header("Dictionary Merging")
+    
+    # Using ** operator (Python 3.5+)
+    dict1 = {"a": 1, "b": 2}
+    dict2 = {"c": 3, "d": 4}
+    dict3 = {"e": 5}
+    
+    merged = {**dict1, **dict2, **dict3}
+    print("Merged dictionaries:", merged)
+    
+    # Handling conflicts
+    config_default = {"theme": "light", "font_size": 12, "auto_save": True}
+    config_user = {"theme": "dark", "font_size": 14}
+    
+    final_config = {**config_default, **config_user}
+    print("Default config:", config_default)
+    print("User config:", config_user)
+    print("Final config:", final_config)
+    
+    print_subsection_header("Dictionary Unpacking")
+    
+    # Function parameters
+    def create_user(**kwargs):
+        defaults = {"active": True, "role": "user"}
+        user_data = {**defaults, **kwargs}
+        return user_data
+    
+    user1 = create_user(name="Alice", email="alice@example.com")
+    user2 = create_user(name="Bob", role="admin", active=False)
+    
+    print("User 1:", user1)
+    print("User 2:", user2)
+    
+    print_subsection_header("defaultdict Usage")
+    
+    from collections import defaultdict
+    
+    # Group words by first letter
+    words = data["words"]
+    grouped = defaultdict(list)
+    
+    for word in words:
+        grouped[word[0]].append(word)
+    
+    print("Grouped words:", preview(dict(grouped)))
+    
+    # Count items
+    text = data["text"]
+    word_count = defaultdict(int)
+    
+    for word in text.split():
+        word_count[word] += 1
+    
+    print("Word count:", preview(dict(word_count)))
+
+
+def nested_dictionaries(data=None):
+    """Demonstrate working with nested dictionaries."""
+    print_subsection_header("Nested Dictionaries")
+    
+    if data is None:
+        data = get_dataset()
+    
+    # Complex data structure
+    company = data["company"]
+    
+    print("Company structure:")
+    print(f"Name: {company['name']}")
+    print(f"Founded: {company['founded']}")
+    
+    # Access nested data
+    alice_info = company["employees"]["engineering"]["alice"]
+    print(f"Alice: {alice_info['position']}, ${alice_info['salary']:,}")
+    
+    # Iterate through nested structure
+    print("\nAll employees:")
+    departments = company["employees"]
+    for dept_name, dept_info in preview_items(departments.items(), len(departments)):
+        print(f"  {dept_name.title()} Department:")
+        for emp_name, emp_info in preview_items(dept_info.items(), len(dept_info), "    "):
+            print(f"    {emp_name.title()}: {emp_info['position']}")
+    
+    # Safe nested access
+    def safe_get(d, *keys, default=None):
+        for key in keys:
+            if isinstance(d, dict) and key in d:
+                d = d[key]
+            else:
+                return default
+        return d
+    
+    # Test safe access
+    result1 = safe_get(company, "employees", "engineering", "alice", "salary")
+    result2 = safe_get(company, "employees", "finance", "eve", "salary", default="N/A")
+    
+    print(f"\nSafe access - Alice salary: {result1}")
+    print(f"Safe access - Eve salary: {result2}")
@@ -0,0 +1,89 @@
+"""
+1. DICTIONARY BASICS
+====================
+
+Creating dictionaries, accessing elements and their basic properties.
+"""
+
+from ..output import print_section_header, print_subsection_header
+
+def dictionary_basics():
+    """Demonstrate dictionary creation, access, and basic properties."""
+    print_section_header("1. DICTIONARY BASICS")
+    
+    print_subsection_header("Creating Dictionaries")
+    
+    # Empty dictionary
+    empty_dict = {}
+    empty_dict2 = dict()
+    print("Empty dictionary {}:", empty_dict)
+    print("Empty dictionary dict():", empty_dict2)
+    print("Type:", type(empty_dict))
+    
+    # Dictionary with initial data
+    student = {
+        "name": "Alice",
+        "age": 20,
+        "major": "Computer Science",
+        "gpa": 3.85
+    }
+    print("Student dictionary:", student)
+    
+    # Mixed data types
+    mixed_dict = {
+        "string": "hello",
+        "number": 42,
+        "float": 3.14,
+        "boolean": True,
+        "list": [1, 2, 3],
+        "nested": {"a": 1, "b": 2}
+    }
+    print("Mixed data types:", mixed_dict)
+    
+    print_subsection_header("Accessing Elements")
+    
+    # Direct access
+    print("Student name:", student["name"])
+    print("Student GPA:", student["gpa"])
+    
+    # Safe access with get()
+    print("Grade (get):", student.get("grade", "Not assigned"))
+    print("Major (get):", student.get("major"))
+    
+    # Checking existence
+    print("'name' in student:", "name" in student)
+    print("'grade' in student:", "grade" in student)
+    
+    print_subsection_header("Dictionary Properties")
+    
+    # Length
+    print("Dictionary length:", len(student))
+    
+    # Keys, values, items
+    print("Keys:", list(student.keys()))
+    print("Values:", list(student.values()))
+    print("Items:", list(student.items()))
+
+
+def dictionary_creation_methods():
+    """Demonstrate various ways to create dictionaries."""
+    print_subsection_header("Dictionary Creation Methods")
+    
+    # From lists using zip
+    keys = ["apple", "banana", "cherry"]
+    values = [1.20, 0.50, 2.30]
+    fruit_prices = dict(zip(keys, values))
+    print("From zip:", fruit_prices)
+    
+    # From list of tuples
+    pairs = [("red", "#FF0000"), ("green", "#00FF00"), ("blue", "#0000FF")]
+    colors = dict(pairs)
+    print("From tuples:", colors)
+    
+    # Using keyword arguments
+    person = dict(name="Bob", age=25, city="New York")
+    print("From kwargs:", person)
+    
+    # Dictionary comprehension
+    squares = {x: x**2 for x in range(1, 6)}
+    print("From comprehension:", squares)
@@ -0,0 +1,65 @@
+"""
+4. DICTIONARY COMPREHENSIONS
+============================
+
+Building and transforming dictionaries with comprehensions.
+"""
+
+from ..output import print_section_header, print_subsection_header, preview
+from ..settings import get_dataset
+
+def dictionary_comprehensions(data=None):
+    """Demonstrate dictionary comprehensions."""
+    print_section_header("4. DICTIONARY COMPREHENSIONS")
+    
+    if data is None:
+        data = get_dataset()
+    
+    print_subsection_header("Basic Dictionary Comprehensions")
+    
+    # Basic syntax: {key_expr: value_expr for item in iterable}
+    squares = {x: x**2 for x in range(1, 6)}
+    print("Squares:", squares)
+    
+    # String processing
+    words = ["apple", "banana", "cherry"]
+    word_lengths = {word: len(word) for word in words}
+    print("Word lengths:", word_lengths)
+    
+    print_subsection_header("Conditional Dictionary Comprehensions")
+    
+    # With condition
+    numbers = range(1, 11)
+    even_squares = {x: x**2 for x in numbers if x % 2 == 0}
+    print("Even squares:", even_squares)
+    
+    # Transform existing dictionary
+    prices = data["product_prices"]
+    discounted = {item: price * 0.9 for item, price in prices.items()}
+    print("Original prices:", preview(prices))
+    print("Discounted prices:", preview(discounted))
+    
+    # Conditional expressions
+    grade_letters = {
+        name: ("A" if grade >= 90 else "B" if grade >= 80 else "C")
+        for name, grade in data["exam_grades"].items()
+    }
+    print("Grade letters:", preview(grade_letters))
+    
+    print_subsection_header("Advanced Comprehensions")
+    
+    # Working with multiple iterables
+    fruits = ["apple", "banana", "cherry"]
+    colors = ["red", "yellow", "red"]
+    fruit_colors = {fruit: color for fruit, color in zip(fruits, colors)}
+    print("Fruit colors:", fruit_colors)
+    
+    # Filtering and transforming
+    inventory = data["product_stock"]
+    
+    in_stock = {
+        item: details["price"]
+        for item, details in inventory.items()
+        if details["stock"] > 0
+    }
+    print("Items in stock:", preview(in_stock))
@@ -0,0 +1,37 @@
+"""
+TABLE OF CONTENTS
+=================
+
+The table of contents shown when the guide starts (menu option T).
+"""
+
+from ..output import print_section_header
+
+def show_table_of_contents():
+    """Display the guide's table of contents."""
+    print_section_header("PYTHON DICTIONARIES - COMPLETE GUIDE", "=")
+    
+    toc = """
+TABLE OF CONTENTS:
+
+1. Dictionary Basics - Creation, Access, and Properties
+2. Basic Operations - Adding, Removing, and Modifying
+3. Dictionary Methods - Essential built-in methods
+4. Dictionary Comprehensions - Powerful one-liner creations
+5. Iteration Techniques - Loops and advanced iteration
+6. Dictionary Functions - Built-in functions and utilities
+7. Advanced Techniques - Merging, unpacking, and more
+8. Nested Dictionaries - Multi-level data structures
+9. Performance Tips - Optimization and best practices
+10. Real-World Examples - Practical applications
+11. Interactive Demonstrations - Hands-on practice
+12. Quick Reference - Cheat sheet
+
+Each section includes:
+✅ Clear explanations
+✅ Interactive code examples
+✅ Output demonstrations
+✅ Best practices
+✅ Common pitfalls to avoid
+    """
+    print(toc)
@@ -0,0 +1,78 @@
+"""
+5. ITERATION TECHNIQUES
+=======================
+
+Looping over keys, values and items.
+"""
+
+from ..output import print_section_header, print_subsection_header, preview_items
+from ..settings import get_dataset
+
+def iteration_techniques(data=None):
+    """Demonstrate various ways to iterate over dictionaries."""
+    print_section_header("5. ITERATION TECHNIQUES")
+    
+    if data is None:
+        data = get_dataset()
+    
+    # A single record: its fields are the point, so it does not scale.
+    book_info = {
+        "title": "Python Programming",
+        "author": "John Doe",
+        "year": 2024,
+        "pages": 350,
+        "price": 29.99
+    }
+    
+    print("Book information:", book_info)
+    
+    print_subsection_header("Basic Iteration")
+    
+    # Iterate over keys (default)
+    print("Keys only:")
+    for key in book_info:
+        print(f"  {key}")
+    
+    # Explicit keys iteration
+    print("Keys (explicit):")
+    for key in book_info.keys():
+        print(f"  {key}")
+    
+    # Iterate over values
+    print("Values only:")
+    for value in book_info.values():
+        print(f"  {value}")
+    
+    print_subsection_header("Key-Value Iteration")
+    
+    # Iterate over items
+    print("Key-value pairs:")
+    for key, value in book_info.items():
+        print(f"  {key}: {value}")
+    
+    # Formatted output
+    print("Formatted book info:")
+    for key, value in book_info.items():
+        print(f"  {key.title()}: {value}")
+    
+    print_subsection_header("Advanced Iteration")
+    
+    # Enumerate with items
+    print("Enumerated items:")
+    for i, (key, value) in enumerate(book_info.items(), 1):
+        print(f"  {i}. {key}: {value}")
+    
+    # Conditional iteration
+    print("Numeric values only:")
+    for key, value in book_info.items():
+        if isinstance(value, (int, float)):
+            print(f"  {key}: {value}")
+    
+    # Multiple dictionaries
+    prices = data["fruit_prices"]
+    stock = data["fruit_stock"]
+    
+    print("Price and stock info:")
+    stocked = [fruit for fruit in prices if fruit in stock]
+    for fruit in preview_items(stocked, len(stocked)):
+        print(f"  {fruit}: ${prices[fruit]:.2f}, Stock: {stock[fruit]}")
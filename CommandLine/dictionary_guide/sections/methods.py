@@ -0,0 +1,61 @@
+"""
+3. DICTIONARY METHODS
+=====================
+
+Views, get()/setdefault() and copying.
+"""
+
+from ..output import print_section_header, print_subsection_header, preview
+from ..settings import get_dataset
+
+def dictionary_methods(data=None):
+    """Demonstrate essential dictionary methods."""
+    print_section_header("3. DICTIONARY METHODS")
+    
+    if data is None:
+        data = get_dataset()
+    student_grades = data["student_grades"]
+    
+    print("Student grades:", preview(student_grades))
+    
+    print_subsection_header("View Methods")
+    
+    # Keys, values, items
+    keys = student_grades.keys()
+    values = student_grades.values()
+    items = student_grades.items()
+    
+    print("Keys type:", type(keys))
+    print("Keys:", preview(list(keys)))
+    print("Values:", preview(list(values)))
+    print("Items:", preview(list(items)))
+    
+    print_subsection_header("Safe Access Methods")
+    
+    # get() method
+    print("Alice's grade:", student_grades.get("Alice"))
+    print("Eve's grade:", student_grades.get("Eve", "Not found"))
+    
+    # setdefault() method
+    grade = student_grades.setdefault("Eve", 85)
+    print(f"Eve's grade (setdefault): {grade}")
+    print("Updated grades:", preview(student_grades))
+    
+    # setdefault() with existing key
+    existing_grade = student_grades.setdefault("Alice", 100)
+    print(f"Alice's grade (existing): {existing_grade}")
+    
+    print_subsection_header("Copying Dictionaries")
+    
+    # Shallow copy
+    grades_copy = student_grades.copy()
+    print("Original:", preview(student_grades))
+    print("Copy:", preview(grades_copy))
+    
+    # Demonstrate shallow copy behavior
+    nested_dict = {"a": {"x": 1}, "b": {"y": 2}}
+    shallow_copy = nested_dict.copy()
+    
+    nested_dict["a"]["x"] = 99
+    print("Original after modification:", nested_dict)
+    print("Shallow copy:", shallow_copy)  # Also affected!
@@ -0,0 +1,68 @@
+"""
+2. BASIC OPERATIONS
+===================
+
+Adding, removing and modifying elements.
+"""
+
+from ..output import print_section_header, print_subsection_header
+
+def basic_operations():
+    """Demonstrate basic dictionary operations."""
+    print_section_header("2. BASIC OPERATIONS")
+    
+    # Starting dictionary
+    inventory = {"apples": 50, "bananas": 30}
+    print("Starting inventory:", inventory)
+    
+    print_subsection_header("Adding Elements")
+    
+    # Direct assignment
+    inventory["oranges"] = 25
+    print("After adding oranges:", inventory)
+    
+    # Update with another dictionary
+    new_items = {"grapes": 15, "strawberries": 8}
+    inventory.update(new_items)
+    print("After update:", inventory)
+    
+    # Update with keyword arguments
+    inventory.update(pineapples=5, mangoes=12)
+    print("After kwargs update:", inventory)
+    
+    print_subsection_header("Removing Elements")
+    
+    # Using del
+    del inventory["strawberries"]
+    print("After del strawberries:", inventory)
+    
+    # Using pop()
+    apple_count = inventory.pop("apples")
+    print(f"Popped apples: {apple_count}")
+    print("After pop:", inventory)
+    
+    # Using pop() with default
+    grape_count = inventory.pop("grapes", 0)
+    print(f"Grapes count: {grape_count}")
+    
+    # Using popitem() - removes last item (Python 3.7+)
+    last_item = inventory.popitem()
+    print(f"Last item removed: {last_item}")
+    print("After popitem:", inventory)
+    
+    # Clear all items
+    temp_dict = {"a": 1, "b": 2}
+    print("Before clear:", temp_dict)
+    temp_dict.clear()
+    print("After clear:", temp_dict)
+    
+    print_subsection_header("Modifying Elements")
+    
+    # Direct modification
+    inventory["bananas"] = 45
+    print("Modified bananas:", inventory)
+    
+    # Conditional modification
+    if "pineapples" in inventory:
+        inventory["pineapples"] += 3
+        print("Increased pineapples:", inventory)
@@ -0,0 +1,42 @@
+"""
+9. PERFORMANCE TIPS
+===================
+
+Live measurements of the performance tips and the idiom benchmark suite
+(menu option B); both import their measurement modules only when run.
+"""
+
+from ..output import print_section_header, print_subsection_header
+
+def performance_tips():
+    """Measure dictionary performance tips live on this machine."""
+    import performance_tips as measurements
+    from bench_utils import print_table
+    
+    print_section_header("9. PERFORMANCE TIPS")
+    print("Every number below is measured now, on this machine.")
+    
+    tips = [
+        ("Dictionary vs List for Lookups", measurements.measure_lookups),
+        ("Comprehension vs Loop", measurements.measure_comprehension),
+        ("get() vs try/except KeyError", measurements.measure_get_vs_try),
+        ("Pre-sized vs Incrementally Grown", measurements.measure_presizing),
+    ]
+    
+    for title, measure in tips:
+        print_subsection_header(title)
+        headers, rows, summary = measure()
+        print_table(headers, rows)
+        print(f"\nOn this machine: {summary}")
+
+
+def benchmark_idioms():
+    """Time the quick reference idioms on this machine."""
+    from idiom_benchmarks import run_suite, print_results
+    
+    print_section_header("QUICK REFERENCE IDIOM BENCHMARKS")
+    print("Timing every quick reference idiom at 10, 1,000 and 100,000 entries.")
+    print("Run idiom_benchmarks.py directly for more sizes, JSON output and baselines.")
+    
+    results = run_suite(sizes=(10, 1_000, 100_000))
+    print_results(results)
@@ -0,0 +1,101 @@
+"""
+7. REAL-WORLD EXAMPLES
+======================
+
+Configuration merging, a data processing pipeline and an inventory system.
+"""
+
+from ..output import print_section_header, print_subsection_header, preview_items
+from ..settings import get_dataset
+
+def real_world_examples(data=None):
+    """Demonstrate practical real-world applications."""
+    print_section_header("7. REAL-WORLD EXAMPLES")
+    
+    if data is None:
+        data = get_dataset()
+    
+    print_subsection_header("Example 1: Configuration Management")
+    
+    # Application configuration
+    default_config = data["default_config"]
+    user_config = data["user_config"]
+    
+    def merge_config(default, user):
+        """Recursively merge configuration dictionaries."""
+        result = default.copy()
+        for key, value in user.items():
+            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+                result[key] = merge_config(result[key], value)
+            else:
+                result[key] = value
+        return result
+    
+    final_config = merge_config(default_config, user_config)
+    
+    print("Default config:")
+    for section, settings in preview_items(default_config.items(), len(default_config)):
+        print(f"  {section}: {settings}")
+    
+    print("\nFinal merged config:")
+    for section, settings in preview_items(final_config.items(), len(final_config)):
+        print(f"  {section}: {settings}")
+    
+    print_subsection_header("Example 2: Data Processing Pipeline")
+    
+    # Student records processing
+    raw_records = data["raw_records"]
+    
+    students = {}
+    for record in raw_records:
+        name, age, major, gpa = record.split(",")
+        students[name] = {
+            "age": int(age),
+            "major": major,
+            "gpa": float(gpa),
+            "honors": float(gpa) >= 3.8
+        }
+    
+    print("Processed student records:")
+    for name, info in preview_items(students.items(), len(students)):
+        honors_status = "Yes" if info["honors"] else "No"
+        print(f"  {name}: {info['major']}, GPA: {info['gpa']}, Honors: {honors_status}")
+    
+    # Statistical analysis
+    total_gpa = sum(student["gpa"] for student in students.values())
+    avg_gpa = total_gpa / len(students)
+    honors_count = sum(1 for student in students.values() if student["honors"])
+    
+    print(f"\nStatistics:")
+    print(f"  Average GPA: {avg_gpa:.2f}")
+    print(f"  Honors students: {honors_count}/{len(students)}")
+    
+    print_subsection_header("Example 3: Inventory Management System")
+    
+    inventory = data["inventory"]
+    
+    def get_low_stock_items(inventory, threshold=10):
+        """Find items with stock below threshold."""
+        low_stock = {}
+        for category, items in inventory.items():
+            for item, details in items.items():
+                if details["stock"] < threshold:
+                    low_stock[f"{category}/{item}"] = details["stock"]
+        return low_stock
+    
+    def calculate_inventory_value(inventory):
+        """Calculate total inventory value."""
+        total_value = 0
+        for category, items in inventory.items():
+            for item, details in items.items():
+                total_value += details["price"] * details["stock"]
+        return total_value
+    
+    low_stock = get_low_stock_items(inventory)
+    total_value = calculate_inventory_value(inventory)
+    
+    print("Low stock items:")
+    for item, stock in preview_items(low_stock.items(), len(low_stock)):
+        print(f"  {item}: {stock} units")
+    
+    print(f"\nTotal inventory value: ${total_value:,.2f}")
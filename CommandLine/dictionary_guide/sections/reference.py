@@ -0,0 +1,120 @@
+"""
+8. QUICK REFERENCE
+==================
+
+The cheat sheet and common pitfalls.
+"""
+
+from ..output import print_section_header, print_subsection_header
+
+def quick_reference():
+    """Provide a comprehensive quick reference guide."""
+    print_section_header("8. QUICK REFERENCE GUIDE")
+    
+    reference_sections = {
+        "Dictionary Creation": [
+            "{}                          # Empty dictionary",
+            "{'a': 1, 'b': 2}           # With initial data",
+            "dict()                      # Empty using constructor",
+            "dict(a=1, b=2)             # Using keyword args",
+            "dict([('a', 1), ('b', 2)]) # From list of tuples",
+            "dict(zip(keys, values))    # From two lists",
+            "{k: v for k, v in items}   # Dictionary comprehension"
+        ],
+        
+        "Accessing Elements": [
+            "d['key']                    # Direct access (KeyError if missing)",
+            "d.get('key')               # Safe access (None if missing)",
+            "d.get('key', default)      # Safe access with default",
+            "'key' in d                 # Check if key exists",
+            "d.keys()                   # Get all keys",
+            "d.values()                 # Get all values",
+            "d.items()                  # Get key-value pairs"
+        ],
+        
+        "Adding/Updating Elements": [
+            "d['key'] = value           # Add or update single item",
+            "d.update(other_dict)       # Update with another dictionary",
+            "d.update(key=value)        # Update with keyword args",
+            "d.setdefault('key', value) # Add only if key doesn't exist",
+            "d1.update(d2)              # Merge d2 into d1",
+            "new_d = {**d1, **d2}       # Merge creating new dictionary"
+        ],
+        
+        "Removing Elements": [
+            "del d['key']               # Remove key (KeyError if missing)",
+            "d.pop('key')               # Remove and return value",
+            "d.pop('key', default)      # Remove with default if missing",
+            "d.popitem()                # Remove and return last item",
+            "d.clear()                  # Remove all items"
+        ],
+        
+        "Iteration": [
+            "for key in d:              # Iterate over keys",
+            "for key in d.keys():       # Explicit key iteration",
+            "for value in d.values():   # Iterate over values",
+            "for k, v in d.items():     # Iterate over key-value pairs",
+            "for i, (k, v) in enumerate(d.items()): # With index"
+        ],
+        
+        "Dictionary Comprehensions": [
+            "{k: v for k, v in items}   # Basic comprehension",
+            "{k: v for k, v in items if condition} # With filter",
+            "{k: f(v) for k, v in d.items()} # Transform values",
+            "{f(k): v for k, v in d.items()} # Transform keys",
+            "{k: ('A' if v > 90 else 'B') for k, v in d.items()} # Conditional"
+        ],
+        
+        "Common Patterns": [
+            "d.copy()                   # Shallow copy",
+            "dict(d)                    # Also creates copy",
+            "len(d)                     # Number of items",
+            "bool(d)                    # False if empty, True otherwise",
+            "sorted(d.items())          # Sort by keys",
+            "max(d, key=d.get)          # Key with maximum value",
+            "min(d, key=d.get)          # Key with minimum value"
+        ]
+    }
+    
+    for section_title, items in reference_sections.items():
+        print_subsection_header(section_title)
+        print("".join(f"  {item}\n" for item in items))
+
+
+def common_pitfalls():
+    """Show common pitfalls and how to avoid them."""
+    print_subsection_header("Common Pitfalls")
+    
+    pitfalls = [
+        {
+            "title": "Mutable Default Arguments",
+            "wrong": "def add_item(item, d={}):  # DON'T DO THIS",
+            "right": "def add_item(item, d=None):\n    if d is None:\n        d = {}",
+            "explanation": "Default mutable arguments are shared between function calls"
+        },
+        {
+            "title": "KeyError vs get() Method",
+            "wrong": "value = d['key']  # Raises KeyError if key missing",
+            "right": "value = d.get('key', default_value)",
+            "explanation": "Use get() for safe access or check with 'in' operator first"
+        },
+        {
+            "title": "Modifying Dictionary During Iteration",
+            "wrong": "for key in d:\n    if condition:\n        del d[key]  # RuntimeError!",
+            "right": "keys_to_remove = [k for k, v in d.items() if condition]\nfor k in keys_to_remove:\n    del d[k]",
+            "explanation": "Collect keys to modify first, then modify dictionary"
+        },
+        {
+            "title": "Dictionary vs List for Lookups",
+            "wrong": "items = [('a', 1), ('b', 2)]  # Slow O(n) lookups",
+            "right": "items = {'a': 1, 'b': 2}  # Fast O(1) lookups",
+            "explanation": "Use dictionaries for fast key-based lookups"
+        }
+    ]
+    
+    for i, pitfall in enumerate(pitfalls, 1):
+        print(f"{i}. {pitfall['title']}")
+        print(f"   Wrong: {pitfall['wrong']}")
+        print(f"   Right: {pitfall['right']}")
+        print(f"   Why: {pitfall['explanation']}")
+        print()
@@ -0,0 +1,38 @@
+"""
+GUIDE SETTINGS
+==============
+
+Run-wide options set from the command line by cli.main(). Other modules
+read them as settings.NAME at call time, so changes made after import
+(and in worker processes, see runner._configure_worker) take effect.
+"""
+
+# Set to False (--no-pause) to run sections back to back without waiting for Enter.
+PAUSE_BETWEEN_SECTIONS = True
+
+# Measurements run_example() takes for each section (--profile), and where
+# run_all_sections() exports them (--profile-json, --profile-dir).
+PROFILE_METRICS = ("wall", "cpu", "memory", "cprofile")
+PROFILING = frozenset()
+PROFILE_JSON_PATH = None
+PROFILE_PSTATS_DIR = None
+
+# Size of the datasets sections build with get_dataset() (--scale); 1 keeps
+# the original examples. Longer collections are printed abbreviated.
+DATASET_SCALE = 1
+PREVIEW_ITEMS = 10
+
+# Section output is collected in a buffer of this many bytes and written in
+# large chunks; with --quiet it is discarded without being formatted.
+OUTPUT_BUFFER_BYTES = 256 * 1024
+QUIET_OUTPUT = False
+
+def get_dataset():
+    """Return the datasets for a section at the current --scale.
+    
+    Each call returns a fresh guide_data.Dataset, so sections can modify
+    their data freely.
+    """
+    from guide_data import Dataset
+    
+    return Dataset(DATASET_SCALE)
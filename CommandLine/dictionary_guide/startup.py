@@ -0,0 +1,131 @@
+"""
+STARTUP BENCHMARK
+=================
+
+Measures how long the guide takes to start, using the interpreter's own
+import profiler (python -X importtime), and fails when cold start goes over
+a fixed budget or when a module that should load lazily is imported at
+startup.
+
+Each run starts a fresh interpreter that imports dictionary_guide.cli,
+which is everything the interactive menu needs. Only modules the bare
+interpreter does not already import count against the budget, so the
+figure is the guide's own startup cost.
+
+Usage:
+    python -m dictionary_guide.startup
+    python -m dictionary_guide.startup --budget-ms 30 --runs 9 --top 15
+
+Exits with status 1 when the budget is exceeded or a deferred module was
+imported.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from bench_utils import print_table
+
+# Median import time the guide may add to interpreter startup.
+STARTUP_BUDGET_MS = 25.0
+
+STARTUP_MODULE = "dictionary_guide.cli"
+
+# Modules that must only be imported once a section or option needs them.
+DEFERRED_MODULES = (
+    "argparse",
+    "json",
+    "cProfile",
+    "pstats",
+    "tracemalloc",
+    "concurrent.futures",
+    "numpy",
+    "bench_utils",
+    "guide_data",
+    "performance_tips",
+    "idiom_benchmarks",
+    "dictionary_guide.sections.",
+)
+
+# The table of contents is shown as soon as the guide starts.
+ALLOWED_SECTION_MODULES = ("dictionary_guide.sections", "dictionary_guide.sections.contents")
+
+def import_times(code):
+    """Run code in a fresh interpreter and return {module: (self_us, cumulative_us)}."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=root, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+def startup_cost(baseline_modules, code=f"import {STARTUP_MODULE}"):
+    """Return (total_us, {module: self_us}) for modules the baseline does not import."""
+    times = import_times(code)
+    added = {name: self_us for name, (self_us, _cumulative) in times.items() if name not in baseline_modules}
+    return sum(added.values()), added
+
+def deferred_violations(modules):
+    """Return the modules in `modules` that should have been imported lazily."""
+    violations = []
+    for name in modules:
+        if name in ALLOWED_SECTION_MODULES:
+            continue
+        for deferred in DEFERRED_MODULES:
+            if name == deferred or name.startswith(deferred if deferred.endswith(".") else deferred + "."):
+                violations.append(name)
+                break
+    return sorted(violations)
+
+def run(budget_ms=STARTUP_BUDGET_MS, runs=7, top=10):
+    """Measure cold start, print a report and return the process exit status."""
+    baseline_modules = set(import_times("pass"))
+    import_times(f"import {STARTUP_MODULE}")  # warm-up: writes bytecode caches
+    
+    totals = []
+    self_times = {}
+    for _ in range(runs):
+        total_us, added = startup_cost(baseline_modules)
+        totals.append(total_us)
+        for name, self_us in added.items():
+            self_times.setdefault(name, []).append(self_us)
+    median_ms = statistics.median(totals) / 1000
+    
+    slowest = sorted(self_times.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    print(f"Modules imported by `import {STARTUP_MODULE}` beyond a bare interpreter "
+          f"(median of {runs} runs):")
+    print_table(["module", "self time"], [
+        [name, f"{statistics.median(samples) / 1000:.2f} ms"] for name, samples in slowest[:top]
+    ])
+    
+    violations = deferred_violations(self_times)
+    ok = median_ms <= budget_ms and not violations
+    print(f"\nStartup import time: {median_ms:.2f} ms (min {min(totals) / 1000:.2f} ms), "
+          f"budget {budget_ms:.2f} ms")
+    if violations:
+        print("Imported at startup but should load lazily:", ", ".join(violations))
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+def main(argv=None):
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Check the guide's cold-start import time.")
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS,
+                        help=f"maximum median import time (default: {STARTUP_BUDGET_MS:g})")
+    parser.add_argument("--runs", type=int, default=7, help="fresh interpreters to measure")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    args = parser.parse_args(argv)
+    return run(args.budget_ms, args.runs, args.top)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,563 @@
+"""
+PERSISTENT ON-DISK DICTIONARY
+=============================
+
+inventory, students and company in the guide live in RAM and are rebuilt
+from literals on every run. DiskDict keeps a str-keyed dictionary in a
+directory on disk instead, behind the MutableMapping API (get, setdefault,
+pop, popitem, items(), ...), and opens in constant time however large it
+is:
+
+- <generation>.log is an append-only log of records
+
+      crc32 | flag (put/delete) | key length | value length | key | value
+
+  with keys UTF-8 encoded and values pickled. Overwriting or deleting a
+  key appends a record; nothing is rewritten in place.
+- <generation>.index is an open-addressing hash table in a file, mapped
+  with mmap: a header (capacity, counts, log end, live bytes) followed by
+  (64-bit key hash, log offset) slots. Lookups probe the mapped index and
+  read one record through a read-only mmap of the log, so only the value
+  asked for is unpickled.
+- CURRENT names the live generation. compact() copies the live records of
+  the current generation into the next one in a background thread,
+  replays whatever was written meanwhile, and switches CURRENT with an
+  atomic rename. Compaction starts by itself once more than half the log
+  is overwritten or deleted records.
+
+The index records how much of the log it covers; when a crash leaves
+records past that point, opening the store replays them (and drops a torn
+final record). Writes reach the operating system immediately but are only
+forced to disk by sync() and close().
+
+A DiskDict may be shared between threads but only one process may open a
+directory at a time. Values are unpickled when read, so only open stores
+you trust. Iteration follows the index, not insertion order.
+
+Run this file directly for a demonstration, or with --benchmark to time
+writes, random reads, reopening and compaction on a 1M-key store.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import MutableMapping
+from hashlib import blake2b
+from zlib import crc32
+
+from bench_utils import format_bytes, format_seconds, print_table
+
+LOG_MAGIC = b"DISKDICT LOG v1\n"
+INDEX_MAGIC = b"DDINDEX1"
+# crc32, flag, key length, value length
+RECORD = struct.Struct("<IBII")
+# magic, capacity, count, used slots, log end, live bytes
+INDEX_HEADER = struct.Struct("<8sQQQQQ")
+
+PUT = 0
+DELETE = 1
+
+# Index slot offsets below the first record mark empty and deleted slots.
+_EMPTY = 0
+_DELETED = 1
+
+MAX_LOAD = 2 / 3
+COMPACT_MIN_BYTES = 1 << 20
+COMPACT_GARBAGE_RATIO = 0.5
+
+
+def _key_hash(key_bytes):
+    # Stable across processes and runs, unlike hash(str).
+    return int.from_bytes(blake2b(key_bytes, digest_size=8).digest(), "little")
+
+
+def _capacity_for(count):
+    capacity = 8
+    while capacity * MAX_LOAD <= count:
+        capacity *= 2
+    return capacity
+
+
+def _read_record(buf, offset):
+    """Parse the record at offset in buf; return (flag, key, value, size) or None if it is torn."""
+    end = offset + RECORD.size
+    if end > len(buf):
+        return None
+    checksum, flag, key_length, value_length = RECORD.unpack_from(buf, offset)
+    size = RECORD.size + key_length + value_length
+    if offset + size > len(buf):
+        return None
+    body = buf[offset + 4:offset + size]
+    if crc32(body) != checksum:
+        return None
+    return flag, body[RECORD.size - 4:RECORD.size - 4 + key_length], body[RECORD.size - 4 + key_length:], size
+
+
+class _LogIndex:
+    """One generation of a DiskDict: a log file and its hash index file."""
+
+    def __init__(self, log_path, index_path, capacity=8):
+        self.log_path = log_path
+        self.index_path = index_path
+        if not os.path.exists(log_path) or os.path.getsize(log_path) == 0:
+            # An empty log is one whose creation was cut short.
+            with open(log_path, "wb") as file:
+                file.write(LOG_MAGIC)
+        self._log_fd = os.open(log_path, os.O_RDWR)
+        if os.pread(self._log_fd, len(LOG_MAGIC), 0) != LOG_MAGIC:
+            os.close(self._log_fd)
+            raise ValueError(f"{log_path} is not a DiskDict log")
+        self._log_map = None
+        self._mapped = 0
+        self.resizes = 0
+        log_size = os.fstat(self._log_fd).st_size
+        if not os.path.exists(index_path):
+            self._create_index(index_path, capacity)
+        self._map_index()
+        if self.log_end > log_size:
+            # The index is ahead of the log (not written by us): rebuild it.
+            self._unmap_index()
+            self._create_index(index_path, capacity)
+            self._map_index()
+        self._remap_log()
+        if log_size > self.log_end:
+            self._replay(self.log_end)
+
+    # -------------------------------------------------------------------------
+    # Files and maps
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _create_index(path, capacity, log_end=len(LOG_MAGIC), count=0, live_bytes=0, slots=None):
+        """Write a complete index file next to path, then switch it in atomically.
+
+        slots, if given, is an array("Q") of 2 * capacity entries already
+        filled in, so a crash never leaves a header that claims records the
+        slots do not hold.
+        """
+        with open(path + ".tmp", "wb") as file:
+            file.write(INDEX_HEADER.pack(INDEX_MAGIC, capacity, count, count, log_end, live_bytes))
+            if slots is None:
+                file.truncate(INDEX_HEADER.size + 16 * capacity)
+            else:
+                file.write(slots)
+        os.replace(path + ".tmp", path)
+
+    def _map_index(self):
+        self._index_file = open(self.index_path, "r+b")
+        self._index_map = mmap.mmap(self._index_file.fileno(), 0)
+        magic, self.capacity, self.count, self.used, self.log_end, self.live_bytes = \
+            INDEX_HEADER.unpack_from(self._index_map)
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"{self.index_path} is not a DiskDict index")
+        self._slots = memoryview(self._index_map)[INDEX_HEADER.size:].cast("Q")
+        self._mask = self.capacity - 1
+
+    def _unmap_index(self):
+        self._slots.release()
+        self._index_map.close()
+        self._index_file.close()
+
+    def _write_header(self):
+        INDEX_HEADER.pack_into(self._index_map, 0, INDEX_MAGIC, self.capacity, self.count, self.used,
+                               self.log_end, self.live_bytes)
+
+    def _remap_log(self):
+        if self._log_map is not None:
+            self._log_map.close()
+        self._log_map = mmap.mmap(self._log_fd, 0, access=mmap.ACCESS_READ)
+        self._mapped = len(self._log_map)
+
+    def _record(self, offset):
+        """Return (flag, key, value, size) of the record at a log offset."""
+        if offset >= self._mapped:
+            # Written since the log was mapped: read it directly until the
+            # unmapped tail is big enough to be worth a new map.
+            if self.log_end - self._mapped < self._mapped:
+                header = os.pread(self._log_fd, RECORD.size, offset)
+                _checksum, _flag, key_length, value_length = RECORD.unpack(header)
+                data = header + os.pread(self._log_fd, key_length + value_length, offset + RECORD.size)
+                return _read_record(data, 0)
+            self._remap_log()
+        return _read_record(self._log_map, offset)
+
+    # -------------------------------------------------------------------------
+    # Index
+    # -------------------------------------------------------------------------
+
+    def _find(self, key_bytes, key_hash):
+        """Return (slot, offset, record) for key, or (slot to insert at, 0, None)."""
+        slots = self._slots
+        mask = self._mask
+        index = key_hash & mask
+        free = -1
+        while True:
+            offset = slots[2 * index + 1]
+            if offset == _EMPTY:
+                return (index if free < 0 else free), 0, None
+            if offset == _DELETED:
+                if free < 0:
+                    free = index
+            elif slots[2 * index] == key_hash:
+                record = self._record(offset)
+                if record[1] == key_bytes:
+                    return index, offset, record
+            index = (index + 1) & mask
+
+    def _apply(self, flag, key_bytes, offset, size):
+        """Point the index at a record that is already in the log."""
+        key_hash = _key_hash(key_bytes)
+        slot, old_offset, old_record = self._find(key_bytes, key_hash)
+        if old_offset:
+            self.live_bytes -= old_record[3]
+        if flag == PUT:
+            if not old_offset:
+                if self._slots[2 * slot + 1] == _EMPTY:
+                    self.used += 1
+                self.count += 1
+            self._slots[2 * slot] = key_hash
+            self._slots[2 * slot + 1] = offset
+            self.live_bytes += size
+        elif old_offset:
+            self._slots[2 * slot + 1] = _DELETED
+            self.count -= 1
+        self.log_end = offset + size
+        if self.used > self.capacity * MAX_LOAD:
+            self._resize(_capacity_for(self.count * 2))
+        self._write_header()
+        return old_offset
+
+    def _resize(self, capacity):
+        """Rehash every live slot into a new index file of the given capacity."""
+        old_slots = self._slots.tolist()
+        slots = array("Q", bytes(16 * capacity))
+        mask = capacity - 1
+        count = 0
+        for index in range(0, len(old_slots), 2):
+            key_hash, offset = old_slots[index], old_slots[index + 1]
+            if offset > _DELETED:
+                slot = key_hash & mask
+                while slots[2 * slot + 1]:
+                    slot = (slot + 1) & mask
+                slots[2 * slot] = key_hash
+                slots[2 * slot + 1] = offset
+                count += 1
+        self._unmap_index()
+        self._create_index(self.index_path, capacity, self.log_end, count, self.live_bytes, slots)
+        self._map_index()
+        self.resizes += 1
+
+    def _replay(self, start):
+        """Index records from start to the end of the log, dropping a torn final record."""
+        self._remap_log()
+        offset = start
+        while offset < self._mapped:
+            record = _read_record(self._log_map, offset)
+            if record is None:
+                break
+            flag, key, _value, size = record
+            self._apply(flag, key, offset, size)
+            offset += size
+        if offset < self._mapped:
+            self._log_map.close()
+            self._log_map = None
+            os.truncate(self._log_fd, offset)
+            self._remap_log()
+        self.log_end = offset
+        self._write_header()
+
+    # -------------------------------------------------------------------------
+    # Records
+    # -------------------------------------------------------------------------
+
+    def get(self, key_bytes):
+        """Return the value bytes stored for key_bytes, or None."""
+        _slot, _offset, record = self._find(key_bytes, _key_hash(key_bytes))
+        return record[2] if record else None
+
+    def append(self, flag, key_bytes, value=b""):
+        """Append a record and index it; return the offset of the record it replaced, or 0."""
+        body = RECORD.pack(0, flag, len(key_bytes), len(value))[4:] + key_bytes + value
+        offset = self.log_end
+        os.pwrite(self._log_fd, struct.pack("<I", crc32(body)) + body, offset)
+        return self._apply(flag, key_bytes, offset, 4 + len(body))
+
+    def live_offsets(self):
+        return [offset for offset in self._slots[1::2] if offset > _DELETED]
+
+    def records(self, start, end):
+        """Yield (flag, key, value, offset) for the records in [start, end) of the log."""
+        if end > self._mapped:
+            self._remap_log()
+        offset = start
+        while offset < end:
+            flag, key, value, size = _read_record(self._log_map, offset)
+            yield flag, key, value, offset
+            offset += size
+
+    def sync(self):
+        self._index_map.flush()
+        os.fsync(self._log_fd)
+
+    def close(self):
+        self.sync()
+        self._unmap_index()
+        self._log_map.close()
+        os.close(self._log_fd)
+
+
+class DiskDict(MutableMapping):
+    """A persistent str-keyed dictionary: an append-only log plus a mmap'd hash index."""
+
+    def __init__(self, path, auto_compact=True):
+        self.path = path
+        self.auto_compact = auto_compact
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.RLock()
+        self._compactor = None
+        self._version = 0
+        try:
+            with open(os.path.join(path, "CURRENT"), encoding="ascii") as file:
+                self._generation = int(file.read())
+        except FileNotFoundError:
+            self._generation = 0
+        self._store = _LogIndex(*self._files(self._generation))
+        self._remove_other_generations()
+
+    def _files(self, generation):
+        return (os.path.join(self.path, f"{generation}.log"), os.path.join(self.path, f"{generation}.index"))
+
+    def _remove_other_generations(self):
+        """Delete files left behind by earlier generations or an interrupted compaction."""
+        keep = {os.path.basename(name) for name in self._files(self._generation)} | {"CURRENT"}
+        for name in os.listdir(self.path):
+            if name not in keep and name.split(".")[0].isdigit():
+                os.remove(os.path.join(self.path, name))
+
+    # -------------------------------------------------------------------------
+    # Mapping interface
+    # -------------------------------------------------------------------------
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = self._store.get(key.encode("utf-8"))
+        if value is None:
+            raise KeyError(key)
+        return pickle.loads(value)
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._store.get(key.encode("utf-8")) is not None
+
+    def __setitem__(self, key, value):
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            capacity = self._store.capacity
+            self._store.append(PUT, key.encode("utf-8"), payload)
+            if self._store.capacity != capacity:
+                self._version += 1
+            self._maybe_compact()
+
+    def __delitem__(self, key):
+        key_bytes = key.encode("utf-8")
+        with self._lock:
+            if self._store.get(key_bytes) is None:
+                raise KeyError(key)
+            self._store.append(DELETE, key_bytes)
+            self._maybe_compact()
+
+    def __iter__(self):
+        # Like a dict, refuse to continue once the index has been rebuilt.
+        version = self._version
+        with self._lock:
+            offsets = self._store.live_offsets()
+        for offset in offsets:
+            with self._lock:
+                if self._version != version:
+                    raise RuntimeError("DiskDict was resized or compacted during iteration")
+                flag, key, _value, _size = self._store._record(offset)
+            yield str(key, "utf-8")
+
+    def __len__(self):
+        return self._store.count
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def garbage_bytes(self):
+        """Bytes of the log taken by overwritten values, deleted keys and delete records."""
+        store = self._store
+        return store.log_end - len(LOG_MAGIC) - store.live_bytes
+
+    def _maybe_compact(self):
+        if (self.auto_compact and self._store.log_end > COMPACT_MIN_BYTES
+                and self.garbage_bytes() > COMPACT_GARBAGE_RATIO * (self._store.log_end - len(LOG_MAGIC))):
+            self.compact(wait=False)
+
+    def compact(self, wait=True):
+        """Rewrite the live records into a new generation, in a background thread."""
+        with self._lock:
+            if self._compactor is None or not self._compactor.is_alive():
+                self._compactor = threading.Thread(target=self._compact, name="DiskDict-compact", daemon=True)
+                self._compactor.start()
+            compactor = self._compactor
+        if wait:
+            compactor.join()
+
+    def _compact(self):
+        generation = self._generation + 1
+        with self._lock:
+            old = self._store
+            start = old.log_end
+            offsets = old.live_offsets()
+            new = _LogIndex(*self._files(generation), capacity=_capacity_for(len(offsets)))
+        # Records below start never change, so copy them through a map of
+        # our own without holding the lock.
+        with open(old.log_path, "rb") as file, mmap.mmap(file.fileno(), start, access=mmap.ACCESS_READ) as log:
+            for offset in sorted(offsets):
+                _flag, key, value, _size = _read_record(log, offset)
+                new.append(PUT, key, value)
+        with self._lock:
+            # Catch up with writes made while copying, then switch.
+            for flag, key, value, _offset in old.records(start, old.log_end):
+                new.append(flag, key, value)
+            new.sync()
+            current = os.path.join(self.path, "CURRENT")
+            with open(current + ".tmp", "w", encoding="ascii") as file:
+                file.write(str(generation))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(current + ".tmp", current)
+            self._store = new
+            self._generation = generation
+            self._version += 1
+            old.close()
+            self._remove_other_generations()
+
+    def stats(self):
+        """Return sizes and counts describing the store's files."""
+        store = self._store
+        return {
+            "entries": store.count,
+            "generation": self._generation,
+            "log bytes": store.log_end,
+            "garbage bytes": self.garbage_bytes(),
+            "index bytes": INDEX_HEADER.size + 16 * store.capacity,
+            "index capacity": store.capacity,
+        }
+
+    def sync(self):
+        """Force the log and index to disk."""
+        with self._lock:
+            self._store.sync()
+
+    def close(self):
+        """Wait for a running compaction, then sync and close the files."""
+        if self._compactor is not None:
+            self._compactor.join()
+        with self._lock:
+            self._store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"DiskDict({self.path!r}, entries={len(self):,}, generation={self._generation})"
+
+
+# =============================================================================
+# DEMONSTRATION AND BENCHMARKS
+# =============================================================================
+
+def benchmark(count=1_000_000, reads=100_000):
+    """Time building, reading, reopening and compacting a store."""
+    import random
+    import shutil
+    import tempfile
+    import time
+
+    from guide_data import make_inventory
+
+    inventory = make_inventory(count)
+    records = [(f"{category}/{item}", details)
+               for category, items in inventory.items() for item, details in items.items()]
+    keys = random.Random(3).sample([key for key, _details in records], reads)
+    path = tempfile.mkdtemp(prefix="disk_dict_")
+    rows = []
+
+    def timed(label, func, operations):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        rows.append([label, format_seconds(elapsed), format_seconds(elapsed / operations) if operations else ""])
+        return result
+
+    try:
+        store = DiskDict(path, auto_compact=False)
+
+        def write_all():
+            for key, details in records:
+                store[key] = details
+
+        timed(f"write {len(records):,} items", write_all, len(records))
+        timed(f"read {reads:,} random items", lambda: [store[key] for key in keys], reads)
+        timed(f"restock {reads:,} items (overwrite)", lambda: [
+            store.__setitem__(key, {**store[key], "stock": 100}) for key in keys], reads)
+        timed("close (fsync)", store.close, 0)
+        store = timed("reopen", lambda: DiskDict(path, auto_compact=False), 0)
+        timed(f"first {reads:,} reads after reopen", lambda: [store[key] for key in keys], reads)
+        before = store.stats()
+        timed("compact", store.compact, 0)
+        after = store.stats()
+        timed(f"read {reads:,} after compaction", lambda: [store[key] for key in keys], reads)
+        store.close()
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+    print(f"DiskDict with {len(records):,} inventory items")
+    print_table(["operation", "total", "per item"], rows)
+    print(f"\nLog {format_bytes(before['log bytes'])} ({format_bytes(before['garbage bytes'])} garbage) -> "
+          f"{format_bytes(after['log bytes'])} after compaction; index {format_bytes(after['index bytes'])}")
+
+
+def demo():
+    """Keep the guide's inventory on disk across two openings."""
+    import shutil
+    import tempfile
+
+    path = tempfile.mkdtemp(prefix="disk_dict_")
+    try:
+        with DiskDict(path) as store:
+            store["electronics/laptop"] = {"price": 999.99, "stock": 5, "supplier": "TechCorp"}
+            store["electronics/mouse"] = {"price": 29.99, "stock": 25, "supplier": "AccessoryCo"}
+            store["books/python_guide"] = {"price": 39.99, "stock": 15, "supplier": "BookHouse"}
+            store.setdefault("books/data_science", {"price": 49.99, "stock": 8, "supplier": "EduPress"})
+            laptop = store["electronics/laptop"]
+            laptop["stock"] -= 1
+            store["electronics/laptop"] = laptop
+            print("Removed:", store.pop("electronics/mouse")["supplier"])
+
+        with DiskDict(path) as store:
+            print("Reopened:", store)
+            for sku, details in sorted(store.items()):
+                print(f"  {sku}: {details['stock']} in stock")
+            print("Missing:", store.get("electronics/mouse", "not stocked"))
+            store.compact()
+            print("After compaction:", store.stats())
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        demo()
@@ -0,0 +1,300 @@
+"""
+SCALABLE GUIDE DATASETS
+=======================
+
+The guide's sections work on small hand-written literals: four
+student_grades, three raw_records, two departments in company, four
+inventory SKUs. This module generates the same structures at any size, so
+the sections (and the performance work built on them) can run against
+realistic data volumes.
+
+At scale 1 every generator returns exactly the guide's original literal.
+At larger scales the original entries are kept - the sections look up
+"Alice" or company["employees"]["engineering"]["alice"] by name - and
+deterministic, structurally identical entries are added until the dataset
+holds `scale` records:
+
+- student_grades: scale names mapped to grades
+- raw_records: scale "name,age,major,gpa" CSV lines
+- company: scale employees spread over about sqrt(scale) departments
+- inventory: scale items spread over about sqrt(scale) categories
+- product_prices / product_stock / exam_grades: the comprehension
+  examples' tables, with scale entries each
+- fruit_prices / fruit_stock: the iteration examples' prices (scale
+  entries) and stock levels (for about half of them)
+- words / text: word streams of scale words
+- default_config / user_config: about scale / 10 config sections
+
+Dataset(scale) builds each of these lazily on first access, so a section
+only pays for the data it uses. Run this file directly to print build time
+and memory for each dataset at a given scale (e.g. --scale 1e6).
+"""
+
+import math
+import sys
+import time
+import tracemalloc
+from collections.abc import Mapping
+
+from bench_utils import format_bytes, format_seconds, print_table
+
+MAJORS = ["Computer Science", "Mathematics", "Physics"]
+POSITIONS = ["Senior Developer", "DevOps Engineer", "Marketing Manager", "Content Creator",
+             "Data Analyst", "Product Manager"]
+SUPPLIERS = ["TechCorp", "AccessoryCo", "BookHouse", "EduPress"]
+WORDS = ["apple", "banana", "cherry", "apricot", "blueberry"]
+TEXT_WORDS = ["hello", "world", "hello", "python", "world"]
+
+
+def _extra(scale, original):
+    """How many generated entries to add to an original literal of this size."""
+    return max(0, int(scale) - original)
+
+
+def _departments_for(count):
+    return max(1, math.isqrt(count))
+
+
+def make_student_grades(scale=1):
+    """The dictionary_methods() grades, with generated students added."""
+    grades = {"Alice": 95, "Bob": 87, "Charlie": 92, "Diana": 88}
+    for i in range(_extra(scale, len(grades))):
+        grades[f"student_{i}"] = 60 + (i * 37) % 41
+    return grades
+
+
+def make_raw_records(scale=1):
+    """The Data Processing Pipeline's CSV lines, with generated records added."""
+    records = [
+        "Alice,20,Computer Science,3.85",
+        "Bob,22,Mathematics,3.70",
+        "Charlie,19,Physics,3.92",
+    ]
+    records.extend(
+        f"student_{i},{18 + i % 10},{MAJORS[i % len(MAJORS)]},{2.0 + (i * 37 % 200) / 100:.2f}"
+        for i in range(_extra(scale, len(records)))
+    )
+    return records
+
+
+def make_company(scale=1):
+    """The nested_dictionaries() company, with generated departments and employees."""
+    employees = {
+        "engineering": {
+            "alice": {"position": "Senior Developer", "salary": 95000},
+            "bob": {"position": "DevOps Engineer", "salary": 85000},
+        },
+        "marketing": {
+            "charlie": {"position": "Marketing Manager", "salary": 75000},
+            "diana": {"position": "Content Creator", "salary": 55000},
+        },
+    }
+    extra = _extra(scale, 4)
+    departments = _departments_for(extra)
+    for i in range(extra):
+        department = employees.setdefault(f"department_{i % departments}", {})
+        department[f"employee_{i}"] = {
+            "position": POSITIONS[i % len(POSITIONS)],
+            "salary": 40000 + (i * 7919) % 80000,
+        }
+    return {"name": "TechCorp", "founded": 2010, "employees": employees}
+
+
+def make_inventory(scale=1):
+    """The Inventory Management System's catalog, with generated categories and items."""
+    inventory = {
+        "electronics": {
+            "laptop": {"price": 999.99, "stock": 5, "supplier": "TechCorp"},
+            "mouse": {"price": 29.99, "stock": 25, "supplier": "AccessoryCo"},
+        },
+        "books": {
+            "python_guide": {"price": 39.99, "stock": 15, "supplier": "BookHouse"},
+            "data_science": {"price": 49.99, "stock": 8, "supplier": "EduPress"},
+        },
+    }
+    extra = _extra(scale, 4)
+    categories = _departments_for(extra)
+    for i in range(extra):
+        category = inventory.setdefault(f"category_{i % categories}", {})
+        category[f"sku_{i}"] = {
+            "price": round(1 + (i * 7919 % 100000) / 100, 2),
+            "stock": (i * 31) % 500,
+            "supplier": SUPPLIERS[i % len(SUPPLIERS)],
+        }
+    return inventory
+
+
+def make_product_prices(scale=1):
+    """The dictionary_comprehensions() prices, with generated products added."""
+    prices = {"laptop": 1000, "mouse": 30, "keyboard": 80}
+    for i in range(_extra(scale, len(prices))):
+        prices[f"product_{i}"] = 5 + (i * 7919) % 2000
+    return prices
+
+
+def make_product_stock(scale=1):
+    """The dictionary_comprehensions() inventory, with generated products added."""
+    stock = {
+        "laptop": {"price": 999, "stock": 5},
+        "mouse": {"price": 25, "stock": 0},
+        "keyboard": {"price": 75, "stock": 10},
+    }
+    for i in range(_extra(scale, len(stock))):
+        stock[f"product_{i}"] = {"price": 5 + (i * 7919) % 2000, "stock": (i * 31) % 7}
+    return stock
+
+
+def make_exam_grades(scale=1):
+    """The grade_letters comprehension's grades, with generated students added."""
+    grades = {"Alice": 95, "Bob": 87, "Charlie": 76}
+    for i in range(_extra(scale, len(grades))):
+        grades[f"student_{i}"] = 60 + (i * 37) % 41
+    return grades
+
+
+def make_fruit_prices(scale=1):
+    """The iteration_techniques() fruit prices, with generated fruits added."""
+    prices = {"apple": 1.20, "banana": 0.50}
+    for i in range(_extra(scale, len(prices))):
+        prices[f"fruit_{i}"] = round(0.25 + (i * 7919 % 1000) / 100, 2)
+    return prices
+
+
+def make_fruit_stock(scale=1):
+    """The iteration_techniques() stock levels, for every other generated fruit."""
+    stock = {"apple": 50, "banana": 30}
+    for i in range(0, _extra(scale, len(stock)), 2):
+        stock[f"fruit_{i}"] = (i * 31) % 200
+    return stock
+
+
+def make_words(scale=1):
+    """The defaultdict example's word list, repeated to scale words."""
+    count = max(len(WORDS), int(scale))
+    return (WORDS * (count // len(WORDS) + 1))[:count]
+
+
+def make_text(scale=1):
+    """The word-count example's text, repeated to scale words."""
+    count = max(len(TEXT_WORDS), int(scale))
+    return " ".join((TEXT_WORDS * (count // len(TEXT_WORDS) + 1))[:count])
+
+
+def make_default_config(scale=1):
+    """The Configuration Management defaults, with generated sections added."""
+    config = {
+        "database": {"host": "localhost", "port": 5432, "name": "myapp"},
+        "cache": {"type": "redis", "ttl": 3600},
+        "logging": {"level": "INFO", "file": "app.log"},
+    }
+    for i in range(_extra(scale // 10, len(config))):
+        config[f"service_{i}"] = {"enabled": True, "timeout": 30, "retries": 3}
+    return config
+
+
+def make_user_config(scale=1):
+    """The Configuration Management overrides, touching every third generated section."""
+    config = {
+        "database": {"host": "prod-server.com", "port": 5433},
+        "logging": {"level": "DEBUG"},
+    }
+    for i in range(0, _extra(scale // 10, 3), 3):
+        config[f"service_{i}"] = {"timeout": 60}
+    return config
+
+
+BUILDERS = {
+    "student_grades": make_student_grades,
+    "raw_records": make_raw_records,
+    "company": make_company,
+    "inventory": make_inventory,
+    "product_prices": make_product_prices,
+    "product_stock": make_product_stock,
+    "exam_grades": make_exam_grades,
+    "fruit_prices": make_fruit_prices,
+    "fruit_stock": make_fruit_stock,
+    "words": make_words,
+    "text": make_text,
+    "default_config": make_default_config,
+    "user_config": make_user_config,
+}
+
+
+def parse_scale(value):
+    """Turn a --scale value such as "1e6" or "250000" into a positive int."""
+    try:
+        scale = int(float(value))
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid scale {value!r}") from None
+    if scale < 1:
+        raise ValueError(f"scale must be at least 1, got {value!r}")
+    return scale
+
+
+class Dataset(Mapping):
+    """The guide's datasets at one scale, each built on first access.
+
+    Every Dataset builds its own objects, so a section may modify what it
+    reads without affecting other sections.
+    """
+
+    def __init__(self, scale=1):
+        self.scale = int(scale)
+        self._built = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._built[name]
+        except KeyError:
+            pass
+        value = self._built[name] = BUILDERS[name](self.scale)
+        return value
+
+    def __iter__(self):
+        return iter(BUILDERS)
+
+    def __len__(self):
+        return len(BUILDERS)
+
+    def __repr__(self):
+        return f"Dataset(scale={self.scale:,})"
+
+
+# =============================================================================
+# DEMONSTRATION AND BENCHMARKS
+# =============================================================================
+
+def record_count(name, value):
+    """Count the records in a dataset: employees, items, words or entries."""
+    if name == "company":
+        return sum(len(department) for department in value["employees"].values())
+    if name == "inventory":
+        return sum(len(category) for category in value.values())
+    if name == "text":
+        return value.count(" ") + 1
+    return len(value)
+
+
+def report(scale):
+    """Print build time and memory of every dataset at the given scale."""
+    rows = []
+    for name, build in BUILDERS.items():
+        tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            value = build(scale)
+            elapsed = time.perf_counter() - start
+            size, _peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        rows.append([name, f"{record_count(name, value):,}", format_seconds(elapsed), format_bytes(size)])
+        del value
+    print(f"Guide datasets at scale {scale:,}")
+    print_table(["dataset", "records", "build time", "memory"], rows)
+
+
+if __name__ == "__main__":
+    scale = 100_000
+    if "--scale" in sys.argv[1:]:
+        scale = parse_scale(sys.argv[sys.argv.index("--scale") + 1])
+    report(scale)
@@ -0,0 +1,266 @@
+"""
+QUICK REFERENCE IDIOM BENCHMARKS
+================================
+
+Times every idiom listed in the guide's quick_reference() section across a
+range of dictionary sizes, so the right idiom for a hot path can be picked
+from data instead of habit.
+
+Each idiom is timed with timeit against prepared dictionaries of the
+requested size; statements that remove items put them back so every
+repetition sees the same dictionary; d.clear() is timed one call at a
+time on a fresh copy made outside the timed code. Results can be saved as JSON and
+compared against a stored baseline, flagging idioms that got slower.
+
+Usage:
+    python idiom_benchmarks.py                          # sizes 10, 1,000, 100,000
+    python idiom_benchmarks.py --full                   # sizes 10 ... 10,000,000
+    python idiom_benchmarks.py --json results.json
+    python idiom_benchmarks.py --baseline baseline.json --tolerance 0.25
+
+The suite is also available from the command-line guide's main menu.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+
+from bench_utils import format_seconds, print_table
+
+DEFAULT_SIZES = (10, 1_000, 100_000)
+FULL_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+DEFAULT_TOLERANCE = 0.25
+
+# Idioms grouped like quick_reference(); each entry is (label, statement) or
+# (label, statement, setup) for idioms that need fresh state on every run.
+# Statements run against the names prepared by make_namespace().
+IDIOMS = {
+    "Dictionary Creation": [
+        ("{}", "{}"),
+        ("{'a': 1, 'b': 2}", "{'a': 1, 'b': 2}"),
+        ("dict()", "dict()"),
+        ("dict(a=1, b=2)", "dict(a=1, b=2)"),
+        ("dict([('a', 1), ('b', 2)])", "dict(pairs)"),
+        ("dict(zip(keys, values))", "dict(zip(keys, values))"),
+        ("{k: v for k, v in items}", "{k: v for k, v in pairs}"),
+    ],
+    "Accessing Elements": [
+        ("d['key']", "d[key]"),
+        ("d.get('key')", "d.get(key)"),
+        ("d.get('key', default)", "d.get(missing, 0)"),
+        ("'key' in d", "key in d"),
+        ("d.keys()", "d.keys()"),
+        ("d.values()", "d.values()"),
+        ("d.items()", "d.items()"),
+    ],
+    "Adding/Updating Elements": [
+        ("d['key'] = value", "d[key] = value"),
+        ("d.update(other_dict)", "d.update(d2)"),
+        ("d.update(key=value)", "d.update(key0=value)"),
+        ("d.setdefault('key', value)", "d.setdefault(key, value)"),
+        ("new_d = {**d1, **d2}", "new_d = {**d, **d2}"),
+        ("new_d = d1 | d2", "new_d = d | d2"),
+    ],
+    "Removing Elements": [
+        ("del d['key']", "del d[key]; d[key] = value"),
+        ("d.pop('key')", "d.pop(key); d[key] = value"),
+        ("d.pop('key', default)", "d.pop(missing, 0)"),
+        ("d.popitem()", "k, v = d.popitem(); d[k] = v"),
+        ("d.clear()", "c.clear()", "c = d.copy()"),
+    ],
+    "Iteration": [
+        ("for key in d:", "for k in d: pass"),
+        ("for key in d.keys():", "for k in d.keys(): pass"),
+        ("for value in d.values():", "for v in d.values(): pass"),
+        ("for k, v in d.items():", "for k, v in d.items(): pass"),
+        ("for i, (k, v) in enumerate(d.items()):", "for i, (k, v) in enumerate(d.items()): pass"),
+    ],
+    "Dictionary Comprehensions": [
+        ("{k: v for k, v in items}", "{k: v for k, v in d.items()}"),
+        ("{k: v for k, v in items if condition}", "{k: v for k, v in d.items() if v % 2}"),
+        ("{k: f(v) for k, v in d.items()}", "{k: v * 2 for k, v in d.items()}"),
+        ("{f(k): v for k, v in d.items()}", "{k.upper(): v for k, v in d.items()}"),
+        ("{k: ('A' if v > 90 else 'B') ...}", "{k: ('A' if v > 90 else 'B') for k, v in d.items()}"),
+    ],
+    "Common Patterns": [
+        ("d.copy()", "d.copy()"),
+        ("dict(d)", "dict(d)"),
+        ("len(d)", "len(d)"),
+        ("bool(d)", "bool(d)"),
+        ("sorted(d.items())", "sorted(d.items())"),
+        ("max(d, key=d.get)", "max(d, key=d.get)"),
+        ("min(d, key=d.get)", "min(d, key=d.get)"),
+    ],
+}
+
+
+def make_namespace(size):
+    """Prepare the dictionaries and sequences the idiom statements use."""
+    keys = [f"key{i}" for i in range(size)]
+    values = list(range(size))
+    d = dict(zip(keys, values))
+    return {
+        "keys": keys,
+        "values": values,
+        "pairs": list(zip(keys, values)),
+        "d": d,
+        "d2": dict(d),
+        "key": keys[size // 2],
+        "value": values[size // 2],
+        "missing": "not-a-key",
+    }
+
+
+def time_statement(statement, namespace, min_time=0.05, repeat=3):
+    """Return the best per-execution time of statement, in seconds."""
+    timer = timeit.Timer(statement, globals=namespace)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1 << 24:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, timer.timeit(number))
+    return best / number
+
+
+def time_with_setup(statement, setup, namespace, min_time=0.05, repeat=3):
+    """Return the best time of one execution of statement, with setup run before each.
+
+    Statements that consume their input (d.clear()) cannot be looped; each
+    run times a single execution, less the timer's own cost measured the
+    same way with an empty statement.
+    """
+    timer = timeit.Timer(statement, setup, globals=namespace)
+    empty = timeit.Timer("pass", setup, globals=namespace)
+    best = best_empty = float("inf")
+    runs = 0
+    deadline = time.perf_counter() + min_time * repeat
+    while runs < repeat or (time.perf_counter() < deadline and runs < 100_000):
+        best = min(best, timer.timeit(1))
+        best_empty = min(best_empty, empty.timeit(1))
+        runs += 1
+    return max(0.0, best - best_empty)
+
+
+def run_suite(sizes=DEFAULT_SIZES, sections=None, min_time=0.05, repeat=3, progress=None):
+    """Time every idiom at every size and return a JSON-ready results dict.
+
+    results["results"][key]["timings"][str(size)] is the seconds per
+    execution, where key is "section: label" (some idioms appear in more
+    than one section).
+    """
+    results = {}
+    for size in sizes:
+        namespace = make_namespace(size)
+        for section, idioms in IDIOMS.items():
+            if sections and section not in sections:
+                continue
+            for label, statement, *setup in idioms:
+                if setup:
+                    seconds = time_with_setup(statement, setup[0], namespace, min_time, repeat)
+                else:
+                    seconds = time_statement(statement, namespace, min_time, repeat)
+                entry = results.setdefault(result_key(section, label),
+                                           {"section": section, "label": label, "timings": {}})
+                entry["timings"][str(size)] = seconds
+                if progress:
+                    progress(size, label, seconds)
+        del namespace
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "sizes": list(sizes),
+        },
+        "results": results,
+    }
+
+
+def result_key(section, label):
+    """The results key of an idiom: its label alone is not unique across sections."""
+    return f"{section}: {label}"
+
+
+def find_regressions(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Return (key, size, baseline_seconds, seconds) for idioms slower than baseline."""
+    regressions = []
+    for key, entry in results["results"].items():
+        old_entry = baseline.get("results", {}).get(key)
+        if not old_entry:
+            continue
+        for size, seconds in entry["timings"].items():
+            old = old_entry["timings"].get(size)
+            if old and seconds > old * (1 + tolerance):
+                regressions.append((key, int(size), old, seconds))
+    return regressions
+
+
+def print_results(results):
+    """Print one table per quick reference section, one column per size."""
+    sizes = [str(size) for size in results["meta"]["sizes"]]
+    by_section = {}
+    for entry in results["results"].values():
+        by_section.setdefault(entry["section"], []).append(
+            [entry["label"]] + [format_seconds(entry["timings"].get(size)) for size in sizes]
+        )
+    for section, rows in by_section.items():
+        print(f"\n{section}")
+        print_table(["idiom"] + [f"n={int(size):,}" for size in sizes], rows)
+
+
+def print_regressions(regressions, tolerance):
+    """Print the idioms that regressed against the baseline."""
+    if not regressions:
+        print(f"\nNo regressions beyond {tolerance:.0%} of the baseline.")
+        return
+    print(f"\nRegressions beyond {tolerance:.0%} of the baseline:")
+    print_table(["idiom", "size", "baseline", "now", "slowdown"], [
+        [key, f"{size:,}", format_seconds(old), format_seconds(new), f"{new / old:.2f}x"]
+        for key, size, old, new in regressions
+    ])
+
+
+def main(argv=None):
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Benchmark the guide's quick reference idioms.")
+    parser.add_argument("--sizes", help="comma-separated dictionary sizes (default: 10,1000,100000)")
+    parser.add_argument("--full", action="store_true", help="use sizes from 10 to 10,000,000")
+    parser.add_argument("--section", action="append", choices=list(IDIOMS), help="only run this section")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per measurement")
+    parser.add_argument("--json", metavar="PATH", help="write the results to PATH")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a stored results file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown before flagging a regression (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    if args.sizes:
+        sizes = tuple(int(float(size)) for size in args.sizes.split(","))
+    else:
+        sizes = FULL_SIZES if args.full else DEFAULT_SIZES
+
+    results = run_suite(sizes, args.section, args.min_time)
+    print_results(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"\nResults written to {args.json}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = find_regressions(results, baseline, args.tolerance)
+        print_regressions(regressions, args.tolerance)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
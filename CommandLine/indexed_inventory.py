@@ -0,0 +1,289 @@
+"""
+INDEXED INVENTORY STORE
+=======================
+
+An inventory built on the guide's nested shape
+
+    {category: {item: {"price": ..., "stock": ..., "supplier": ...}}}
+
+that keeps secondary indexes up to date on every change, so the questions
+the guide's get_low_stock_items() and calculate_inventory_value() answer by
+scanning every item become cheap lookups:
+
+- a sorted (stock, sku) index: "stock below threshold" is a bisect plus a
+  slice of the matching entries
+- a supplier index: {supplier: {sku, ...}}
+- a running total value (price * stock), read in O(1)
+
+A sku is the "category/item" string used by get_low_stock_items(), so
+category and item names may not contain "/".
+
+Run this file directly for a demonstration, or with --benchmark to compare
+against the scanning functions on a large catalog.
+"""
+
+import math
+import sys
+from bisect import bisect_left, insort
+
+from bench_utils import best_time, format_seconds, print_table
+
+
+def get_low_stock_items(inventory, threshold=10):
+    """Find items with stock below threshold (reference implementation)."""
+    low_stock = {}
+    for category, items in inventory.items():
+        for item, details in items.items():
+            if details["stock"] < threshold:
+                low_stock[f"{category}/{item}"] = details["stock"]
+    return low_stock
+
+
+def calculate_inventory_value(inventory):
+    """Calculate total inventory value (reference implementation)."""
+    total_value = 0
+    for category, items in inventory.items():
+        for item, details in items.items():
+            total_value += details["price"] * details["stock"]
+    return total_value
+
+
+def _sku(category, item):
+    """Return the "category/item" sku, rejecting names that would make it ambiguous."""
+    sku = f"{category}/{item}"
+    if sku.count("/") != 1:
+        raise ValueError(f"category and item names may not contain '/': {category!r}, {item!r}")
+    return sku
+
+
+class IndexedInventory:
+    """Nested inventory with a sorted stock index, a supplier index and a running total."""
+
+    def __init__(self, inventory=None):
+        self._categories = {}
+        self._stock_index = []
+        self._by_supplier = {}
+        self._total_value = 0.0
+        if inventory:
+            self._bulk_load(inventory)
+
+    def _bulk_load(self, inventory):
+        """Load a nested inventory dict, sorting the stock index once."""
+        values = []
+        for category, items in inventory.items():
+            for item, details in items.items():
+                sku = self._store(category, item, details["price"], details["stock"], details["supplier"])
+                self._stock_index.append((details["stock"], sku))
+                values.append(details["price"] * details["stock"])
+        self._stock_index.sort()
+        self._total_value = math.fsum(values)
+
+    def _store(self, category, item, price, stock, supplier):
+        sku = _sku(category, item)
+        self._categories.setdefault(category, {})[item] = {
+            "price": price,
+            "stock": stock,
+            "supplier": supplier,
+        }
+        self._by_supplier.setdefault(supplier, set()).add(sku)
+        return sku
+
+    def _details(self, category, item):
+        try:
+            return self._categories[category][item]
+        except KeyError:
+            raise KeyError(f"{category}/{item}") from None
+
+    def _unindex_stock(self, stock, sku):
+        index = bisect_left(self._stock_index, (stock, sku))
+        del self._stock_index[index]
+
+    # -------------------------------------------------------------------------
+    # Mutations
+    # -------------------------------------------------------------------------
+
+    def add_item(self, category, item, price, stock, supplier):
+        """Add an item, replacing any existing item with the same sku."""
+        _sku(category, item)
+        if item in self._categories.get(category, {}):
+            self.remove_item(category, item)
+        sku = self._store(category, item, price, stock, supplier)
+        insort(self._stock_index, (stock, sku))
+        self._total_value += price * stock
+
+    def remove_item(self, category, item):
+        """Remove an item and return its details."""
+        details = self._details(category, item)
+        sku = f"{category}/{item}"
+        self._unindex_stock(details["stock"], sku)
+        suppliers = self._by_supplier[details["supplier"]]
+        suppliers.discard(sku)
+        if not suppliers:
+            del self._by_supplier[details["supplier"]]
+        self._total_value -= details["price"] * details["stock"]
+        items = self._categories[category]
+        del items[item]
+        if not items:
+            del self._categories[category]
+        return dict(details)
+
+    def set_stock(self, category, item, stock):
+        """Set an item's stock level."""
+        details = self._details(category, item)
+        old_stock = details["stock"]
+        if stock == old_stock:
+            return
+        sku = f"{category}/{item}"
+        self._unindex_stock(old_stock, sku)
+        insort(self._stock_index, (stock, sku))
+        self._total_value += details["price"] * (stock - old_stock)
+        details["stock"] = stock
+
+    def adjust_stock(self, category, item, delta):
+        """Add delta (negative to remove) to an item's stock and return the new level."""
+        stock = self._details(category, item)["stock"] + delta
+        self.set_stock(category, item, stock)
+        return stock
+
+    def set_price(self, category, item, price):
+        """Set an item's unit price."""
+        details = self._details(category, item)
+        self._total_value += (price - details["price"]) * details["stock"]
+        details["price"] = price
+
+    def set_supplier(self, category, item, supplier):
+        """Move an item to another supplier."""
+        details = self._details(category, item)
+        sku = f"{category}/{item}"
+        suppliers = self._by_supplier[details["supplier"]]
+        suppliers.discard(sku)
+        if not suppliers:
+            del self._by_supplier[details["supplier"]]
+        self._by_supplier.setdefault(supplier, set()).add(sku)
+        details["supplier"] = supplier
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    @property
+    def total_value(self):
+        """Total inventory value (sum of price * stock), maintained incrementally."""
+        return self._total_value
+
+    def recalculate_value(self):
+        """Recompute the total value from scratch, discarding float drift."""
+        self._total_value = math.fsum(
+            details["price"] * details["stock"]
+            for items in self._categories.values()
+            for details in items.values()
+        )
+        return self._total_value
+
+    def get_low_stock_items(self, threshold=10):
+        """Return {sku: stock} for items with stock below threshold, lowest stock first."""
+        end = bisect_left(self._stock_index, (threshold,))
+        return {sku: stock for stock, sku in self._stock_index[:end]}
+
+    def get_stock_between(self, low, high):
+        """Return {sku: stock} for items with low <= stock < high, lowest stock first."""
+        start = bisect_left(self._stock_index, (low,))
+        end = bisect_left(self._stock_index, (high,), lo=start)
+        return {sku: stock for stock, sku in self._stock_index[start:end]}
+
+    def items_by_supplier(self, supplier):
+        """Return the skus supplied by supplier."""
+        return frozenset(self._by_supplier.get(supplier, ()))
+
+    def suppliers(self):
+        """Return the names of all suppliers with at least one item."""
+        return list(self._by_supplier)
+
+    def get_item(self, category, item):
+        """Return a copy of an item's details."""
+        return dict(self._details(category, item))
+
+    def __contains__(self, sku):
+        category, _, item = sku.partition("/")
+        return item in self._categories.get(category, {})
+
+    def __len__(self):
+        return len(self._stock_index)
+
+    def to_dict(self):
+        """Return the inventory as a plain nested dictionary."""
+        return {
+            category: {item: dict(details) for item, details in items.items()}
+            for category, items in self._categories.items()
+        }
+
+
+# =============================================================================
+# DEMONSTRATION AND BENCHMARKS
+# =============================================================================
+
+def make_catalog(categories=50, items_per_category=10000, suppliers=200):
+    """Build a large nested inventory with deterministic prices and stock."""
+    return {
+        f"category_{c}": {
+            f"sku_{i}": {
+                "price": round(1 + (i * 7919 % 100000) / 100, 2),
+                "stock": (i * 31 + c) % 500,
+                "supplier": f"supplier_{(i + c) % suppliers}",
+            }
+            for i in range(items_per_category)
+        }
+        for c in range(categories)
+    }
+
+
+def benchmark(repeat=3):
+    """Compare indexed queries with the scanning reference functions."""
+    catalog = make_catalog()
+    build_time = best_time(lambda: IndexedInventory(catalog), repeat=1)
+    store = IndexedInventory(catalog)
+    item_count = len(store)
+
+    rows = [
+        ["low stock (<10), scan", format_seconds(best_time(lambda: get_low_stock_items(catalog), repeat))],
+        ["low stock (<10), indexed", format_seconds(best_time(lambda: store.get_low_stock_items(), repeat))],
+        ["total value, scan", format_seconds(best_time(lambda: calculate_inventory_value(catalog), repeat))],
+        ["total value, indexed", format_seconds(best_time(lambda: store.total_value, repeat))],
+        ["supplier lookup, indexed", format_seconds(best_time(lambda: store.items_by_supplier("supplier_7"), repeat))],
+        ["set_stock, indexed", format_seconds(best_time(
+            lambda: store.adjust_stock("category_3", "sku_42", 1), repeat, number=1000))],
+    ]
+    print(f"Inventory of {item_count:,} items (index build: {format_seconds(build_time)})")
+    print_table(["operation", "time per call"], rows)
+
+
+def demo():
+    """Show the indexed store on the guide's inventory example."""
+    store = IndexedInventory({
+        "electronics": {
+            "laptop": {"price": 999.99, "stock": 5, "supplier": "TechCorp"},
+            "mouse": {"price": 29.99, "stock": 25, "supplier": "AccessoryCo"},
+        },
+        "books": {
+            "python_guide": {"price": 39.99, "stock": 15, "supplier": "BookHouse"},
+            "data_science": {"price": 49.99, "stock": 8, "supplier": "EduPress"},
+        },
+    })
+    print("Low stock items:", store.get_low_stock_items())
+    print(f"Total inventory value: ${store.total_value:,.2f}")
+
+    store.adjust_stock("electronics", "mouse", -20)
+    store.set_price("books", "python_guide", 34.99)
+    store.add_item("books", "algorithms", 59.99, 3, "EduPress")
+    print("\nAfter selling 20 mice, a price cut and a new book:")
+    print("Low stock items:", store.get_low_stock_items())
+    print("EduPress items:", sorted(store.items_by_supplier("EduPress")))
+    print(f"Total inventory value: ${store.total_value:,.2f}")
+    print(f"Recalculated value:    ${calculate_inventory_value(store.to_dict()):,.2f}")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        demo()
@@ -0,0 +1,181 @@
+"""
+PERFORMANCE TIPS - LIVE MEASUREMENTS
+====================================
+
+Measurements behind section 9 of the command-line guide. Instead of
+stating rules of thumb, each tip is measured on the machine running the
+guide with timeit (operations per second) and tracemalloc / sys.getsizeof
+(bytes per entry):
+
+1. dict vs list lookups (the "Dictionary vs List for Lookups" pitfall)
+2. dict comprehension vs an explicit loop
+3. d.get() vs try/except KeyError, for present and missing keys
+4. pre-sized vs incrementally grown dictionaries
+
+Each measure_* function returns (headers, rows, summary), where summary is
+a one-line conclusion drawn from the numbers just measured; the guide
+prints them under its own headers. Run this file directly to print all of
+them.
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from bench_utils import format_bytes, print_table
+
+
+def ops_per_second(statement, namespace, min_time=0.05, repeat=3):
+    """Return the best operations per second achieved by statement."""
+    timer = timeit.Timer(statement, globals=namespace)
+    number, elapsed = timer.autorange()
+    scale = max(1, int(number * min_time / elapsed)) if elapsed else number
+    best = min(timer.repeat(repeat=repeat, number=scale))
+    return scale / best if best else float("inf")
+
+
+def format_rate(rate):
+    """Format an operations-per-second figure."""
+    for unit, size in (("G", 1e9), ("M", 1e6), ("k", 1e3)):
+        if rate >= size:
+            return f"{rate / size:,.2f} {unit}ops/s"
+    return f"{rate:,.1f} ops/s"
+
+
+def traced_bytes(build):
+    """Return the bytes still allocated after calling build()."""
+    # Tracing may already be on (the guide's --profile memory); only count
+    # what build() adds and leave the tracer as it was found.
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        if started:
+            tracemalloc.stop()
+    del result
+    return size
+
+
+def measure_lookups(sizes=(10, 1_000, 100_000)):
+    """Key lookup in a list of pairs (linear scan) vs a dict (hash lookup)."""
+    rows = []
+    speedups = []
+    for size in sizes:
+        pairs = [(f"key{i}", i) for i in range(size)]
+        table = dict(pairs)
+        namespace = {"pairs": pairs, "table": table, "key": f"key{size - 1}"}
+        list_rate = ops_per_second("next(v for k, v in pairs if k == key)", namespace)
+        dict_rate = ops_per_second("table[key]", namespace)
+        rows.append([
+            f"{size:,}",
+            format_rate(list_rate),
+            format_rate(dict_rate),
+            f"{dict_rate / list_rate:,.0f}x",
+            f"{(sys.getsizeof(pairs) + size * sys.getsizeof(pairs[0])) / size:.0f} B",
+            f"{sys.getsizeof(table) / size:.0f} B",
+        ])
+        speedups.append(dict_rate / list_rate)
+    headers = ["entries", "list lookup", "dict lookup", "dict speedup", "list B/entry", "dict B/entry"]
+    summary = (f"dict lookups were {speedups[0]:,.0f}x faster at {sizes[0]:,} entries "
+               f"and {speedups[-1]:,.0f}x faster at {sizes[-1]:,}.")
+    return headers, rows, summary
+
+
+def measure_comprehension(size=10_000):
+    """Building {x: x * x} with a comprehension vs a for loop."""
+    namespace = {"numbers": range(size)}
+    loop = "d = {}\nfor x in numbers:\n    d[x] = x * x"
+    comprehension = "{x: x * x for x in numbers}"
+    loop_rate = ops_per_second(loop, namespace)
+    comprehension_rate = ops_per_second(comprehension, namespace)
+    zip_rate = ops_per_second("dict(zip(numbers, (x * x for x in numbers)))", namespace)
+    rows = [
+        [label, format_rate(rate * size), f"{rate / loop_rate:.2f}x"]
+        for label, rate in [
+            ("for loop", loop_rate),
+            ("comprehension", comprehension_rate),
+            ("dict(zip(...))", zip_rate),
+        ]
+    ]
+    ratio = comprehension_rate / loop_rate
+    summary = (f"the comprehension was {ratio:.2f}x {'faster' if ratio >= 1 else 'slower'} "
+               f"than the loop for {size:,} entries.")
+    return ["method", f"entries/s (n={size:,})", "vs loop"], rows, summary
+
+
+def measure_get_vs_try():
+    """d.get(key, default) vs try/except KeyError for hits and misses."""
+    namespace = {"d": {f"key{i}": i for i in range(1_000)}, "hit": "key500", "miss": "nope"}
+    get_hit = ops_per_second("d.get(hit, 0)", namespace)
+    get_miss = ops_per_second("d.get(miss, 0)", namespace)
+    try_hit = ops_per_second("try:\n    d[hit]\nexcept KeyError:\n    0", namespace)
+    try_miss = ops_per_second("try:\n    d[miss]\nexcept KeyError:\n    0", namespace)
+    in_hit = ops_per_second("d[hit] if hit in d else 0", namespace)
+    in_miss = ops_per_second("d[miss] if miss in d else 0", namespace)
+    rows = [
+        ["d.get(key, default)", format_rate(get_hit), format_rate(get_miss)],
+        ["try/except KeyError", format_rate(try_hit), format_rate(try_miss)],
+        ["key in d check", format_rate(in_hit), format_rate(in_miss)],
+    ]
+    present = max([("get()", get_hit), ("try/except", try_hit), ("'in' check", in_hit)], key=lambda x: x[1])
+    missing = max([("get()", get_miss), ("try/except", try_miss), ("'in' check", in_miss)], key=lambda x: x[1])
+    if present[0] == missing[0]:
+        winner = f"{present[0]} was fastest for both present and missing keys"
+    else:
+        winner = f"{present[0]} was fastest for present keys and {missing[0]} for missing keys"
+    summary = f"{winner}; a raised KeyError cost {get_miss / try_miss:.1f}x a get() miss."
+    return ["method", "key present", "key missing"], rows, summary
+
+
+def measure_presizing(size=100_000):
+    """Filling a pre-sized dict vs growing an empty one entry by entry."""
+    keys = [f"key{i}" for i in range(size)]
+    key_set = frozenset(keys)
+    namespace = {"keys": keys, "key_set": key_set}
+    grown = "d = {}\nfor k in keys:\n    d[k] = 0"
+    # dict.fromkeys() sizes the table once when given a set or dict.
+    presized = "d = dict.fromkeys(key_set)\nfor k in keys:\n    d[k] = 0"
+    fromkeys = "dict.fromkeys(key_set, 0)"
+
+    def grow():
+        d = {}
+        for key in keys:
+            d[key] = 0
+        return d
+
+    rows = []
+    rates = []
+    for label, statement, build in [
+        ("grown one key at a time", grown, grow),
+        ("pre-sized, then filled", presized, lambda: dict.fromkeys(key_set)),
+        ("dict.fromkeys(set, value)", fromkeys, lambda: dict.fromkeys(key_set, 0)),
+    ]:
+        rate = ops_per_second(statement, namespace, repeat=2)
+        size_bytes = traced_bytes(build)
+        rows.append([label, format_rate(rate * size), format_bytes(size_bytes), f"{size_bytes / size:.1f} B"])
+        rates.append((rate, label))
+    best_rate, best_label = max(rates)
+    summary = f"{best_label} was fastest ({best_rate / rates[0][0]:.2f}x the key-at-a-time loop)."
+    return ["method", f"entries/s (n={size:,})", "dict memory", "bytes/entry"], rows, summary
+
+
+def main():
+    """Print every measurement."""
+    for title, measure in [
+        ("Dict vs List Lookups", measure_lookups),
+        ("Comprehension vs Loop", measure_comprehension),
+        ("get() vs try/except KeyError", measure_get_vs_try),
+        ("Pre-sized vs Grown Dictionaries", measure_presizing),
+    ]:
+        headers, rows, summary = measure()
+        print(f"\n{title}")
+        print_table(headers, rows)
+        print(f"Result: {summary}")
+
+
+if __name__ == "__main__":
+    main()
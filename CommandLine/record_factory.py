@@ -0,0 +1,334 @@
+"""
+SHARED-KEY RECORD FACTORY
+=========================
+
+The student pipeline builds one dictionary per CSV line,
+
+    students[name] = {"age": ..., "major": ..., "gpa": ..., "honors": ...}
+
+and create_user(**kwargs) merges {"active": True, "role": "user"} into
+every user. Millions of such records repeat the same key set, and each one
+carries its own hash table of keys. Parsed values repeat too: every
+record.split(",") returns a fresh "Computer Science" string and
+float(gpa) a fresh float, even though there are only a handful of majors
+and a few hundred distinct GPAs.
+
+RecordFactory still hands out plain dicts, but builds them so that they
+share as much as possible:
+
+- field names are interned with sys.intern, so every record refers to the
+  same key strings
+- on CPython, records are the __dict__ of instances of a private class
+  whose attributes are always set in the same order; such dicts are
+  split tables that share one key table (PEP 412) and only store values
+- values of the `pooled` fields go through a ValuePool, a flyweight pool
+  that returns one shared object per distinct value
+- fields missing from a call take their value from `defaults`, shared by
+  every record
+
+Records are ordinary dicts: they compare, copy, pickle and serialize like
+any other. Adding or deleting a key turns that one record back into a
+regular table, and field names that are not identifiers or start with
+"__" (or another Python implementation) fall back to plain dicts with
+interned keys.
+
+Run this file directly for a demonstration, or with --benchmark to report
+bytes per record before and after with sys.getsizeof and tracemalloc.
+"""
+
+import keyword
+import platform
+import sys
+import tracemalloc
+
+from bench_utils import format_bytes, print_table
+
+_MISSING = object()
+
+
+class ValuePool:
+    """A flyweight pool: intern(value) returns one shared object per distinct value."""
+
+    def __init__(self):
+        self._values = {}
+        self.lookups = 0
+
+    def intern(self, value):
+        """Return the pooled object equal to value, adding value if it is new.
+
+        Values must be hashable. Equal values that are not interchangeable
+        (1, 1.0 and True; 0.0 and -0.0) are pooled separately, and every
+        float NaN, which equals nothing, shares one pooled NaN.
+        """
+        self.lookups += 1
+        if value.__class__ is float and value != value:
+            return self._values.setdefault((float, "nan"), value)
+        found = self._values.setdefault(value, value)
+        if found is value:
+            return found
+        kind = value.__class__
+        # Equal is not always interchangeable: 1 == 1.0 == True, 0.0 == -0.0.
+        if found.__class__ is kind and (kind is str or kind is int or (kind is float and found != 0)
+                                        or repr(found) == repr(value)):
+            return found
+        return self._values.setdefault((kind, repr(value)), value)
+
+    def __len__(self):
+        return len(self._values)
+
+    def clear(self):
+        self._values.clear()
+
+    def __repr__(self):
+        return f"ValuePool({len(self)} values, {self.lookups:,} lookups)"
+
+
+def _can_share_keys(fields):
+    # The generated make() names its own variables with a "__" prefix, and
+    # dunder attributes such as __dict__ are special, so those fields take
+    # the plain dict path.
+    return platform.python_implementation() == "CPython" and all(
+        field.isidentifier() and not keyword.iskeyword(field) and not field.startswith("__")
+        for field in fields
+    )
+
+
+class RecordFactory:
+    """Build same-shaped dicts that share their keys and pooled values.
+
+    fields lists the keys of every record, in order. Values for fields in
+    pooled go through pool (a ValuePool, shared with other factories if
+    given). defaults supplies values for fields a call leaves out; every
+    other field is required.
+    """
+
+    def __init__(self, fields, pooled=(), defaults=None, name="Record", pool=None):
+        fields = list(dict.fromkeys(fields))
+        for field in fields:
+            if not isinstance(field, str):
+                raise TypeError(f"field names must be str, got {field!r}")
+        fields = [sys.intern(field) for field in fields]
+        defaults = dict(defaults or {})
+        pooled = set(pooled)
+        for field in [*pooled, *defaults]:
+            if field not in fields:
+                raise ValueError(f"{field!r} is not one of the fields {fields!r}")
+        self.name = name
+        self.fields = tuple(fields)
+        self.pooled = frozenset(pooled)
+        self.defaults = defaults
+        self.pool = ValuePool() if pool is None else pool
+        self.shares_keys = _can_share_keys(fields)
+        if self.shares_keys:
+            self.make = self._make_shared_builder()
+        else:
+            self.make = self._make_plain_builder()
+
+    def _make_shared_builder(self):
+        """Generate make(*, field, ...) returning the __dict__ of a fresh instance."""
+        holder = type(self.name, (), {"__slots__": ("__dict__",)})
+        namespace = {"__new": object.__new__, "__holder": holder, "__intern": self.pool.intern}
+        params = []
+        for index, field in enumerate(self.fields):
+            if field in self.defaults:
+                namespace[f"__default_{index}"] = self.defaults[field]
+                params.append(f"{field}=__default_{index}")
+            else:
+                params.append(field)
+        assignments = "".join(
+            f"    __record.{field} = __intern({field})\n" if field in self.pooled
+            else f"    __record.{field} = {field}\n"
+            for field in self.fields
+        )
+        source = (
+            f"def make(*, {', '.join(params)}):\n"
+            f"    __record = __new(__holder)\n"
+            f"{assignments}"
+            f"    return __record.__dict__\n"
+        ) if self.fields else "def make():\n    return __new(__holder).__dict__\n"
+        exec(source, namespace)
+        return namespace["make"]
+
+    def _make_plain_builder(self):
+        """Build plain dicts with interned keys, for fields that cannot be attributes."""
+        fields = self.fields
+        defaults = self.defaults
+        pooled = self.pooled
+        intern = self.pool.intern
+
+        def make(**values):
+            record = {}
+            for field in fields:
+                value = values.pop(field, _MISSING)
+                if value is _MISSING:
+                    value = defaults.get(field, _MISSING)
+                    if value is _MISSING:
+                        raise TypeError(f"make() missing required field: {field!r}")
+                elif field in pooled:
+                    value = intern(value)
+                record[field] = value
+            if values:
+                raise TypeError(f"make() got unexpected fields: {', '.join(map(repr, values))}")
+            return record
+
+        return make
+
+    def __call__(self, **values):
+        return self.make(**values)
+
+    def from_dict(self, mapping):
+        """Rebuild an existing record dictionary through the factory."""
+        return self.make(**mapping)
+
+    def convert(self, records):
+        """Rebuild a list (or a dict) of record dictionaries; a dict keeps its keys."""
+        make = self.make
+        if isinstance(records, dict):
+            return {key: make(**record) for key, record in records.items()}
+        return [make(**record) for record in records]
+
+    def __repr__(self):
+        return (f"RecordFactory({self.name!r}, fields={list(self.fields)!r}, "
+                f"pooled={sorted(self.pooled)!r}, shares_keys={self.shares_keys})")
+
+
+# =============================================================================
+# DEMONSTRATION AND BENCHMARKS
+# =============================================================================
+
+def student_factory(pool=None, pooled=("major", "gpa")):
+    """A factory for the student pipeline's records."""
+    return RecordFactory(["age", "major", "gpa", "honors"], pooled=pooled, name="Student", pool=pool)
+
+
+def user_factory(pool=None, pooled=("role",)):
+    """A factory for create_user(), with the same defaults."""
+    return RecordFactory(["name", "email", "role", "active"], pooled=pooled,
+                         defaults={"active": True, "role": "user"}, name="User", pool=pool)
+
+
+def process_students(raw_records, make=None):
+    """The Data Processing Pipeline, with an optional record builder in place of a dict display."""
+    students = {}
+    for record in raw_records:
+        name, age, major, gpa = record.split(",")
+        gpa = float(gpa)
+        if make is None:
+            students[name] = {"age": int(age), "major": major, "gpa": gpa, "honors": gpa >= 3.8}
+        else:
+            students[name] = make(age=int(age), major=major, gpa=gpa, honors=gpa >= 3.8)
+    return students
+
+
+def make_user_rows(count):
+    """CSV-style user rows; most have no explicit role or active flag."""
+    rows = []
+    for i in range(count):
+        role = "admin" if i % 50 == 0 else "user" if i % 5 == 0 else ""
+        rows.append(f"user_{i},user_{i}@example.com,{role},{'no' if i % 20 == 0 else ''}")
+    return rows
+
+
+def process_users(rows, create_user=None):
+    """Parse user rows through create_user (the guide's, by default)."""
+    if create_user is None:
+        def create_user(**kwargs):
+            defaults = {"active": True, "role": "user"}
+            return {**defaults, **kwargs}
+    users = []
+    for row in rows:
+        name, email, role, active = row.split(",")
+        fields = {"name": name, "email": email}
+        if role:
+            fields["role"] = role
+        if active:
+            fields["active"] = active != "no"
+        users.append(create_user(**fields))
+    return users
+
+
+def _traced(build):
+    """Return (result, bytes still allocated by build)."""
+    tracemalloc.start()
+    try:
+        result = build()
+        size, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def _measure(label, build, count):
+    records, size = _traced(build)
+    sample = next(iter(records.values() if isinstance(records, dict) else records))
+    return records, [label, f"{sys.getsizeof(sample)} B", format_bytes(size), f"{size / count:.0f} B"]
+
+
+def benchmark(count=200_000):
+    """Report bytes per record for dicts, shared-key records and pooled records."""
+    from guide_data import make_raw_records
+
+    raw = make_raw_records(count)
+    rows = []
+    results = []
+    for label, make in [
+        ("dict display", None),
+        ("factory, keys shared", student_factory(pooled=()).make),
+        ("factory + value pool", student_factory().make),
+    ]:
+        students, row = _measure(label, lambda: process_students(raw, make), count)
+        results.append(students)
+        rows.append(row)
+    assert results[0] == results[1] == results[2]
+    print(f"{count:,} student records (the {count:,}-entry outer dict and its name keys included)")
+    print_table(["records built by", "getsizeof(record)", "tracemalloc", "per record"], rows)
+
+    rows = []
+    results = []
+    user_rows = make_user_rows(count)
+    for label, create_user in [
+        ("create_user(**kwargs)", None),
+        ("factory, keys shared", user_factory(pooled=()).make),
+        ("factory + value pool", user_factory().make),
+    ]:
+        users, row = _measure(label, lambda: process_users(user_rows, create_user), count)
+        results.append(users)
+        rows.append(row)
+    assert results[0] == results[1] == results[2]
+    print(f"\n{count:,} users (the list and the name and email strings included)")
+    print_table(["records built by", "getsizeof(record)", "tracemalloc", "per record"], rows)
+    print("getsizeof counts the record's own table; tracemalloc also counts values the "
+          "records do not share.")
+
+
+def demo():
+    """Build the guide's students and users through factories."""
+    from guide_data import make_raw_records
+
+    pool = ValuePool()
+    make_student = student_factory(pool)
+    students = process_students(make_raw_records(1_000), make_student.make)
+    print(make_student)
+    print("Alice:", students["Alice"])
+    print("A plain dict after all:", type(students["Alice"]) is dict,
+          "| equal to the dict display:", students == process_students(make_raw_records(1_000)))
+    print("Majors shared:", students["student_0"]["major"] is students["student_3"]["major"])
+    print(f"getsizeof: {sys.getsizeof(students['Alice'])} B per record, "
+          f"{sys.getsizeof(dict(students['Alice']))} B for a copy")
+
+    make_user = user_factory(pool)
+    user1 = make_user(name="Alice", email="alice@example.com")
+    user2 = make_user(name="Bob", email="bob@example.com", role="admin", active=False)
+    print("\nUser 1:", user1)
+    print("User 2:", user2)
+    print(pool, "shared by both factories")
+
+    user1["last_login"] = "today"
+    print(f"\nAfter adding a key, user 1 is a regular table again: {sys.getsizeof(user1)} B")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        demo()
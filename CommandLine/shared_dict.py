@@ -0,0 +1,366 @@
+"""
+SHARED-MEMORY DICTIONARY
+========================
+
+Lookup tables such as fruit_prices and prices in the guide are rebuilt (or
+unpickled) in every worker process a workload fans out to, so N workers
+hold N copies. SharedDict lays a read-mostly str -> number table out in one
+multiprocessing.shared_memory block that any number of processes map
+without copying:
+
+    header | hashes[capacity] | key_lengths[capacity] | key_offsets[capacity]
+           | values[capacity] | key arena
+
+- open addressing with linear probing over `capacity` slots (a power of
+  two, kept at most 2/3 full); each slot is a 32-bit key hash, a key
+  length + 1 (0 marks an empty slot), a 64-bit offset into the arena and a
+  fixed-width 8-byte value (float64 or int64)
+- keys are stored UTF-8 encoded, back to back, in the arena
+- hashes are zlib.crc32 of the key bytes, because str hashes differ between
+  processes (PYTHONHASHSEED)
+
+The table is built once by SharedDict.create() and then attached by name in
+other processes with SharedDict.attach(). Keys cannot be added afterwards,
+but set_value() changes the value of an existing key in place; each value
+is a single aligned 8-byte store, so readers see the old or the new value.
+
+A SharedDict lookup runs in Python and is several times slower than a dict
+lookup; the gain is memory. Run this file directly for a demonstration, or
+with --benchmark to compare per-worker memory and lookup speed against
+giving every worker its own dict.
+"""
+
+import struct
+import sys
+from collections.abc import Mapping
+from multiprocessing import resource_tracker, shared_memory
+from zlib import crc32
+
+from bench_utils import format_bytes, format_seconds, print_table
+
+MAGIC = b"SHDICT01"
+# magic, capacity, count, arena offset, arena size, value typecode
+HEADER = struct.Struct("<8sQQQQ8s")
+MAX_LOAD = 2 / 3
+VALUE_TYPES = {"d": float, "q": int}
+
+
+def _capacity_for(count):
+    capacity = 8
+    while capacity * MAX_LOAD < count:
+        capacity *= 2
+    return capacity
+
+
+def _layout(capacity):
+    """Return the byte offsets of the hash, length, offset and value arrays and the arena."""
+    hashes = HEADER.size + (-HEADER.size % 8)
+    lengths = hashes + 4 * capacity
+    offsets = lengths + 4 * capacity
+    values = offsets + 8 * capacity
+    arena = values + 8 * capacity
+    return hashes, lengths, offsets, values, arena
+
+
+def _attach_block(name):
+    """Open an existing block without handing it to this process's resource tracker."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before 3.13 attaching registers the block with the resource tracker,
+    # which unlinks it when this process exits, even though the creator
+    # still owns it.
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class SharedDict(Mapping):
+    """A read-mostly str -> float/int hash table in shared memory."""
+
+    def __init__(self, block, owner=False):
+        self._block = block
+        self._owner = owner
+        buf = block.buf
+        magic, capacity, count, arena, arena_size, typecode = HEADER.unpack_from(buf)
+        if magic != MAGIC:
+            raise ValueError(f"shared memory block {block.name!r} does not hold a SharedDict")
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._count = count
+        self.value_type = typecode.rstrip(b"\0").decode("ascii")
+        hashes, lengths, offsets, values, _arena = _layout(capacity)
+        self._hashes = buf[hashes:lengths].cast("I")
+        self._lengths = buf[lengths:offsets].cast("I")
+        self._offsets = buf[offsets:values].cast("Q")
+        self._values = buf[values:arena].cast(self.value_type)
+        self._arena = buf[arena:arena + arena_size]
+
+    @classmethod
+    def create(cls, data, name=None, value_type=None):
+        """Build a table from a mapping of str keys to numbers in a new shared memory block.
+
+        value_type is "d" (float64) or "q" (int64); by default "q" when
+        every value is an int and "d" otherwise.
+        """
+        encoded = [(key.encode("utf-8"), value) for key, value in data.items()]
+        if value_type is None:
+            value_type = "q" if all(type(value) is int for _key, value in encoded) else "d"
+        if value_type not in VALUE_TYPES:
+            raise ValueError(f"value_type must be one of {', '.join(VALUE_TYPES)}, got {value_type!r}")
+        allowed = (int,) if value_type == "q" else (int, float)
+        for key, value in encoded:
+            if not isinstance(value, allowed):
+                raise TypeError(f"value for {key.decode('utf-8')!r} must be "
+                                f"{' or '.join(kind.__name__ for kind in allowed)}, got {type(value).__name__}")
+        capacity = _capacity_for(len(encoded))
+        arena_size = sum(len(key) for key, _value in encoded)
+        hashes, lengths, offsets, values, arena = _layout(capacity)
+        block = shared_memory.SharedMemory(name=name, create=True, size=max(1, arena + arena_size))
+        views = []
+        try:
+            buf = block.buf
+            HEADER.pack_into(buf, 0, MAGIC, capacity, len(encoded), arena, arena_size,
+                             value_type.encode("ascii"))
+            views = [buf[hashes:lengths].cast("I"), buf[lengths:offsets].cast("I"),
+                     buf[offsets:values].cast("Q"), buf[values:arena].cast(value_type)]
+            hash_array, length_array, offset_array, value_array = views
+            mask = capacity - 1
+            position = arena
+            for key, value in encoded:
+                key_hash = crc32(key)
+                index = key_hash & mask
+                while length_array[index]:
+                    index = (index + 1) & mask
+                hash_array[index] = key_hash
+                length_array[index] = len(key) + 1
+                offset_array[index] = position - arena
+                value_array[index] = value
+                buf[position:position + len(key)] = key
+                position += len(key)
+        except BaseException:
+            # The views export the buffer; close() fails while any is alive.
+            for view in views:
+                view.release()
+            block.close()
+            block.unlink()
+            raise
+        for view in views:
+            view.release()
+        return cls(block, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """Map a table another process created, without copying it."""
+        return cls(_attach_block(name))
+
+    @property
+    def name(self):
+        """The shared memory block name to pass to attach()."""
+        return self._block.name
+
+    @property
+    def nbytes(self):
+        return self._block.size
+
+    def _find(self, key):
+        """Return the slot index holding key, or -1."""
+        try:
+            key_bytes = key.encode("utf-8")
+        except AttributeError:
+            return -1
+        key_hash = crc32(key_bytes)
+        size = len(key_bytes) + 1
+        hashes = self._hashes
+        lengths = self._lengths
+        mask = self._mask
+        index = key_hash & mask
+        while True:
+            length = lengths[index]
+            if not length:
+                return -1
+            if length == size and hashes[index] == key_hash:
+                start = self._offsets[index]
+                if self._arena[start:start + size - 1] == key_bytes:
+                    return index
+            index = (index + 1) & mask
+
+    def __getitem__(self, key):
+        index = self._find(key)
+        if index < 0:
+            raise KeyError(key)
+        return self._values[index]
+
+    def get(self, key, default=None):
+        index = self._find(key)
+        return default if index < 0 else self._values[index]
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def set_value(self, key, value):
+        """Change the value of an existing key in place, visible to every process."""
+        index = self._find(key)
+        if index < 0:
+            raise KeyError(key)
+        self._values[index] = value
+
+    def __iter__(self):
+        lengths = self._lengths
+        offsets = self._offsets
+        arena = self._arena
+        for index in range(self._capacity):
+            length = lengths[index]
+            if length:
+                start = offsets[index]
+                yield str(arena[start:start + length - 1], "utf-8")
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        """Unmap the block in this process; the creator should also call unlink()."""
+        for view in (self._hashes, self._lengths, self._offsets, self._values, self._arena):
+            view.release()
+        self._block.close()
+
+    def unlink(self):
+        """Free the shared memory block once every process has closed it."""
+        self._block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __repr__(self):
+        return (f"SharedDict(name={self.name!r}, entries={self._count:,}, "
+                f"value_type={self.value_type!r}, size={format_bytes(self.nbytes)})")
+
+
+# =============================================================================
+# DEMONSTRATION AND BENCHMARKS
+# =============================================================================
+
+_worker_table = None
+
+
+def _attach_worker(name):
+    global _worker_table
+    _worker_table = SharedDict.attach(name)
+
+
+def _copy_worker(table):
+    global _worker_table
+    _worker_table = table
+
+
+def _resident_memory():
+    """Return (private, shared) resident bytes of this process, or (None, None) off Linux."""
+    sizes = {}
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                field, _, value = line.partition(":")
+                if field in ("RssAnon", "RssShmem"):
+                    sizes[field] = int(value.split()[0]) * 1024
+    except OSError:
+        pass
+    return sizes.get("RssAnon"), sizes.get("RssShmem")
+
+
+def _sum_prices(keys):
+    """Look up keys in this worker's table; return (total, (private, shared) resident bytes)."""
+    total = 0.0
+    for key in keys:
+        total += _worker_table[key]
+    return total, _resident_memory()
+
+
+def make_prices(count=1_000_000):
+    """A large version of the guide's fruit_prices table."""
+    return {f"fruit_{i}": round(0.25 + (i * 7919 % 1000) / 100, 2) for i in range(count)}
+
+
+def run_workers(initializer, initargs, keys, workers):
+    """Run _sum_prices on `workers` spawned processes; return (totals, memory per worker, seconds)."""
+    import multiprocessing
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    start = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=initializer,
+                             initargs=initargs) as executor:
+        results = list(executor.map(_sum_prices, [keys] * workers))
+    elapsed = time.perf_counter() - start
+    return [total for total, _memory in results], [memory for _total, memory in results], elapsed
+
+
+def benchmark(count=1_000_000, workers=4, lookups=200_000):
+    """Compare a dict copy per worker with one shared table."""
+    import random
+    import tracemalloc
+
+    from bench_utils import best_time
+
+    tracemalloc.start()
+    prices = make_prices(count)
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    keys = random.Random(1).sample(list(prices), lookups)
+
+    with SharedDict.create(prices) as table:
+        dict_lookup = best_time(lambda: [prices[key] for key in keys], repeat=3) / lookups
+        shared_lookup = best_time(lambda: [table[key] for key in keys], repeat=3) / lookups
+        print(f"{count:,} prices; {workers} spawned workers each looking up {lookups:,} keys")
+        print_table(["table", "size", "lookup"], [
+            ["dict", format_bytes(dict_bytes), format_seconds(dict_lookup)],
+            ["SharedDict", format_bytes(table.nbytes), format_seconds(shared_lookup)],
+        ])
+
+        rows = []
+        totals = []
+        for label, initializer, initargs in [
+            ("a pickled dict each", _copy_worker, (prices,)),
+            ("the shared table", _attach_worker, (table.name,)),
+        ]:
+            worker_totals, memory, elapsed = run_workers(initializer, initargs, keys, workers)
+            totals.append(worker_totals)
+            private = [size for size, _shared in memory]
+            shared = [size for _private, size in memory]
+            if None in private:
+                rows.append([label, "n/a", "n/a", format_seconds(elapsed)])
+                continue
+            rows.append([label, format_bytes(max(private)), format_bytes(max(shared)),
+                         format_bytes(sum(private)), format_seconds(elapsed)])
+        assert totals[0] == totals[1]
+        print()
+        print_table(["workers get", "private RSS/worker", "shared RSS/worker", "private RSS, all",
+                     "wall time"], rows)
+        print(f"Shared pages are in RAM once however many workers map them "
+              f"({format_bytes(table.nbytes)} for this table).")
+
+
+def demo():
+    """Share the guide's fruit_prices with a worker process."""
+    fruit_prices = {"apple": 0.50, "banana": 0.25, "orange": 0.75, "grape": 2.00}
+    with SharedDict.create(fruit_prices) as table:
+        print(table)
+        print("apple:", table["apple"], "| kiwi:", table.get("kiwi", "not stocked"))
+        totals, _memory, _elapsed = run_workers(_attach_worker, (table.name,), ["apple", "grape"], 1)
+        print("Worker process priced an apple and a grape at", totals[0])
+        table.set_value("banana", 0.30)
+        print("After a price change:", dict(table.items()))
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        demo()
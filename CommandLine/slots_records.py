@@ -0,0 +1,298 @@
+"""
+SCHEMA-INFERRED RECORD CLASSES
+==============================
+
+Many structures in the guide are collections of same-shaped dictionaries:
+the student records, the employee leaves of `company`, the inventory item
+details and the notebook's vegan_recipes list. Each of those dictionaries
+carries its own hash table even though every record has the same keys.
+
+This module inspects a sample of such dictionaries, generates a record
+class for the shape - a __slots__ class or a namedtuple - and converts
+whole collections in bulk. Records convert back with to_dict(), and
+Record.from_dict() builds one from a dictionary.
+
+Run this file directly for a demonstration, or with --benchmark to report
+memory before and after conversion with tracemalloc.
+"""
+
+import keyword
+import sys
+import tracemalloc
+from collections import namedtuple
+from itertools import islice
+
+from bench_utils import format_bytes, print_table
+
+SLOTS = "slots"
+NAMEDTUPLE = "namedtuple"
+
+
+def infer_fields(records, sample_size=100):
+    """Infer field names from a sample of dictionaries.
+
+    Returns (fields, optional): all keys in first-seen order, and the keys
+    missing from at least one sampled record.
+    """
+    sample = list(islice(iter(records), sample_size))
+    if not sample:
+        raise ValueError("cannot infer a schema from an empty collection")
+    fields = {}
+    for record in sample:
+        fields.update(dict.fromkeys(record))
+    optional = {field for field in fields if any(field not in record for record in sample)}
+    return list(fields), optional
+
+
+# Methods every record class defines; a field of the same name would clash.
+_RESERVED_NAMES = frozenset({"to_dict", "from_dict"})
+
+
+def _check_field_names(fields):
+    for field in fields:
+        if not isinstance(field, str) or not field.isidentifier() or keyword.iskeyword(field):
+            raise ValueError(f"field name {field!r} is not a valid identifier")
+        if field.startswith("_"):
+            raise ValueError(f"field name {field!r} must not start with an underscore")
+        if field in _RESERVED_NAMES:
+            raise ValueError(f"field name {field!r} is reserved for a record class method")
+
+
+def _check_class_name(name):
+    # The name is pasted into generated source, so it must be a plain identifier.
+    if not isinstance(name, str) or not name.isidentifier() or keyword.iskeyword(name):
+        raise ValueError(f"record class name {name!r} is not a valid identifier")
+
+
+def _make_slots_class(name, fields, optional):
+    """Generate a __slots__ class with __init__, to_dict and from_dict.
+
+    Optional fields left out of __init__ stay unset: reading one gives
+    None, and to_dict() leaves it out, so records round-trip exactly.
+    """
+    params = ", ".join(f"{field}=_UNSET" if field in optional else field for field in fields)
+    assignments = "".join(
+        f"        if {field} is not _UNSET:\n            self.{field} = {field}\n" if field in optional
+        else f"        self.{field} = {field}\n"
+        for field in fields
+    ) or "        pass\n"
+    items = "".join(
+        f"        try:\n"
+        f"            data[{field!r}] = _get(self, {field!r})\n"
+        f"        except AttributeError:\n"
+        f"            pass\n" if field in optional
+        else f"        data[{field!r}] = self.{field}\n"
+        for field in fields
+    )
+    source = (
+        f"class {name}:\n"
+        f"    __slots__ = {tuple(fields)!r}\n"
+        f"    def __init__(self{', *, ' + params if fields else ''}):\n"
+        f"{assignments}"
+        f"    def __getattr__(self, name):\n"
+        f"        if name in _OPTIONAL:\n"
+        f"            return None\n"
+        f"        raise AttributeError(f'{{type(self).__name__!r}} object has no attribute {{name!r}}')\n"
+        f"    def to_dict(self):\n"
+        f"        data = {{}}\n"
+        f"{items}"
+        f"        return data\n"
+        f"    @classmethod\n"
+        f"    def from_dict(cls, data):\n"
+        f"        return cls(**data)\n"
+        f"    def __eq__(self, other):\n"
+        f"        if type(other) is not type(self):\n"
+        f"            return NotImplemented\n"
+        f"        return self.to_dict() == other.to_dict()\n"
+        f"    __hash__ = None\n"
+        f"    def __repr__(self):\n"
+        f"        return f'{name}(' + ', '.join(f'{{key}}={{value!r}}' for key, value in self.to_dict().items()) + ')'\n"
+    )
+    namespace = {
+        "__name__": f"slots_records_{name}",
+        "_UNSET": object(),
+        "_OPTIONAL": frozenset(optional),
+        "_get": object.__getattribute__,
+    }
+    exec(source, namespace)
+    return namespace[name]
+
+
+def _make_namedtuple_class(name, fields, optional):
+    """Generate a namedtuple class with to_dict and from_dict.
+
+    A tuple has no unset state, so missing optional fields are None and
+    to_dict() leaves out optional fields that are None.
+    """
+    # namedtuple defaults can only cover trailing fields; from_dict fills in
+    # missing optional fields either way.
+    trailing = 0
+    for field in reversed(fields):
+        if field not in optional:
+            break
+        trailing += 1
+    base = namedtuple(name, fields, defaults=[None] * trailing if trailing else None)
+    getters = [(field, field in optional) for field in fields]
+    known = frozenset(fields)
+
+    def to_dict(self):
+        return {
+            field: value
+            for (field, is_optional), value in zip(getters, self)
+            if not (is_optional and value is None)
+        }
+
+    def from_dict(cls, data):
+        unknown = data.keys() - known
+        if unknown:
+            raise TypeError(f"{name} has no fields {', '.join(map(repr, sorted(unknown, key=str)))}")
+        return cls(*[data.get(field) if is_optional else data[field] for field, is_optional in getters])
+
+    return type(name, (base,), {
+        "__slots__": (),
+        "to_dict": to_dict,
+        "from_dict": classmethod(from_dict),
+    })
+
+
+def make_record_class(name, fields, optional=(), kind=SLOTS):
+    """Create a record class for the given field names.
+
+    kind is "slots" (mutable, attribute per field, keyword-only
+    constructor) or "namedtuple" (immutable, also indexable). Fields in
+    optional may be left out and read as None. from_dict() raises
+    TypeError for keys that are not fields.
+    """
+    fields = list(fields)
+    optional = set(optional)
+    _check_class_name(name)
+    _check_field_names(fields)
+    if kind == SLOTS:
+        return _make_slots_class(name, fields, optional)
+    if kind == NAMEDTUPLE:
+        return _make_namedtuple_class(name, fields, optional)
+    raise ValueError(f"unknown record kind: {kind!r}")
+
+
+def record_class_for(records, name="Record", kind=SLOTS, sample_size=100):
+    """Infer a schema from a sample of records and create a class for it."""
+    fields, optional = infer_fields(_values(records), sample_size)
+    return make_record_class(name, fields, optional, kind)
+
+
+def _values(records):
+    return records.values() if isinstance(records, dict) else records
+
+
+def convert(records, record_class=None, name="Record", kind=SLOTS):
+    """Convert a list (or a dict) of same-shaped dicts into record objects.
+
+    A dict of records such as {name: {...}} keeps its keys. When no
+    record_class is given, one is inferred from the records.
+    """
+    if record_class is None:
+        record_class = record_class_for(records, name, kind)
+    from_dict = record_class.from_dict
+    if isinstance(records, dict):
+        return {key: from_dict(record) for key, record in records.items()}
+    return [from_dict(record) for record in records]
+
+
+def to_dicts(records):
+    """Convert record objects (in a list or a dict) back into dictionaries."""
+    if isinstance(records, dict):
+        return {key: record.to_dict() for key, record in records.items()}
+    return [record.to_dict() for record in records]
+
+
+# =============================================================================
+# DEMONSTRATION AND BENCHMARKS
+# =============================================================================
+
+def _traced_size(build):
+    """Return (result, bytes still allocated by build)."""
+    tracemalloc.start()
+    try:
+        result = build()
+        size, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def make_students(count):
+    """Build the guide's student records at scale."""
+    majors = ["Computer Science", "Mathematics", "Physics"]
+    return {
+        f"student_{i}": {
+            "age": 18 + i % 10,
+            "major": majors[i % 3],
+            "gpa": 2.0 + (i % 200) / 100,
+            "honors": i % 200 >= 180,
+        }
+        for i in range(count)
+    }
+
+
+# The per-record saving the conversion aims for ("several times" smaller).
+TARGET_REDUCTION = 3.0
+
+
+def benchmark(count=200000):
+    """Report memory before and after converting student records."""
+    students = make_students(count)
+
+    def measure(build):
+        # Keys and values are shared with `students`, so tracemalloc sees only
+        # the new containers; the outer name -> record dict is reported apart.
+        result, size = _traced_size(build)
+        outer = sys.getsizeof(result)
+        return result, size, (size - outer) / count
+
+    _copy, dict_bytes, dict_record = measure(lambda: {name: dict(record) for name, record in students.items()})
+    rows = [["dict", format_bytes(dict_bytes), f"{dict_record:.0f} B", "1.0x"]]
+    shortfalls = []
+    for kind in (SLOTS, NAMEDTUPLE):
+        record_class = record_class_for(students, "Student", kind)
+        converted, size, per_record = measure(lambda: convert(students, record_class))
+        assert to_dicts(converted) == students
+        reduction = dict_record / per_record
+        rows.append([kind, format_bytes(size), f"{per_record:.0f} B", f"{reduction:.1f}x"])
+        if reduction < TARGET_REDUCTION:
+            shortfalls.append(f"{kind} ({reduction:.1f}x)")
+    print(f"{count:,} student records (memory includes the outer name -> record dict, "
+          f"{format_bytes(sys.getsizeof(students))}; per record counts the record alone)")
+    print_table(["record type", "memory", "per record", "reduction"], rows)
+    if shortfalls:
+        print(f"Short of the {TARGET_REDUCTION:.0f}x per-record target: {', '.join(shortfalls)}")
+
+
+def demo():
+    """Convert the notebook's vegan_recipes list into slotted records."""
+    vegan_recipes = [
+        {"recipe_type": "salad",
+         "names": ["Quinoa Salad", "Chickpea Salad"],
+         "ingredients": [["quinoa", "cucumber", "tomato"], ["chickpeas", "red onion", "parsley"]]},
+        {"recipe_type": "soup",
+         "names": ["Tomato Basil Soup", "Lentil Soup"],
+         "ingredients": [["tomatoes", "basil", "onion"], ["lentils", "carrots", "celery"]]},
+    ]
+    Recipe = record_class_for(vegan_recipes, "Recipe")
+    recipes = convert(vegan_recipes, Recipe)
+    print("Record class fields:", Recipe.__slots__)
+    for recipe in recipes:
+        print(f"  {recipe.recipe_type}: {', '.join(recipe.names)}")
+    print("Round trip matches:", to_dicts(recipes) == vegan_recipes)
+
+    students = make_students(3)
+    Student = record_class_for(students, "Student", kind=NAMEDTUPLE)
+    print("\nStudents as namedtuples:")
+    for name, student in convert(students, Student).items():
+        print(f"  {name}: {student}")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        demo()
@@ -0,0 +1,185 @@
+"""
+STREAMING STUDENT RECORD INGESTION
+==================================
+
+A constant-memory version of the guide's Data Processing Pipeline. Instead
+of building a raw_records list and one dictionary per student, records are
+read from a file or stdin as a stream, parsed in chunks, and folded into
+running statistics (average GPA, honors count) that never hold the dataset.
+
+Input lines have the guide's "name,age,major,gpa" format. Rows that do not
+have exactly four fields, an integer age and a numeric GPA are counted and
+skipped.
+
+Usage:
+    python student_stream.py exports/students.csv
+    zcat students.csv.gz | python student_stream.py -
+    python student_stream.py --synthetic 1000000
+"""
+
+import argparse
+import csv
+import sys
+import time
+from itertools import islice
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from bench_utils import format_bytes, format_seconds
+
+HONORS_THRESHOLD = 3.8
+
+
+class RunningStats:
+    """Incrementally updated statistics over student records."""
+
+    def __init__(self, honors_threshold=HONORS_THRESHOLD):
+        self.honors_threshold = honors_threshold
+        self.count = 0
+        self.gpa_total = 0.0
+        self.honors_count = 0
+        self.skipped = 0
+
+    def update(self, rows):
+        """Fold a chunk of parsed CSV rows into the statistics."""
+        gpas = []
+        for row in rows:
+            if len(row) != 4:
+                self.skipped += 1
+                continue
+            try:
+                int(row[1])
+                gpa = float(row[3])
+            except ValueError:
+                self.skipped += 1
+                continue
+            gpas.append(gpa)
+        threshold = self.honors_threshold
+        self.count += len(gpas)
+        self.gpa_total += sum(gpas)
+        self.honors_count += sum(gpa >= threshold for gpa in gpas)
+
+    @property
+    def average_gpa(self):
+        """Average GPA of the records seen so far (None before the first record)."""
+        return self.gpa_total / self.count if self.count else None
+
+    def as_dict(self):
+        """Return the statistics as a plain dictionary."""
+        return {
+            "records": self.count,
+            "skipped": self.skipped,
+            "average_gpa": self.average_gpa,
+            "honors_count": self.honors_count,
+        }
+
+
+def _check_chunk_size(chunk_size):
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+
+def iter_chunks(lines, chunk_size=10000):
+    """Parse CSV lines lazily and yield them as lists of at most chunk_size rows."""
+    _check_chunk_size(chunk_size)
+    rows = csv.reader(lines)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def open_source(source):
+    """Open a path for streaming text reads; "-" means stdin."""
+    if source == "-":
+        return sys.stdin
+    return open(source, newline="", encoding="utf-8")
+
+
+def peak_memory():
+    """Peak resident set size of this process in bytes, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def ingest(lines, chunk_size=10000, stats=None):
+    """Stream lines into running statistics and return (stats, report)."""
+    _check_chunk_size(chunk_size)
+    stats = RunningStats() if stats is None else stats
+    start = time.perf_counter()
+    for chunk in iter_chunks(lines, chunk_size):
+        stats.update(chunk)
+    elapsed = time.perf_counter() - start
+    rows = stats.count + stats.skipped
+    report = {
+        "rows": rows,
+        "seconds": elapsed,
+        "rows_per_second": rows / elapsed if elapsed else None,
+        "peak_memory_bytes": peak_memory(),
+    }
+    return stats, report
+
+
+def synthetic_lines(count):
+    """Generate guide-style student CSV lines without storing them."""
+    majors = ("Computer Science", "Mathematics", "Physics", "Biology")
+    for i in range(count):
+        yield f"student_{i},{18 + i % 10},{majors[i % 4]},{2.0 + (i * 37 % 200) / 100:.2f}\n"
+
+
+def print_report(stats, report):
+    """Print the statistics and throughput report."""
+    print("Statistics:")
+    if stats.count:
+        print(f"  Average GPA: {stats.average_gpa:.2f}")
+    print(f"  Honors students: {stats.honors_count:,}/{stats.count:,}")
+    if stats.skipped:
+        print(f"  Skipped rows: {stats.skipped:,}")
+    print("\nIngestion:")
+    print(f"  Rows: {report['rows']:,} in {format_seconds(report['seconds'])}")
+    if report["rows_per_second"]:
+        print(f"  Throughput: {report['rows_per_second']:,.0f} rows/sec")
+    if report["peak_memory_bytes"] is not None:
+        print(f"  Peak memory (RSS): {format_bytes(report['peak_memory_bytes'])}")
+
+
+def positive_int(text):
+    """argparse type for counts that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Stream student CSV records into running statistics.")
+    parser.add_argument("source", nargs="?", default="-", help="CSV file to read, or - for stdin (default)")
+    parser.add_argument("--chunk-size", type=positive_int, default=10000, help="rows parsed per chunk")
+    parser.add_argument("--skip-header", action="store_true", help="ignore the first line")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="ingest N generated records instead of a file")
+    args = parser.parse_args(argv)
+
+    if args.synthetic is not None:
+        stats, report = ingest(synthetic_lines(args.synthetic), args.chunk_size)
+    else:
+        stream = open_source(args.source)
+        try:
+            if args.skip_header:
+                next(stream, None)
+            stats, report = ingest(stream, args.chunk_size)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+    print_report(stats, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+"""
+VECTORIZED DICTIONARY COMPREHENSIONS
+====================================
+
+The guide's dictionary_comprehensions() builds every result one element at
+a time in the interpreter:
+
+    squares = {x: x**2 for x in range(1, 6)}
+    discounted = {item: price * 0.9 for item, price in prices.items()}
+    grade_letters = {name: ("A" if grade >= 90 else "B" if grade >= 80 else "C") ...}
+    in_stock = {item: details["price"] for item, details in inventory.items() if details["stock"] > 0}
+
+For tables with millions of keys, VectorDict keeps the keys in a separate
+index and the values in one NumPy array, so the same transforms run as
+batch operations:
+
+- arithmetic (+, -, *, /, //, %, **, unary -, abs()) with a scalar, an
+  array or another VectorDict, and map() for any vectorized function
+- <, <=, > and >= compare element-wise and return a boolean VectorDict;
+  eq() and ne() do the same for == and !=, which compare whole mappings
+- select() maps conditions to choices with np.select (the A/B/C grades)
+- filter() keeps the keys where a boolean VectorDict or mask is true (the
+  in_stock example)
+- sum(), mean(), min(), max() and count() reduce the values
+
+Results of arithmetic, comparisons and select() share their operand's
+index, so no key is hashed again. VectorDict is a read-only Mapping: d[key],
+get(), `in`, len(), iteration and == behave like a dict, values come back
+as Python scalars, and to_dict() converts the whole table in one step.
+Operations between VectorDicts with different indexes line up values by
+key, like {key: a[key] + b[key] for key in a} would.
+
+NumPy is optional for the rest of the toolkit but required here.
+
+Run this file directly for a demonstration, or with --benchmark to time
+the guide's comprehensions against VectorDict on a million keys.
+"""
+
+import operator
+import sys
+from collections.abc import Mapping
+
+from bench_utils import best_time, format_seconds, print_table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("VectorDict needs NumPy; install it with: pip install numpy")
+
+
+class _KeyIndex:
+    """An ordered set of keys: an object array plus a lazily built key -> position dict."""
+
+    __slots__ = ("keys", "_positions")
+
+    def __init__(self, keys, positions=None):
+        self.keys = keys
+        self._positions = positions
+
+    @classmethod
+    def from_keys(cls, keys):
+        keys = list(keys)
+        positions = dict(zip(keys, range(len(keys))))
+        if len(positions) != len(keys):
+            raise ValueError("VectorDict keys must be unique")
+        return cls(np.fromiter(keys, dtype=object, count=len(keys)), positions)
+
+    @property
+    def positions(self):
+        if self._positions is None:
+            keys = self.keys.tolist()
+            self._positions = dict(zip(keys, range(len(keys))))
+        return self._positions
+
+    def subset(self, rows):
+        """The index of the keys at rows (a subset of unique keys is unique)."""
+        return _KeyIndex(self.keys[rows])
+
+    def __len__(self):
+        return len(self.keys)
+
+
+class VectorDict(Mapping):
+    """A read-only mapping whose values live in one NumPy array."""
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, keys, values, dtype=None):
+        _require_numpy()
+        index = keys if isinstance(keys, _KeyIndex) else _KeyIndex.from_keys(keys)
+        values = np.asarray(values, dtype=dtype)
+        if values.shape != (len(index),):
+            raise ValueError(f"expected {len(index)} values in a 1-d array, got shape {values.shape}")
+        # A read-only view: the Mapping cannot be changed through the arrays
+        # it hands out, and the caller's array keeps its own flags.
+        values = values.view()
+        values.setflags(write=False)
+        self._index = index
+        self._values = values
+
+    @classmethod
+    def from_dict(cls, mapping, dtype=None):
+        """Build a VectorDict from any mapping of keys to numbers (or strings)."""
+        _require_numpy()
+        return cls(list(mapping), np.fromiter(mapping.values(), dtype=dtype or _infer_dtype(mapping),
+                                              count=len(mapping)))
+
+    @classmethod
+    def from_keys(cls, keys, dtype=None):
+        """Keys that are their own values, e.g. from_keys(range(1, 6)) ** 2 for the guide's squares."""
+        _require_numpy()
+        keys = list(keys)
+        return cls(keys, np.array(keys, dtype=dtype))
+
+    @classmethod
+    def from_records(cls, records, fields, dtypes=None):
+        """Columns of a {key: {field: value}} mapping as VectorDicts sharing one index.
+
+        Returns {field: VectorDict}, e.g. the inventory's "price" and "stock".
+        """
+        _require_numpy()
+        dtypes = dtypes or {}
+        index = _KeyIndex.from_keys(records)
+        details = list(records.values())
+        columns = {}
+        for field in fields:
+            column = [record[field] for record in details]
+            columns[field] = cls(index, np.array(column, dtype=dtypes.get(field)))
+        return columns
+
+    # -------------------------------------------------------------------------
+    # Mapping interface
+    # -------------------------------------------------------------------------
+
+    def __getitem__(self, key):
+        return self._values.item(self._index.positions[key])
+
+    def get(self, key, default=None):
+        position = self._index.positions.get(key)
+        return default if position is None else self._values.item(position)
+
+    def __contains__(self, key):
+        return key in self._index.positions
+
+    def __iter__(self):
+        return iter(self._index.keys.tolist())
+
+    def __len__(self):
+        return len(self._index)
+
+    def to_dict(self):
+        """Convert to a plain dict of Python objects in one batch."""
+        return dict(zip(self._index.keys.tolist(), self._values.tolist()))
+
+    def __eq__(self, other):
+        if isinstance(other, VectorDict):
+            other = other.to_dict()
+        elif not isinstance(other, Mapping):
+            return NotImplemented
+        return self.to_dict() == dict(other.items())
+
+    __hash__ = None
+
+    @property
+    def values_array(self):
+        """The values as a read-only NumPy array, in key order (not a copy)."""
+        return self._values
+
+    @property
+    def key_array(self):
+        """The keys as a NumPy object array, in order."""
+        return self._index.keys
+
+    @property
+    def dtype(self):
+        return self._values.dtype
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or self._values.dtype == dtype:
+            return self._values.copy() if copy else self._values
+        if copy is False:
+            raise ValueError(f"converting {self._values.dtype} values to {np.dtype(dtype)} needs a copy")
+        return self._values.astype(dtype)
+
+    # -------------------------------------------------------------------------
+    # Batch operations
+    # -------------------------------------------------------------------------
+
+    def _with_values(self, values):
+        return VectorDict(self._index, values)
+
+    def _operand(self, other):
+        """Return other as something NumPy can combine with this dict's values."""
+        if not isinstance(other, VectorDict):
+            return other
+        if other._index is self._index:
+            return other._values
+        if len(other) == len(self) and np.array_equal(other._index.keys, self._index.keys):
+            return other._values
+        positions = other._index.positions
+        rows = np.fromiter((positions[key] for key in self._index.keys.tolist()),
+                           dtype=np.intp, count=len(self))
+        return other._values[rows]
+
+    def _binary(op):
+        def method(self, other):
+            return self._with_values(op(self._values, self._operand(other)))
+        method.__name__ = f"__{op.__name__}__"
+        return method
+
+    def _reflected(op):
+        def method(self, other):
+            return self._with_values(op(self._operand(other), self._values))
+        method.__name__ = f"__r{op.__name__}__"
+        return method
+
+    __add__ = _binary(operator.add)
+    __sub__ = _binary(operator.sub)
+    __mul__ = _binary(operator.mul)
+    __truediv__ = _binary(operator.truediv)
+    __floordiv__ = _binary(operator.floordiv)
+    __mod__ = _binary(operator.mod)
+    __pow__ = _binary(operator.pow)
+    __radd__ = _reflected(operator.add)
+    __rsub__ = _reflected(operator.sub)
+    __rmul__ = _reflected(operator.mul)
+    __rtruediv__ = _reflected(operator.truediv)
+    __rfloordiv__ = _reflected(operator.floordiv)
+    __rmod__ = _reflected(operator.mod)
+    __rpow__ = _reflected(operator.pow)
+    # Element-wise; == and != keep their dict meaning.
+    __lt__ = _binary(operator.lt)
+    __le__ = _binary(operator.le)
+    __gt__ = _binary(operator.gt)
+    __ge__ = _binary(operator.ge)
+    __and__ = _binary(operator.and_)
+    __or__ = _binary(operator.or_)
+    __xor__ = _binary(operator.xor)
+    del _binary, _reflected
+
+    def eq(self, other):
+        """Element-wise ==, as a boolean VectorDict (== itself compares whole mappings)."""
+        return self._with_values(self._values == self._operand(other))
+
+    def ne(self, other):
+        """Element-wise !=, as a boolean VectorDict."""
+        return self._with_values(self._values != self._operand(other))
+
+    def __neg__(self):
+        return self._with_values(-self._values)
+
+    def __abs__(self):
+        return self._with_values(np.abs(self._values))
+
+    def __invert__(self):
+        return self._with_values(~self._values)
+
+    def map(self, func):
+        """Apply a vectorized function, such as np.sqrt or np.round, to every value."""
+        return self._with_values(np.asarray(func(self._values)))
+
+    def select(self, conditions, choices, default=0):
+        """Value per key from the first true condition, as np.select does.
+
+        conditions are boolean VectorDicts (or masks) in key order, e.g.
+        scores.select([scores >= 90, scores >= 80], ["A", "B"], default="C").
+        """
+        conditions = [np.asarray(self._operand(condition), dtype=bool) for condition in conditions]
+        choices = [self._operand(choice) for choice in choices]
+        return self._with_values(np.select(conditions, choices, default))
+
+    def filter(self, mask):
+        """The entries where mask (a boolean VectorDict or array in key order) is true."""
+        mask = np.asarray(self._operand(mask), dtype=bool)
+        if mask.shape != self._values.shape:
+            raise ValueError(f"mask must have shape {self._values.shape}, got {mask.shape}")
+        rows = np.flatnonzero(mask)
+        return VectorDict(self._index.subset(rows), self._values[rows])
+
+    def sum(self):
+        return self._values.sum().item()
+
+    def mean(self):
+        """Average of the values (None when empty)."""
+        return self._values.mean().item() if len(self) else None
+
+    def min(self):
+        """Smallest value (None when empty)."""
+        return self._values.min().item() if len(self) else None
+
+    def max(self):
+        """Largest value (None when empty)."""
+        return self._values.max().item() if len(self) else None
+
+    def count(self):
+        """Number of true (non-zero) values, e.g. of a comparison result."""
+        return int(np.count_nonzero(self._values))
+
+    def copy(self):
+        return self._with_values(self._values.copy())
+
+    def __repr__(self):
+        if len(self) > 6:
+            head = ", ".join(f"{key!r}: {value!r}" for key, value in zip(
+                self._index.keys[:3].tolist(), self._values[:3].tolist()))
+            return f"VectorDict({{{head}, ...}}, {len(self):,} keys, dtype={self.dtype})"
+        return f"VectorDict({self.to_dict()!r}, dtype={self.dtype})"
+
+
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _infer_dtype(mapping):
+    """float64 if any value is a float, int64 for ints, bool for flags, object otherwise.
+
+    Ints outside the int64 range keep their exact value in an object array.
+    """
+    kinds = {type(value) for value in mapping.values()}
+    if kinds <= {bool}:
+        return bool
+    if kinds <= {int, bool}:
+        values = mapping.values()
+        if min(values) < _INT64_MIN or max(values) > _INT64_MAX:
+            return object
+        return np.int64
+    if kinds <= {int, float, bool}:
+        return np.float64
+    return object
+
+
+# =============================================================================
+# DEMONSTRATION AND BENCHMARKS
+# =============================================================================
+
+def make_price_table(count):
+    """The guide's prices and inventory at scale: {item: price} and {item: {"price", "stock"}}."""
+    prices = {f"item_{i}": 5 + (i * 7919 % 100_000) / 100 for i in range(count)}
+    inventory = {item: {"price": price, "stock": i % 7} for i, (item, price) in enumerate(prices.items())}
+    return prices, inventory
+
+
+def make_grades(count):
+    return {f"student_{i}": 50 + i * 37 % 51 for i in range(count)}
+
+
+def benchmark(count=1_000_000, repeat=3):
+    """Time the guide's comprehensions against VectorDict batch operations."""
+    _require_numpy()
+    prices, inventory = make_price_table(count)
+    grades = make_grades(count)
+
+    vector_prices = VectorDict.from_dict(prices)
+    vector_grades = VectorDict.from_dict(grades)
+    columns = VectorDict.from_records(inventory, ["price", "stock"])
+    vector_keys = VectorDict.from_keys(range(1, count + 1))
+
+    def letters():
+        return vector_grades.select([vector_grades >= 90, vector_grades >= 80], ["A", "B"], default="C")
+
+    def in_stock():
+        return columns["price"].filter(columns["stock"] > 0)
+
+    cases = [
+        ("x**2 for x in range", lambda: {x: x**2 for x in range(1, count + 1)}, lambda: vector_keys ** 2),
+        ("price * 0.9", lambda: {item: price * 0.9 for item, price in prices.items()},
+         lambda: vector_prices * 0.9),
+        ("A/B/C grade letters", lambda: {
+            name: ("A" if grade >= 90 else "B" if grade >= 80 else "C") for name, grade in grades.items()
+        }, letters),
+        ("in_stock filter", lambda: {
+            item: details["price"] for item, details in inventory.items() if details["stock"] > 0
+        }, in_stock),
+    ]
+    rows = []
+    for label, comprehension, vectorized in cases:
+        assert vectorized().to_dict() == comprehension(), label
+        loop = best_time(comprehension, repeat)
+        batch = best_time(vectorized, repeat)
+        with_dict = best_time(lambda: vectorized().to_dict(), repeat)
+        rows.append([label, format_seconds(loop), format_seconds(batch), f"{loop / batch:.0f}x",
+                     format_seconds(with_dict)])
+    print(f"{count:,} keys, NumPy {np.__version__}")
+    print_table(["transform", "dict comprehension", "VectorDict", "speedup", "VectorDict + to_dict()"], rows)
+    build = best_time(lambda: VectorDict.from_dict(prices), repeat)
+    print(f"Building a VectorDict from the {count:,}-key dict once: {format_seconds(build)}. "
+          "Keep results as VectorDicts between steps; to_dict() costs as much as a comprehension.")
+
+
+def demo():
+    """The guide's comprehension examples, as batch operations."""
+    if np is None:
+        print("VectorDict needs NumPy; install it with: pip install numpy")
+        return
+    squares = VectorDict.from_keys(range(1, 6)) ** 2
+    print("Squares:", squares.to_dict())
+
+    numbers = VectorDict.from_keys(range(1, 11))
+    print("Even squares:", (numbers ** 2).filter((numbers % 2).eq(0)).to_dict())
+
+    prices = VectorDict.from_dict({"laptop": 1000, "mouse": 30, "keyboard": 80})
+    discounted = prices * 0.9
+    print("Discounted prices:", discounted.to_dict())
+    print("Still a mapping:", discounted["mouse"], "mouse" in discounted, list(discounted))
+
+    grades = VectorDict.from_dict({"Alice": 95, "Bob": 87, "Charlie": 76})
+    grade_letters = grades.select([grades >= 90, grades >= 80], ["A", "B"], default="C")
+    print("Grade letters:", grade_letters.to_dict())
+
+    inventory = {
+        "laptop": {"price": 999, "stock": 5},
+        "mouse": {"price": 25, "stock": 0},
+        "keyboard": {"price": 75, "stock": 10},
+    }
+    columns = VectorDict.from_records(inventory, ["price", "stock"])
+    in_stock = columns["price"].filter(columns["stock"] > 0)
+    print("Items in stock:", in_stock.to_dict())
+    print("Stock value:", (columns["price"] * columns["stock"]).sum())
+    print("Equal to the comprehension:", in_stock == {
+        item: details["price"] for item, details in inventory.items() if details["stock"] > 0
+    })
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        benchmark()
+    else:
+        demo()